@@ -187,6 +187,7 @@ from scripts.game_structure.windows import SaveCheck
 from scripts.game_structure.screen_settings import screen_scale, MANAGER, screen
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.discord_rpc import _DiscordRPC
+from scripts.cat.cats import Cat
 from scripts.cat.sprites import sprites
 from scripts.clan import clan_class
 from scripts.utility import (
@@ -241,6 +242,8 @@ def load_data():
         game.switches["clan_list"] = clan_list
         try:
             load_cats()
+            # decode the spritesheets of the species in the Clan while the rest is loading
+            sprites.preload_species({cat.species for cat in Cat.all_cats.values()})
             version_info = clan_class.load_clan()
             version_convert(version_info)
             game.load_events()
@@ -0,0 +1,11 @@
+"""
+Benchmarks for the parts of the game that get slower as a Clan grows.
+
+Run from the repository root:
+    python -m scripts.benchmark --sizes 50 200 1000 5000 --baseline old_results.json
+
+For each size a Clan is generated with create_new_cat (see clan_generator.py), then each hot path in
+hot_paths.py is run a few times to warm up and timed over several repetitions. Every size runs in a
+process of its own, so the Clans don't share any state. The results are written as JSON, and can be
+compared against an earlier results file to spot regressions.
+"""
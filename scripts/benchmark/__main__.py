@@ -0,0 +1,181 @@
+"""
+Runs the benchmarks. See scripts/benchmark/__init__.py.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List, Optional
+
+from scripts.benchmark.results import (
+    compare_results,
+    load_results,
+    measure,
+    new_results,
+    save_results,
+)
+from scripts.game_structure import rng
+
+DEFAULT_SIZES = [50, 200, 1000, 5000]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.benchmark",
+        description="Time the hot paths of the game on generated Clans.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="how many cats the Clans have, living and dead (default 50 200 1000 5000)",
+    )
+    parser.add_argument(
+        "--only", nargs="+", help="only run these hot paths, by name"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="untimed runs of each hot path (default 1)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed runs of each hot path (default 5)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=1, help="seed for the Clans and moons (default 1)"
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark_results.json",
+        help="where to write the results (default benchmark_results.json)",
+    )
+    parser.add_argument(
+        "--baseline", help="results file to compare against. Exits with 1 if anything is slower"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="how much slower than the baseline is a regression, as a fraction (default 0.1)",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="keep the saves of the generated Clans, rather than deleting them afterwards",
+    )
+    # used by the process that runs a single size
+    parser.add_argument("--single-size", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+@contextlib.contextmanager
+def quiet():
+    """The game prints and logs a lot while it runs, which isn't wanted here. Exceptions still get through."""
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+        io.StringIO()
+    ):
+        yield
+
+
+def run_size(args: argparse.Namespace, size: int) -> dict:
+    """Generates a Clan and times the hot paths on it. Runs in its own process, as the Clan is global."""
+    from scripts.benchmark import clan_generator
+    from scripts.benchmark.hot_paths import HOT_PATHS
+    from scripts.cat.sprites import sprites
+    from scripts.game_structure.game_essentials import game
+
+    rng.seed(args.seed)
+    sprites.load_all()
+    name = clan_generator.get_unused_clan_name("Benchmark")
+
+    timings = {}
+    try:
+        with quiet():
+            clan_generator.generate_large_clan(name, size)
+        game.clan.seed = args.seed
+
+        for hot_path, setup in HOT_PATHS.items():
+            if args.only and hot_path not in args.only:
+                continue
+            with quiet():
+                timings[hot_path] = measure(setup(), args.warmup, args.repeat)
+    finally:
+        if not args.keep:
+            clan_generator.delete_clan_save(name)
+    return timings
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    from scripts.housekeeping.version import get_version_info
+
+    results = new_results(
+        commit=get_version_info().version_number,
+        seed=args.seed,
+        warmup=args.warmup,
+        repeat=args.repeat,
+    )
+
+    if args.single_size:
+        size = args.sizes[0]
+        results["results"][str(size)] = run_size(args, size)
+        save_results(args.output, results)
+        return
+
+    for size in args.sizes:
+        print(f"{size} cats:", flush=True)
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            command = [
+                sys.executable,
+                "-m",
+                "scripts.benchmark",
+                "--single-size",
+                "--sizes",
+                str(size),
+                "--warmup",
+                str(args.warmup),
+                "--repeat",
+                str(args.repeat),
+                "--seed",
+                str(args.seed),
+                "--output",
+                output,
+            ]
+            if args.only:
+                command += ["--only", *args.only]
+            if args.keep:
+                command.append("--keep")
+            if subprocess.run(command).returncode != 0:
+                sys.exit(f"The benchmarks for {size} cats failed")
+            timings = load_results(output)["results"][str(size)]
+
+        results["results"][str(size)] = timings
+        for hot_path, timing in timings.items():
+            print(
+                f"  {hot_path}: median {timing['median'] * 1000:.2f} ms, "
+                f"min {timing['min'] * 1000:.2f} ms"
+            )
+
+    save_results(args.output, results)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        lines, regressed = compare_results(
+            results, load_results(args.baseline), args.tolerance
+        )
+        print(f"Compared with {args.baseline}:")
+        for line in lines:
+            print(f"  {line}")
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    # the Clans and moons are always seeded, and sets of strings are iterated in a different order on
+    # every run otherwise, which a seed can't fix
+    rng.rerun_with_hash_seed("scripts.benchmark", sys.argv[1:])
+    main()
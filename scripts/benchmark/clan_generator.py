@@ -0,0 +1,143 @@
+"""
+Generates large Clans which look like ones that have been played for a long time.
+
+Most of a long-running Clan is dead: a few living generations, with many generations of StarClan and
+Dark Forest cats behind them. The cats are made oldest generation first, with create_new_cat, and each
+cat's parents are a pair of mates from the generation before, so there are real family trees to walk.
+Some of the living cats are ill, injured or have permanent conditions, and a few live outside the Clan.
+"""
+
+import os
+import random
+import shutil
+from typing import List
+
+from scripts.cat.cats import Cat, ILLNESSES, INJURIES, PERMANENT
+from scripts.game_structure.game_essentials import game
+from scripts.housekeeping.datadir import get_save_dir
+from scripts.simulate import generate_clan
+from scripts.utility import create_new_cat
+
+# how much of the living Clan has a condition, or lives outside it
+CONDITION_CHANCE = 0.15
+OUTSIDE_CHANCE = 0.05
+# how much of the dead went to the Dark Forest
+DARK_FOREST_CHANCE = 0.15
+# how many moons apart the generations are
+GENERATION_MOONS = 24
+
+
+def get_living_count(size: int) -> int:
+    """How many of a Clan's cats are alive, for a Clan of the given size."""
+    return min(size, 40 + size // 12)
+
+
+def generate_large_clan(
+    name: str,
+    size: int,
+    biome: str = "Forest",
+    game_mode: str = "expanded",
+    living: int = None,
+):
+    """
+    Makes a new Clan, and fills it with cats until it has size cats in total.
+    :param name: Name of the Clan, without "Clan"
+    :param size: How many cats the Clan has, living and dead
+    :param biome: The Clan's biome
+    :param game_mode: The Clan's game mode
+    :param living: How many of the cats are alive. Defaults to get_living_count(size)
+    """
+    if living is None:
+        living = get_living_count(size)
+
+    # the leader, deputy and medicine cat, and the dead instructor
+    generate_clan(name, 3, biome, game_mode)
+    to_make = max(0, size - len(Cat.all_cats))
+    dead_to_make = max(0, to_make - max(0, living - 3))
+
+    generation_size = max(8, living // 3)
+    generation_count = max(1, -(-to_make // generation_size))
+    generation: List[Cat] = []
+    made = 0
+    for generation_number in range(generation_count):
+        parents = _pair_mates(generation)
+        # moons before now that this generation was born, the youngest being kits now
+        born = (generation_count - 1 - generation_number) * GENERATION_MOONS
+        new_generation = []
+        for _ in range(min(generation_size, to_make - made)):
+            alive = made >= dead_to_make
+            parent1, parent2 = random.choice(parents) if parents else (None, None)
+            new_generation.append(
+                _make_cat(
+                    born + random.randint(0, GENERATION_MOONS - 1),
+                    alive,
+                    parent1,
+                    parent2,
+                )
+            )
+            made += 1
+        generation = new_generation
+
+    Cat.sort_cats()
+
+
+def get_unused_clan_name(name: str) -> str:
+    """Returns name, with a number on the end if a Clan with that name is already saved."""
+    clan_list = game.read_clans() or []
+    unused_name = name
+    number = 1
+    while unused_name in clan_list:
+        number += 1
+        unused_name = f"{name}{number}"
+    return unused_name
+
+
+def delete_clan_save(name: str):
+    """Deletes the save of a generated Clan."""
+    shutil.rmtree(f"{get_save_dir()}/{name}", ignore_errors=True)
+    for leftover in (f"{get_save_dir()}/{name}clan.json", f"{get_save_dir()}/{name}clan.txt"):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    # it's only the current Clan if there were no other Clans
+    if (game.read_clans() or [None])[0] == name:
+        game.save_clanlist()
+
+
+def _pair_mates(cats: List[Cat]) -> list:
+    """Pairs up the cats of a generation as mates. Returns the pairs, as possible parents of the next one."""
+    cats = cats.copy()
+    random.shuffle(cats)
+    pairs = []
+    for cat, other_cat in zip(cats[::2], cats[1::2]):
+        cat.set_mate(other_cat)
+        pairs.append((cat.ID, other_cat.ID))
+    return pairs
+
+
+def _make_cat(moons: int, alive: bool, parent1: str, parent2: str) -> Cat:
+    new_cat = create_new_cat(
+        Cat,
+        age=moons,
+        alive=alive,
+        outside=alive and random.random() < OUTSIDE_CHANCE,
+        parent1=parent1,
+        parent2=parent2,
+    )[0]
+
+    if not alive:
+        new_cat.dead_for = random.randint(1, 200)
+        if random.random() < DARK_FOREST_CHANCE:
+            new_cat.df = True
+            game.clan.add_to_darkforest(new_cat)
+    elif random.random() < CONDITION_CHANCE:
+        condition = random.choice(["illness", "injury", "permanent"])
+        if condition == "illness":
+            new_cat.get_ill(
+                random.choice([name for name in ILLNESSES if name != "comment"])
+            )
+        elif condition == "injury":
+            new_cat.get_injured(random.choice(list(INJURIES)))
+        else:
+            new_cat.get_permanent_condition(random.choice(list(PERMANENT)))
+
+    return new_cat
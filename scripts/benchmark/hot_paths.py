@@ -0,0 +1,97 @@
+"""
+The hot paths the benchmarks time, each as a function that sets up and returns the call to time.
+
+They are run in the order they are listed, because some change the Clan: the moon skips age it, and
+loading the cats back replaces every Cat object with a new one.
+"""
+
+import random
+from typing import Callable, Dict
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprites import sprites
+from scripts.cat_relations.inheritance import Inheritance
+from scripts.events import events_class
+from scripts.events_module.patrol.patrol import Patrol
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure.load_cat import json_load
+from scripts.utility import generate_sprite
+
+# how many cats are drawn, and how many patrols are filtered, per repetition
+SPRITE_SAMPLE = 200
+PATROL_SAMPLE = 20
+
+
+def inheritance() -> Callable:
+    """Builds the family of every cat in the Clan."""
+    cats = list(Cat.all_cats.values())
+    return lambda: [Inheritance(cat) for cat in cats]
+
+
+def sprite_generation() -> Callable:
+    """Composites sprites without the sprite cache, for a sample of the Clan's cats."""
+    cats = random.sample(
+        list(Cat.all_cats.values()), min(SPRITE_SAMPLE, len(Cat.all_cats))
+    )
+    sprites.load_species({cat.species for cat in cats})
+    return lambda: [generate_sprite(cat) for cat in cats]
+
+
+def patrol_filtering() -> Callable:
+    """Finds the possible patrols for patrols of random cats and types."""
+    able_cats = [
+        cat
+        for cat in Cat.all_cats.values()
+        if not cat.dead
+        and not cat.outside
+        and cat.status not in ("newborn", "kitten", "elder")
+    ]
+    patrols = []
+    for _ in range(PATROL_SAMPLE):
+        patrol = Patrol()
+        patrol.add_patrol_cats(
+            random.sample(able_cats, min(len(able_cats), random.randint(1, 6))),
+            game.clan,
+        )
+        patrols.append(
+            (patrol, random.choice(["hunting", "border", "training", "general"]))
+        )
+
+    def filter_patrols():
+        for patrol, patrol_type in patrols:
+            patrol.get_possible_patrols(
+                str(game.clan.current_season).casefold(),
+                str(game.clan.biome).casefold(),
+                str(game.clan.camp_bg).casefold(),
+                patrol_type,
+                game.clan.clan_settings["disasters"],
+            )
+
+    return filter_patrols
+
+
+def save_cats() -> Callable:
+    """Saves every cat."""
+    return game.save_cats
+
+
+def one_moon() -> Callable:
+    """Skips a moon. Every repetition is the next moon."""
+    game.clan.clan_settings["autosave"] = False
+    return events_class.one_moon
+
+
+def cat_loading() -> Callable:
+    """Loads the cats saved by save_cats back in."""
+    game.save_cats()
+    return json_load
+
+
+HOT_PATHS: Dict[str, Callable[[], Callable]] = {
+    "inheritance": inheritance,
+    "generate_sprite": sprite_generation,
+    "patrol_filtering": patrol_filtering,
+    "save_cats": save_cats,
+    "one_moon": one_moon,
+    "json_load": cat_loading,
+}
@@ -0,0 +1,99 @@
+"""
+Timing and the results files of the benchmarks. Doesn't need pygame or a Clan.
+"""
+
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+import ujson
+
+# bump this if the layout of the results files changes
+RESULTS_VERSION = 1
+
+
+def measure(func: Callable, warmup: int = 1, repeat: int = 5) -> Dict[str, float]:
+    """
+    Times a function.
+    :param func: The function, which is called with no arguments
+    :param warmup: How many times to call it before timing, to fill caches and load files
+    :param repeat: How many timed calls to make
+    :return: The fastest, median, mean and slowest time in seconds, and the number of timed calls
+    """
+    for _ in range(warmup):
+        func()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "max": max(times),
+        "repeat": repeat,
+    }
+
+
+def new_results(**info) -> dict:
+    """Returns an empty results dict, with the info about the run that's useful when comparing."""
+    return {
+        "version": RESULTS_VERSION,
+        "info": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **info,
+        },
+        "results": {},
+    }
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as read_file:
+        results = ujson.loads(read_file.read())
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} results file")
+    return results
+
+
+def save_results(path: str, results: dict):
+    with open(path, "w", encoding="utf-8") as write_file:
+        write_file.write(ujson.dumps(results, indent=4))
+
+
+def compare_results(
+    results: dict, baseline: dict, tolerance: float = 0.1
+) -> Tuple[List[str], bool]:
+    """
+    Compares the median times of two results files, for every benchmark and size they both have.
+    :param results: The new results
+    :param baseline: The results to compare against
+    :param tolerance: How much slower than the baseline counts as a regression, as a fraction
+    :return: A line describing each comparison, and whether anything regressed
+    """
+    lines = []
+    regressed = False
+    for size, benchmarks in results["results"].items():
+        old_benchmarks = baseline["results"].get(size, {})
+        for name, timing in benchmarks.items():
+            old_timing = old_benchmarks.get(name)
+            if old_timing is None:
+                lines.append(f"{size} cats, {name}: not in the baseline")
+                continue
+            ratio = timing["median"] / old_timing["median"]
+            if ratio > 1 + tolerance:
+                verdict = "SLOWER"
+                regressed = True
+            elif ratio < 1 - tolerance:
+                verdict = "faster"
+            else:
+                verdict = "same"
+            lines.append(
+                f"{size} cats, {name}: {old_timing['median'] * 1000:.2f} ms -> "
+                f"{timing['median'] * 1000:.2f} ms ({ratio:.2f}x, {verdict})"
+            )
+    return lines, regressed
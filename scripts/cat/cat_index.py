@@ -0,0 +1,133 @@
+"""
+Keeps track of which cats are alive in the Clan, outside of it or dead.
+
+Looking this up by filtering Cat.all_cats is O(N), and a lot of moon events do so once per cat.
+The index is updated whenever a cat's dead, outside, exiled, status or age attribute changes,
+so these lookups only touch the cats that are actually wanted.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+LIVING = "living"
+OUTSIDE = "outside"
+DEAD = "dead"
+
+
+class CatIndex:
+    """Groups the cats in Cat.all_cats by life state, then by status and age."""
+
+    groups = (LIVING, OUTSIDE, DEAD)
+
+    def __init__(self):
+        # Dicts rather than sets, so iteration order doesn't depend on hash seeds
+        self._cats: Dict[str, Dict[str, Cat]] = {group: {} for group in self.groups}
+        self._by_status: Dict[str, Dict[str, Dict[str, Cat]]] = {
+            group: {} for group in self.groups
+        }
+        self._by_age: Dict[str, Dict[str, Dict[str, Cat]]] = {
+            group: {} for group in self.groups
+        }
+        self._keys: Dict[str, Tuple[str, str, str]] = {}
+        self._members: Dict[str, Cat] = {}
+
+    @staticmethod
+    def get_group(cat: Cat) -> str:
+        """Returns which group the cat belongs in"""
+        if cat.dead:
+            return DEAD
+        if cat.outside or cat.exiled:
+            return OUTSIDE
+        return LIVING
+
+    def add(self, cat: Cat):
+        """Starts tracking a cat, or refreshes its entry if it is already tracked."""
+        self._members[cat.ID] = cat
+        self._place(cat)
+
+    def update(self, cat: Cat):
+        """Moves a tracked cat into the right buckets. Untracked cats (and copies of tracked cats) are ignored."""
+        if self._members.get(getattr(cat, "ID", None)) is not cat:
+            return
+        self._place(cat)
+
+    def remove(self, cat: Cat):
+        """Stops tracking a cat"""
+        if self._members.get(cat.ID) is not cat:
+            return
+        self._members.pop(cat.ID)
+        self._discard(cat.ID)
+
+    def clear(self):
+        self.__init__()
+
+    def _place(self, cat: Cat):
+        key = (self.get_group(cat), str(cat.status), str(cat.age))
+        old_key = self._keys.get(cat.ID)
+        if key == old_key and self._cats[key[0]].get(cat.ID) is cat:
+            return
+        if old_key:
+            self._discard(cat.ID)
+
+        group, status, age = key
+        self._keys[cat.ID] = key
+        self._cats[group][cat.ID] = cat
+        self._by_status[group].setdefault(status, {})[cat.ID] = cat
+        self._by_age[group].setdefault(age, {})[cat.ID] = cat
+
+    def _discard(self, cat_id: str):
+        key = self._keys.pop(cat_id, None)
+        if not key:
+            return
+        group, status, age = key
+        self._cats[group].pop(cat_id, None)
+        self._by_status[group].get(status, {}).pop(cat_id, None)
+        self._by_age[group].get(age, {}).pop(cat_id, None)
+
+    # ---------------------------------------------------------------------------- #
+    #                                    lookups                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def get_cats(
+        self,
+        group: str = LIVING,
+        status: Optional[List[str]] = None,
+        age: Optional[List[str]] = None,
+        exclude: Optional[Cat] = None,
+    ) -> List[Cat]:
+        """
+        Returns the cats of a group, optionally limited to some statuses or ages.
+        :param group: LIVING (alive in the Clan), OUTSIDE or DEAD
+        :param status: List of statuses the cats must have
+        :param age: List of ages the cats must have
+        :param exclude: Cat to leave out of the list, usually the cat the list is for
+        """
+        if status is not None:
+            buckets = self._by_status[group]
+            cats = [c for s in status for c in buckets.get(str(s), {}).values()]
+            if age is not None:
+                age = {str(a) for a in age}
+                cats = [c for c in cats if str(c.age) in age]
+        elif age is not None:
+            buckets = self._by_age[group]
+            cats = [c for a in age for c in buckets.get(str(a), {}).values()]
+        else:
+            cats = list(self._cats[group].values())
+
+        if exclude is not None:
+            cats = [c for c in cats if c.ID != exclude.ID]
+        return cats
+
+    def count(self, group: str = LIVING, status: Optional[List[str]] = None) -> int:
+        """Returns how many cats are in a group, optionally only counting some statuses."""
+        if status is None:
+            return len(self._cats[group])
+        buckets = self._by_status[group]
+        return sum(len(buckets.get(str(s), {})) for s in status)
+
+    def __contains__(self, cat: Cat) -> bool:
+        return self._members.get(cat.ID) is cat
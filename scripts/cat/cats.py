@@ -14,6 +14,7 @@ from typing import Dict, List, Any, Union, Callable
 import i18n
 import ujson  # type: ignore
 
+from scripts.cat.cat_index import CatIndex
 from scripts.cat.enums import CatAgeEnum
 from scripts.cat.history import History
 from scripts.cat.names import Name
@@ -21,6 +22,7 @@ from scripts.cat.pelts import Pelt
 from scripts.cat.personality import Personality
 from scripts.cat.skills import CatSkills
 from scripts.cat.thoughts import Thoughts
+from scripts.cat_relations.family_graph import family_graph
 from scripts.cat_relations.inheritance import Inheritance
 from scripts.cat_relations.relationship import Relationship
 from scripts.conditions import (
@@ -34,6 +36,8 @@ from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
 from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.save_database import get_save_database
+from scripts.game_structure.save_file import load_save_file
 from scripts.game_structure.screen_settings import screen
 from scripts.housekeeping.datadir import get_save_dir
 from scripts.utility import (
@@ -102,6 +106,9 @@ class Cat:
     all_cats_list: List[Cat] = []
     ordered_cat_list: List[Cat] = []
 
+    # living, outside and dead cats, bucketed by status and age
+    index = CatIndex()
+
     grief_strings = {}
 
     def __init__(
@@ -181,6 +188,8 @@ class Cat:
         self.apprentice = []
         self.former_apprentices = []
         self.relationships = {}
+        # number of relationships in the save file, None if they were never saved or loaded
+        self._saved_relationship_count = None
         self.mate = []
         self.previous_mates = []
         self._pronouns: Dict[str, List[Dict[str, Union[str, int]]]] = {}
@@ -191,7 +200,7 @@ class Cat:
         self.outside = False
         self.driven_out = False
         self.dead_for = 0  # moons
-        self.thought = ""
+        self._thought = ""
         self.genderalign = None
         self.birth_cooldown = 0
         self.illnesses = {}
@@ -346,6 +355,8 @@ class Cat:
 
         # SAVE CAT INTO ALL_CATS DICTIONARY IN CATS-CLASS
         self.all_cats[self.ID] = self
+        Cat.index.add(self)
+        family_graph.update(self)
 
         if self.ID not in ["0", None]:
             Cat.insert_cat(self)
@@ -1104,7 +1115,15 @@ class Cat:
         history_directory = f"{get_save_dir()}/{clanname}/history/"
         cat_history_directory = history_directory + self.ID + "_history.json"
 
-        if not os.path.exists(cat_history_directory):
+        # the history was dropped when it was saved, and a background save may not have written it yet
+        game.save_queue.wait()
+
+        database = get_save_database(clanname)
+        if (
+            self.ID not in database.keys("history")
+            if database is not None
+            else not os.path.exists(cat_history_directory)
+        ):
             self.history = History(
                 beginning={},
                 mentor_influence={},
@@ -1117,42 +1136,45 @@ class Cat:
             )
             return
         try:
-            with open(cat_history_directory, "r", encoding="utf-8") as read_file:
-                history_data = ujson.loads(read_file.read())
-                self.history = History(
-                    beginning=(
-                        history_data["beginning"] if "beginning" in history_data else {}
-                    ),
-                    mentor_influence=(
-                        history_data["mentor_influence"]
-                        if "mentor_influence" in history_data
-                        else {}
-                    ),
-                    app_ceremony=(
-                        history_data["app_ceremony"]
-                        if "app_ceremony" in history_data
-                        else {}
-                    ),
-                    lead_ceremony=(
-                        history_data["lead_ceremony"]
-                        if "lead_ceremony" in history_data
-                        else None
-                    ),
-                    possible_history=(
-                        history_data["possible_history"]
-                        if "possible_history" in history_data
-                        else {}
-                    ),
-                    died_by=(
-                        history_data["died_by"] if "died_by" in history_data else []
-                    ),
-                    scar_events=(
-                        history_data["scar_events"]
-                        if "scar_events" in history_data
-                        else []
-                    ),
-                    murder=history_data["murder"] if "murder" in history_data else {},
-                )
+            if database is not None:
+                history_data = database.read("history", self.ID)
+            else:
+                history_data = load_save_file(cat_history_directory)
+                game.mark_saved(cat_history_directory, history_data)
+            self.history = History(
+                beginning=(
+                    history_data["beginning"] if "beginning" in history_data else {}
+                ),
+                mentor_influence=(
+                    history_data["mentor_influence"]
+                    if "mentor_influence" in history_data
+                    else {}
+                ),
+                app_ceremony=(
+                    history_data["app_ceremony"]
+                    if "app_ceremony" in history_data
+                    else {}
+                ),
+                lead_ceremony=(
+                    history_data["lead_ceremony"]
+                    if "lead_ceremony" in history_data
+                    else None
+                ),
+                possible_history=(
+                    history_data["possible_history"]
+                    if "possible_history" in history_data
+                    else {}
+                ),
+                died_by=(
+                    history_data["died_by"] if "died_by" in history_data else []
+                ),
+                scar_events=(
+                    history_data["scar_events"]
+                    if "scar_events" in history_data
+                    else []
+                ),
+                murder=history_data["murder"] if "murder" in history_data else {},
+            )
         except Exception:
             self.history = None
             print(
@@ -1172,7 +1194,7 @@ class Cat:
 
         history_dict = History.make_dict(self)
         try:
-            game.safe_save(f"{history_dir}/{self.ID}_history.json", history_dict)
+            game.save_if_changed(f"{history_dir}/{self.ID}_history.json", history_dict)
         except:
             self.history = History(
                 beginning={},
@@ -1582,10 +1604,23 @@ class Cat:
         ]:
             self.update_mentor()
 
+    @property
+    def thought(self) -> str:
+        if self._thought is None:
+            # Thoughts aren't generated when loading, only once they are first needed
+            self.thoughts()
+        return self._thought
+
+    @thought.setter
+    def thought(self, value: str):
+        self._thought = value
+
     def thoughts(self):
         """Generates a thought for the cat, which displays on their profile."""
         all_cats = self.all_cats
-        other_cat = choice(list(all_cats.keys()))
+        # build the ID list once, rather than for every re-roll below
+        all_cat_ids = list(all_cats.keys())
+        other_cat = choice(all_cat_ids)
         game_mode = game.switches["game_mode"]
         biome = game.switches["biome"]
         camp = game.switches["camp_bg"]
@@ -1619,7 +1654,7 @@ class Cat:
                 or (all_cats.get(other_cat).dead and dead_chance != 1)
                 or (other_cat not in self.relationships)
             ):
-                other_cat = choice(list(all_cats.keys()))
+                other_cat = choice(all_cat_ids)
                 i += 1
                 if i > 100:
                     other_cat = None
@@ -1627,7 +1662,7 @@ class Cat:
         # for dead cats
         elif where_kitty in ["starclan", "hell", "UR"]:
             while other_cat == self.ID and len(all_cats) > 1:
-                other_cat = choice(list(all_cats.keys()))
+                other_cat = choice(all_cat_ids)
                 i += 1
                 if i > 100:
                     other_cat = None
@@ -1641,7 +1676,7 @@ class Cat:
                 or (other_cat not in self.relationships)
             ):
                 # or (self.status in ['kittypet', 'loner'] and not all_cats.get(other_cat).outside):
-                other_cat = choice(list(all_cats.keys()))
+                other_cat = choice(all_cat_ids)
                 i += 1
                 if i > 100:
                     other_cat = None
@@ -1667,14 +1702,7 @@ class Cat:
 
     def relationship_interaction(self):
         """Randomly choose a cat of the Clan and have an interaction with them."""
-        cats_to_choose = [
-            iter_cat
-            for iter_cat in Cat.all_cats.values()
-            if iter_cat.ID != self.ID
-            and not iter_cat.outside
-            and not iter_cat.exiled
-            and not iter_cat.dead
-        ]
+        cats_to_choose = Cat.index.get_cats(exclude=self)
         # if there are no cats to interact, stop
         if not cats_to_choose:
             return
@@ -1857,6 +1885,8 @@ class Cat:
 
     def is_littermate(self, other_cat: Cat):
         """Check if the cats are littermates."""
+        if not self.inheritance:
+            self.inheritance = Inheritance(self)
         if other_cat.ID not in self.inheritance.siblings.keys():
             return False
         litter_mates = [
@@ -2280,14 +2310,21 @@ class Cat:
         condition_directory = get_save_dir() + "/" + clanname + "/conditions"
         condition_file_path = condition_directory + "/" + self.ID + "_conditions.json"
 
+        conditions = self.get_condition_dict()
+        if conditions is None:
+            game.remove_save_file(condition_file_path)
+            return
+
+        game.save_if_changed(condition_file_path, conditions)
+
+    def get_condition_dict(self):
+        """Returns the conditions to save for this cat, or None if there is nothing to save."""
         if (
             (not self.is_ill() and not self.is_injured() and not self.is_disabled())
             or self.dead
             or self.outside
         ):
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
-            return
+            return None
 
         conditions = {}
 
@@ -2300,7 +2337,7 @@ class Cat:
         if self.is_disabled():
             conditions["permanent conditions"] = self.permanent_condition
 
-        game.safe_save(condition_file_path, conditions)
+        return conditions
 
     def load_conditions(self):
         if game.switches["clan_name"] != "":
@@ -2310,15 +2347,22 @@ class Cat:
 
         condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
         condition_cat_directory = condition_directory + self.ID + "_conditions.json"
-        if not os.path.exists(condition_cat_directory):
+
+        database = get_save_database(clanname)
+        if database is not None:
+            rel_data = database.read("conditions", self.ID)
+            if rel_data is None:
+                return
+        elif not os.path.exists(condition_cat_directory):
             return
 
         try:
-            with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.illnesses = rel_data.get("illnesses", {})
-                self.injuries = rel_data.get("injuries", {})
-                self.permanent_condition = rel_data.get("permanent conditions", {})
+            if database is None:
+                rel_data = game.read_save_file(condition_cat_directory)
+                game.mark_saved(condition_cat_directory, rel_data)
+            self.illnesses = rel_data.get("illnesses", {})
+            self.injuries = rel_data.get("injuries", {})
+            self.permanent_condition = rel_data.get("permanent conditions", {})
 
             if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
                 self.pelt.paralyzed = True
@@ -2535,12 +2579,12 @@ class Cat:
             if not self.dead:
                 if other_cat.ID not in self.relationships:
                     self.create_one_relationship(other_cat)
-                    self.relationships[other_cat.ID].mate = True
+                    self.relationships[other_cat.ID].mates = True
                 self_relationship = self.relationships[other_cat.ID]
                 self_relationship.romantic_love -= randint(20, 60)
                 self_relationship.comfortable -= randint(10, 30)
                 self_relationship.trust -= randint(5, 15)
-                self_relationship.mate = False
+                self_relationship.mates = False
                 if fight:
                     self_relationship.romantic_love -= randint(10, 30)
                     self_relationship.platonic_like -= randint(15, 45)
@@ -2548,12 +2592,12 @@ class Cat:
             if not other_cat.dead:
                 if self.ID not in other_cat.relationships:
                     other_cat.create_one_relationship(self)
-                    other_cat.relationships[self.ID].mate = True
+                    other_cat.relationships[self.ID].mates = True
                 other_relationship = other_cat.relationships[self.ID]
                 other_relationship.romantic_love -= 40
                 other_relationship.comfortable -= 20
                 other_relationship.trust -= 10
-                other_relationship.mate = False
+                other_relationship.mates = False
                 if fight:
                     self_relationship.romantic_love -= 20
                     other_relationship.platonic_like -= 30
@@ -2567,6 +2611,8 @@ class Cat:
         if self.ID not in other_cat.previous_mates:
             other_cat.previous_mates.append(self.ID)
 
+        family_graph.update(self)
+        family_graph.update(other_cat)
         if other_cat.inheritance:
             other_cat.inheritance.update_all_mates()
         if self.inheritance:
@@ -2585,6 +2631,8 @@ class Cat:
         if self.ID in other_cat.previous_mates:
             other_cat.previous_mates.remove(self.ID)
 
+        family_graph.update(self)
+        family_graph.update(other_cat)
         if other_cat.inheritance:
             other_cat.inheritance.update_all_mates()
         if self.inheritance:
@@ -2594,22 +2642,22 @@ class Cat:
         if not self.dead:
             if other_cat.ID not in self.relationships:
                 self.create_one_relationship(other_cat)
-                self.relationships[other_cat.ID].mate = True
+                self.relationships[other_cat.ID].mates = True
             self_relationship = self.relationships[other_cat.ID]
             self_relationship.romantic_love += 20
             self_relationship.comfortable += 20
             self_relationship.trust += 10
-            self_relationship.mate = True
+            self_relationship.mates = True
 
         if not other_cat.dead:
             if self.ID not in other_cat.relationships:
                 other_cat.create_one_relationship(self)
-                other_cat.relationships[self.ID].mate = True
+                other_cat.relationships[self.ID].mates = True
             other_relationship = other_cat.relationships[self.ID]
             other_relationship.romantic_love += 20
             other_relationship.comfortable += 20
             other_relationship.trust += 10
-            other_relationship.mate = True
+            other_relationship.mates = True
 
     def unset_adoptive_parent(self, other_cat: Cat):
         """Unset the adoptive parent from self"""
@@ -2781,7 +2829,30 @@ class Cat:
 
     def save_relationship_of_cat(self, relationship_dir):
         # save relationships for each cat
+        relationship_file = f"{relationship_dir}/{self.ID}_relations.json"
+        if not self.relationships_changed() and os.path.exists(relationship_file):
+            return
+
+        game.safe_save(relationship_file, self.get_relationship_save_list())
+        self.mark_relationships_saved()
+
+    def relationships_changed(self) -> bool:
+        """True if any of this cat's relationships were added, removed or changed since they were last saved or loaded."""
+        if self._saved_relationship_count != len(self.relationships):
+            return True
+        return any(r.dirty for r in self.relationships.values())
+
+    def mark_relationships_saved(self):
+        self._saved_relationship_count = len(self.relationships)
+        for r in self.relationships.values():
+            r.mark_saved()
 
+    def mark_relationships_unsaved(self):
+        """Makes the next save write this cat's relationships, even if they haven't changed."""
+        self._saved_relationship_count = None
+
+    def get_relationship_save_list(self):
+        """Returns this cat's relationships in the form they are saved in."""
         rel = []
         for r in self.relationships.values():
             r_data = {
@@ -2796,11 +2867,11 @@ class Cat:
                 "comfortable": r.comfortable,
                 "jealousy": r.jealousy,
                 "trust": r.trust,
-                "log": r.log,
+                "log": r.log if r.has_log else [],
             }
             rel.append(r_data)
 
-        game.safe_save(f"{relationship_dir}/{self.ID}_relations.json", rel)
+        return rel
 
     def load_relationship_of_cat(self):
         if game.switches["clan_name"] != "":
@@ -2812,34 +2883,42 @@ class Cat:
         relation_cat_directory = relation_directory + self.ID + "_relations.json"
 
         self.relationships = {}
-        if os.path.exists(relation_directory):
-            if not os.path.exists(relation_cat_directory):
+        database = get_save_database(clanname)
+        if database is not None or os.path.exists(relation_directory):
+            if (
+                self.ID not in database.keys("relationships")
+                if database is not None
+                else not os.path.exists(relation_cat_directory)
+            ):
                 self.init_all_relationships()
                 for cat in Cat.all_cats.values():
                     cat.create_one_relationship(self)
                 return
             try:
-                with open(relation_cat_directory, "r", encoding="utf-8") as read_file:
-                    rel_data = ujson.loads(read_file.read())
-                    for rel in rel_data:
-                        cat_to = self.all_cats.get(rel["cat_to_id"])
-                        if cat_to is None or rel["cat_to_id"] == self.ID:
-                            continue
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel["mates"] or False,
-                            family=rel["family"] or False,
-                            romantic_love=(rel["romantic_love"] or 0),
-                            platonic_like=(rel["platonic_like"] or 0),
-                            dislike=rel["dislike"] or 0,
-                            admiration=rel["admiration"] or 0,
-                            comfortable=rel["comfortable"] or 0,
-                            jealousy=rel["jealousy"] or 0,
-                            trust=rel["trust"] or 0,
-                            log=rel["log"],
-                        )
-                        self.relationships[rel["cat_to_id"]] = new_rel
+                if database is not None:
+                    rel_data = database.read("relationships", self.ID)
+                else:
+                    rel_data = game.read_save_file(relation_cat_directory)
+                for rel in rel_data:
+                    cat_to = self.all_cats.get(rel["cat_to_id"])
+                    if cat_to is None or rel["cat_to_id"] == self.ID:
+                        continue
+                    new_rel = Relationship(
+                        cat_from=self,
+                        cat_to=cat_to,
+                        mates=rel["mates"] or False,
+                        family=rel["family"] or False,
+                        romantic_love=(rel["romantic_love"] or 0),
+                        platonic_like=(rel["platonic_like"] or 0),
+                        dislike=rel["dislike"] or 0,
+                        admiration=rel["admiration"] or 0,
+                        comfortable=rel["comfortable"] or 0,
+                        jealousy=rel["jealousy"] or 0,
+                        trust=rel["trust"] or 0,
+                        log=rel["log"],
+                    )
+                    self.relationships[rel["cat_to_id"]] = new_rel
+                self.mark_relationships_saved()
             except:
                 print(
                     f"WARNING: There was an error reading the relationship file of cat #{self}."
@@ -3200,28 +3279,22 @@ class Cat:
                 game.switches["clan_list"][0] if game.clan is None else game.clan.name
             )
 
-            with open(
-                get_save_dir() + "/" + clan + "/faded_cats/" + cat + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-                # If loading cats is attempted before the Clan is loaded, we would need to use this.
+            cat_info = load_save_file(
+                get_save_dir() + "/" + clan + "/faded_cats/" + cat + ".json"
+            )
+            # If loading cats is attempted before the Clan is loaded, we would need to use this.
 
         except (
             AttributeError
         ):  # NOPE, cats are always loaded before the Clan, so doesn't make sense to throw an error
-            with open(
+            cat_info = load_save_file(
                 get_save_dir()
                 + "/"
                 + game.switches["clan_list"][0]
                 + "/faded_cats/"
                 + cat
-                + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
+                + ".json"
+            )
         except:
             print("ERROR: in loading faded cat")
             return False
@@ -3384,6 +3457,51 @@ class Cat:
         except AttributeError:
             print(f"ERROR: cat has no age attribute! Cat ID: {self.ID}")
 
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+        Cat.index.update(self)
+
+    @property
+    def age(self):
+        return self._age
+
+    @age.setter
+    def age(self, value):
+        self._age = value
+        Cat.index.update(self)
+
+    @property
+    def dead(self):
+        return self._dead
+
+    @dead.setter
+    def dead(self, value: bool):
+        self._dead = value
+        Cat.index.update(self)
+
+    @property
+    def outside(self):
+        return self._outside
+
+    @outside.setter
+    def outside(self, value: bool):
+        self._outside = value
+        Cat.index.update(self)
+
+    @property
+    def exiled(self):
+        return self._exiled
+
+    @exiled.setter
+    def exiled(self, value: bool):
+        self._exiled = value
+        Cat.index.update(self)
+
     @property
     def sprite(self):
         # Update the sprite
@@ -1,10 +1,57 @@
 import os
+import threading
 from copy import copy
+from typing import Iterable
 
 import pygame
 import ujson
 
+from scripts.cat.spritesheet_cache import (
+    SpritesheetCache,
+    decode_spritesheets,
+    read_spritesheets,
+)
 from scripts.game_structure.game_essentials import game
+from scripts.housekeeping.datadir import get_cache_dir
+
+# the spritesheets each sprite folder has
+SPRITESHEET_NAMES = [
+    "lineart",
+    "lineartdf",
+    "lineartdead",
+    "eyes",
+    "eyes2",
+    "skin",
+    "scars",
+    "missingscars",
+    "medcatherbs",
+    "wild",
+    "collars",
+    "bellcollars",
+    "bowcollars",
+    "nyloncollars",
+    "singlecolours",
+    "speckledcolours",
+    "tabbycolours",
+    "bengalcolours",
+    "marbledcolours",
+    "rosettecolours",
+    "smokecolours",
+    "tickedcolours",
+    "mackerelcolours",
+    "classiccolours",
+    "sokokecolours",
+    "agouticolours",
+    "singlestripecolours",
+    "maskedcolours",
+    "shadersnewwhite",
+    "lightingnew",
+    "whitepatches",
+    "tortiepatchesmasks",
+    "fademask",
+    "fadestarclan",
+    "fadedarkforest",
+]
 
 
 class Sprites:
@@ -26,6 +73,13 @@ class Sprites:
         # Shared empty sprite for placeholders
         self.blank_sprite = None
 
+        # sprite folders are only loaded once a cat of their species is drawn
+        self.loaded_folders = set()
+        self._load_lock = threading.RLock()
+        # spritesheets decoded ahead of time by preload_species, waiting to be converted, by path
+        self._decoded_sheets = {}
+        self._preload_threads = []
+
         self.load_tints()
 
     def load_tints(self):
@@ -53,6 +107,31 @@ class Sprites:
         """
         self.spritesheets[name] = pygame.image.load(a_file).convert_alpha()
 
+    @staticmethod
+    def get_spritesheet_path(folder, name):
+        """Returns the PNG to load a spritesheet from, for a sprite folder"""
+        if "lineart" in name and game.config["fun"]["april_fools"]:
+            return f"sprites/{folder}/aprilfools{name}.png"
+        return f"sprites/{folder}/{name}.png"
+
+    @staticmethod
+    def get_spritesheet_cache():
+        """Returns the spritesheet cache, or None if it is turned off in the game config."""
+        if game.config["cat_sprites"]["spritesheet_cache"]:
+            return SpritesheetCache(os.path.join(get_cache_dir(), "spritesheets"))
+        return None
+
+    def load_spritesheets(self, paths, decoded=None) -> dict:
+        """
+        Loads spritesheets by path, through the spritesheet cache if it is turned on in the game config.
+        :param paths: The PNGs to load
+        :param decoded: PNGs already decoded by read_spritesheets, by path. They are only converted.
+        """
+        cache = self.get_spritesheet_cache()
+        if cache:
+            return cache.load_spritesheets(paths, decoded)
+        return decode_spritesheets(paths, decoded=decoded)
+
     def make_group(
         self, spritesheet, pos, name, sprites_x=3, sprites_y=7, no_index=False
     ):  # pos = ex. (2, 3), no single pixels
@@ -124,354 +203,393 @@ class Sprites:
 
         del width, height  # unneeded
 
-        # load sprite sheets for all folders
-        for f in game.sprite_folders:
-            for x in [
-                "lineart",
-                "lineartdf",
-                "lineartdead",
-                "eyes",
-                "eyes2",
-                "skin",
-                "scars",
-                "missingscars",
-                "medcatherbs",
-                "wild",
-                "collars",
-                "bellcollars",
-                "bowcollars",
-                "nyloncollars",
-                "singlecolours",
-                "speckledcolours",
-                "tabbycolours",
-                "bengalcolours",
-                "marbledcolours",
-                "rosettecolours",
-                "smokecolours",
-                "tickedcolours",
-                "mackerelcolours",
-                "classiccolours",
-                "sokokecolours",
-                "agouticolours",
-                "singlestripecolours",
-                "maskedcolours",
-                "shadersnewwhite",
-                "lightingnew",
-                "whitepatches",
-                "tortiepatchesmasks",
-                "fademask",
-                "fadestarclan",
-                "fadedarkforest",
-                "symbols",
-            ]:
-                if 'lineart' in x and game.config['fun']['april_fools']:
-                    self.spritesheet(f"sprites/{f}/aprilfools{x}.png", x)
-                elif 'symbols' in x:
-                    self.spritesheet(f"sprites/{x}.png", x)
-                else:
-                    self.spritesheet(f"sprites/{f}/{x}.png", x)
+        # the sprite folders themselves are loaded by load_species, or when a cat of their species is drawn
+        with self._load_lock:
+            self.loaded_folders = set()
 
-            # Line art
-            self.make_group("lineart", (0, 0), f"lines{f}_")
-            self.make_group("shadersnewwhite", (0, 0), f"shaders{f}_")
-            self.make_group("lightingnew", (0, 0), f"lighting{f}_")
+        self.spritesheets["symbols"] = self.load_spritesheets(["sprites/symbols.png"])[
+            "sprites/symbols.png"
+        ]
+        self.load_symbols()
 
-            self.make_group("lineartdead", (0, 0), f"lineartdead{f}_")
-            self.make_group("lineartdf", (0, 0), f"lineartdf{f}_")
+    def get_species_folder(self, species: str) -> str:
+        """Returns the sprite folder holding the sprites of a species"""
+        # add 1 because people don't count from 0 smh
+        return str(list(game.species["species"]).index(species) + 1)
 
-            # Fading Fog
-            for i in range(0, 3):
-                self.make_group("fademask", (i, 0), f"fademask{f}_{i}")
-                self.make_group("fadestarclan", (i, 0), f"fadestarclan{f}_{i}")
-                self.make_group("fadedarkforest", (i, 0), f"fadedf{f}_{i}")
+    @staticmethod
+    def get_species_folders(species: Iterable[str]) -> set:
+        """Returns the sprite folders of the given species. Unknown species are left out."""
+        known_species = list(game.species["species"])
+        return {str(known_species.index(x) + 1) for x in species if x in known_species}
 
-            # Define eye colors
-            eye_colors = [
-                [
-                    "YELLOW",
-                    "AMBER",
-                    "HAZEL",
-                    "PALEGREEN",
-                    "GREEN",
-                    "BLUE",
-                    "DARKBLUE",
-                    "GREY",
-                    "CYAN",
-                    "EMERALD",
-                    "HEATHERBLUE",
-                    "SUNLITICE",
-                ],
-                [
-                    "COPPER",
-                    "SAGE",
-                    "COBALT",
-                    "PALEBLUE",
-                    "BRONZE",
-                    "SILVER",
-                    "PALEYELLOW",
-                    "GOLD",
-                    "GREENYELLOW",
-                    "ORANGE"
-                ],
+    def load_species(self, species: Iterable[str]):
+        """Makes sure the sprites of the given species are loaded, loading them now if they aren't."""
+        self.load_folders(self.get_species_folders(species))
+
+    def preload_species(self, species: Iterable[str]) -> threading.Thread:
+        """
+        Starts decoding the spritesheets of the given species on another thread, so that loading them
+        when they are first drawn only has to convert them. Converting them needs the display, so it
+        is left to load_folders. Loading a folder while it is still being decoded waits for it.
+        :return: The thread doing the decoding
+        """
+        folders = self.get_species_folders(species)
+        thread = threading.Thread(
+            target=self._decode_folders, args=(folders,), daemon=True
+        )
+        self._preload_threads.append(thread)
+        thread.start()
+        return thread
+
+    def _decode_folders(self, folders: Iterable[str]):
+        """Runs on the preload thread. Decodes the spritesheets of sprite folders which aren't loaded yet."""
+        paths = [
+            self.get_spritesheet_path(f, x)
+            for f in folders
+            if f not in self.loaded_folders and f in game.sprite_folders
+            for x in SPRITESHEET_NAMES
+        ]
+        cache = self.get_spritesheet_cache()
+        if cache:
+            # cached sheets are memory-mapped rather than decoded, so there is nothing to do ahead of time
+            paths = cache.get_uncached(paths)
+        self._decoded_sheets.update(read_spritesheets(paths))
+
+    def load_folders(self, folders: Iterable[str]):
+        """Loads the spritesheets of sprite folders and divides them into sprites, if that wasn't done yet."""
+        with self._load_lock:
+            folders = [
+                f
+                for f in folders
+                if f not in self.loaded_folders and f in game.sprite_folders
             ]
+            if not folders:
+                return
+
+            while self._preload_threads:
+                self._preload_threads.pop().join()
+
+            sheet_paths = {
+                (f, x): self.get_spritesheet_path(f, x)
+                for f in folders
+                for x in SPRITESHEET_NAMES
+            }
+            decoded = {
+                path: self._decoded_sheets.pop(path)
+                for path in sheet_paths.values()
+                if path in self._decoded_sheets
+            }
+            loaded_sheets = self.load_spritesheets(sheet_paths.values(), decoded)
+
+            for f in folders:
+                for x in SPRITESHEET_NAMES:
+                    self.spritesheets[x] = loaded_sheets[sheet_paths[(f, x)]]
+                self.make_folder_groups(f)
+                self.loaded_folders.add(f)
+
+    def make_folder_groups(self, f):
+        """Divides the spritesheets of a sprite folder into sprites"""
+        # Line art
+        self.make_group("lineart", (0, 0), f"lines{f}_")
+        self.make_group("shadersnewwhite", (0, 0), f"shaders{f}_")
+        self.make_group("lightingnew", (0, 0), f"lighting{f}_")
+
+        self.make_group("lineartdead", (0, 0), f"lineartdead{f}_")
+        self.make_group("lineartdf", (0, 0), f"lineartdf{f}_")
+
+        # Fading Fog
+        for i in range(0, 3):
+            self.make_group("fademask", (i, 0), f"fademask{f}_{i}")
+            self.make_group("fadestarclan", (i, 0), f"fadestarclan{f}_{i}")
+            self.make_group("fadedarkforest", (i, 0), f"fadedf{f}_{i}")
+
+        # Define eye colors
+        eye_colors = [
+            [
+                "YELLOW",
+                "AMBER",
+                "HAZEL",
+                "PALEGREEN",
+                "GREEN",
+                "BLUE",
+                "DARKBLUE",
+                "GREY",
+                "CYAN",
+                "EMERALD",
+                "HEATHERBLUE",
+                "SUNLITICE",
+            ],
+            [
+                "COPPER",
+                "SAGE",
+                "COBALT",
+                "PALEBLUE",
+                "BRONZE",
+                "SILVER",
+                "PALEYELLOW",
+                "GOLD",
+                "GREENYELLOW",
+                "ORANGE"
+            ],
+        ]
 
-            for row, colors in enumerate(eye_colors):
-                for col, color in enumerate(colors):
-                    self.make_group("eyes", (col, row), f"eyes{f}_{color}")
-                    self.make_group("eyes2", (col, row), f"eyes2{f}_{color}")
+        for row, colors in enumerate(eye_colors):
+            for col, color in enumerate(colors):
+                self.make_group("eyes", (col, row), f"eyes{f}_{color}")
+                self.make_group("eyes2", (col, row), f"eyes2{f}_{color}")
 
-            # Define white patches
-            white_patches = [
-                [
-                    "FULLWHITE",
-                    "ANY",
-                    "TUXEDO",
-                    "LITTLE",
-                    "COLOURPOINT",
-                    "VAN",
-                    "ANYTWO",
-                    "MOON",
-                    "PHANTOM",
-                    "POWDER",
-                    "BLEACHED",
-                    "SAVANNAH",
-                    "FADESPOTS",
-                    "PEBBLESHINE",
-                ],
-                [
-                    "EXTRA",
-                    "ONEEAR",
-                    "BROKEN",
-                    "LIGHTTUXEDO",
-                    "BUZZARDFANG",
-                    "RAGDOLL",
-                    "LIGHTSONG",
-                    "VITILIGO",
-                    "BLACKSTAR",
-                    "PIEBALD",
-                    "CURVED",
-                    "PETAL",
-                    "SHIBAINU",
-                    "OWL",
-                ],
-                [
-                    "TIP",
-                    "FANCY",
-                    "FRECKLES",
-                    "RINGTAIL",
-                    "HALFFACE",
-                    "PANTSTWO",
-                    "GOATEE",
-                    "VITILIGOTWO",
-                    "PAWS",
-                    "MITAINE",
-                    "BROKENBLAZE",
-                    "SCOURGE",
-                    "DIVA",
-                    "BEARD",
-                ],
-                [
-                    "TAIL",
-                    "BLAZE",
-                    "PRINCE",
-                    "BIB",
-                    "VEE",
-                    "UNDERS",
-                    "HONEY",
-                    "FAROFA",
-                    "DAMIEN",
-                    "MISTER",
-                    "BELLY",
-                    "TAILTIP",
-                    "TOES",
-                    "TOPCOVER",
-                ],
-                [
-                    "APRON",
-                    "CAPSADDLE",
-                    "MASKMANTLE",
-                    "SQUEAKS",
-                    "STAR",
-                    "TOESTAIL",
-                    "RAVENPAW",
-                    "PANTS",
-                    "REVERSEPANTS",
-                    "SKUNK",
-                    "KARPATI",
-                    "HALFWHITE",
-                    "APPALOOSA",
-                    "DAPPLEPAW",
-                ],
-                [
-                    "HEART",
-                    "LILTWO",
-                    "GLASS",
-                    "MOORISH",
-                    "SEPIAPOINT",
-                    "MINKPOINT",
-                    "SEALPOINT",
-                    "MAO",
-                    "LUNA",
-                    "CHESTSPECK",
-                    "WINGS",
-                    "PAINTED",
-                    "HEARTTWO",
-                    "WOODPECKER",
-                ],
-                [
-                    "BOOTS",
-                    "MISS",
-                    "COW",
-                    "COWTWO",
-                    "BUB",
-                    "BOWTIE",
-                    "MUSTACHE",
-                    "REVERSEHEART",
-                    "SPARROW",
-                    "VEST",
-                    "LOVEBUG",
-                    "TRIXIE",
-                    "SAMMY",
-                    "SPARKLE",
-                ],
-                [
-                    "RIGHTEAR",
-                    "LEFTEAR",
-                    "ESTRELLA",
-                    "SHOOTINGSTAR",
-                    "EYESPOT",
-                    "REVERSEEYE",
-                    "FADEBELLY",
-                    "FRONT",
-                    "BLOSSOMSTEP",
-                    "PEBBLE",
-                    "TAILTWO",
-                    "BUDDY",
-                    "BACKSPOT",
-                    "EYEBAGS",
-                ],
-                [
-                    "BULLSEYE",
-                    "FINN",
-                    "DIGIT",
-                    "KROPKA",
-                    "FCTWO",
-                    "FCONE",
-                    "MIA",
-                    "SCAR",
-                    "BUSTER",
-                    "SMOKEY",
-                    "HAWKBLAZE",
-                    "CAKE",
-                    "ROSINA",
-                    "PRINCESS",
-                ],
-                ["LOCKET", "BLAZEMASK", "TEARS", "DOUGIE"],
-            ]
+        # Define white patches
+        white_patches = [
+            [
+                "FULLWHITE",
+                "ANY",
+                "TUXEDO",
+                "LITTLE",
+                "COLOURPOINT",
+                "VAN",
+                "ANYTWO",
+                "MOON",
+                "PHANTOM",
+                "POWDER",
+                "BLEACHED",
+                "SAVANNAH",
+                "FADESPOTS",
+                "PEBBLESHINE",
+            ],
+            [
+                "EXTRA",
+                "ONEEAR",
+                "BROKEN",
+                "LIGHTTUXEDO",
+                "BUZZARDFANG",
+                "RAGDOLL",
+                "LIGHTSONG",
+                "VITILIGO",
+                "BLACKSTAR",
+                "PIEBALD",
+                "CURVED",
+                "PETAL",
+                "SHIBAINU",
+                "OWL",
+            ],
+            [
+                "TIP",
+                "FANCY",
+                "FRECKLES",
+                "RINGTAIL",
+                "HALFFACE",
+                "PANTSTWO",
+                "GOATEE",
+                "VITILIGOTWO",
+                "PAWS",
+                "MITAINE",
+                "BROKENBLAZE",
+                "SCOURGE",
+                "DIVA",
+                "BEARD",
+            ],
+            [
+                "TAIL",
+                "BLAZE",
+                "PRINCE",
+                "BIB",
+                "VEE",
+                "UNDERS",
+                "HONEY",
+                "FAROFA",
+                "DAMIEN",
+                "MISTER",
+                "BELLY",
+                "TAILTIP",
+                "TOES",
+                "TOPCOVER",
+            ],
+            [
+                "APRON",
+                "CAPSADDLE",
+                "MASKMANTLE",
+                "SQUEAKS",
+                "STAR",
+                "TOESTAIL",
+                "RAVENPAW",
+                "PANTS",
+                "REVERSEPANTS",
+                "SKUNK",
+                "KARPATI",
+                "HALFWHITE",
+                "APPALOOSA",
+                "DAPPLEPAW",
+            ],
+            [
+                "HEART",
+                "LILTWO",
+                "GLASS",
+                "MOORISH",
+                "SEPIAPOINT",
+                "MINKPOINT",
+                "SEALPOINT",
+                "MAO",
+                "LUNA",
+                "CHESTSPECK",
+                "WINGS",
+                "PAINTED",
+                "HEARTTWO",
+                "WOODPECKER",
+            ],
+            [
+                "BOOTS",
+                "MISS",
+                "COW",
+                "COWTWO",
+                "BUB",
+                "BOWTIE",
+                "MUSTACHE",
+                "REVERSEHEART",
+                "SPARROW",
+                "VEST",
+                "LOVEBUG",
+                "TRIXIE",
+                "SAMMY",
+                "SPARKLE",
+            ],
+            [
+                "RIGHTEAR",
+                "LEFTEAR",
+                "ESTRELLA",
+                "SHOOTINGSTAR",
+                "EYESPOT",
+                "REVERSEEYE",
+                "FADEBELLY",
+                "FRONT",
+                "BLOSSOMSTEP",
+                "PEBBLE",
+                "TAILTWO",
+                "BUDDY",
+                "BACKSPOT",
+                "EYEBAGS",
+            ],
+            [
+                "BULLSEYE",
+                "FINN",
+                "DIGIT",
+                "KROPKA",
+                "FCTWO",
+                "FCONE",
+                "MIA",
+                "SCAR",
+                "BUSTER",
+                "SMOKEY",
+                "HAWKBLAZE",
+                "CAKE",
+                "ROSINA",
+                "PRINCESS",
+            ],
+            ["LOCKET", "BLAZEMASK", "TEARS", "DOUGIE"],
+        ]
 
-            for row, patches in enumerate(white_patches):
-                for col, patch in enumerate(patches):
-                    self.make_group("whitepatches", (col, row), f"white{f}_{patch}")
+        for row, patches in enumerate(white_patches):
+            for col, patch in enumerate(patches):
+                self.make_group("whitepatches", (col, row), f"white{f}_{patch}")
 
-            # Define colors and categories
-            color_categories = [
-                ["WHITE", "PALEGREY", "SILVER", "GREY", "DARKGREY", "GHOST", "BLACK"],
-                ["CREAM", "PALEGINGER", "GOLDEN", "GINGER", "DARKGINGER", "SIENNA"],
-                ["LIGHTBROWN", "LILAC", "BROWN", "GOLDEN-BROWN", "DARKBROWN", "CHOCOLATE"],
-            ]
+        # Define colors and categories
+        color_categories = [
+            ["WHITE", "PALEGREY", "SILVER", "GREY", "DARKGREY", "GHOST", "BLACK"],
+            ["CREAM", "PALEGINGER", "GOLDEN", "GINGER", "DARKGINGER", "SIENNA"],
+            ["LIGHTBROWN", "LILAC", "BROWN", "GOLDEN-BROWN", "DARKBROWN", "CHOCOLATE"],
+        ]
 
-            color_types = [
-                "singlecolours",
-                "tabbycolours",
-                "marbledcolours",
-                "rosettecolours",
-                "smokecolours",
-                "tickedcolours",
-                "speckledcolours",
-                "bengalcolours",
-                "mackerelcolours",
-                "classiccolours",
-                "sokokecolours",
-                "agouticolours",
-                "singlestripecolours",
-                "maskedcolours",
-            ]
+        color_types = [
+            "singlecolours",
+            "tabbycolours",
+            "marbledcolours",
+            "rosettecolours",
+            "smokecolours",
+            "tickedcolours",
+            "speckledcolours",
+            "bengalcolours",
+            "mackerelcolours",
+            "classiccolours",
+            "sokokecolours",
+            "agouticolours",
+            "singlestripecolours",
+            "maskedcolours",
+        ]
 
-            for row, colors in enumerate(color_categories):
-                for col, color in enumerate(colors):
-                    for color_type in color_types:
-                        self.make_group(color_type, (col, row), f"{color_type[:-7]}{f}_{color}")
+        for row, colors in enumerate(color_categories):
+            for col, color in enumerate(colors):
+                for color_type in color_types:
+                    self.make_group(color_type, (col, row), f"{color_type[:-7]}{f}_{color}")
 
-            # tortiepatchesmasks
-            tortiepatchesmasks = [
-                [
-                    "ONE",
-                    "TWO",
-                    "THREE",
-                    "FOUR",
-                    "REDTAIL",
-                    "DELILAH",
-                    "HALF",
-                    "STREAK",
-                    "MASK",
-                    "SMOKE",
-                ],
-                [
-                    "MINIMALONE",
-                    "MINIMALTWO",
-                    "MINIMALTHREE",
-                    "MINIMALFOUR",
-                    "OREO",
-                    "SWOOP",
-                    "CHIMERA",
-                    "CHEST",
-                    "ARMTAIL",
-                    "GRUMPYFACE",
-                ],
-                [
-                    "MOTTLED",
-                    "SIDEMASK",
-                    "EYEDOT",
-                    "BANDANA",
-                    "PACMAN",
-                    "STREAMSTRIKE",
-                    "SMUDGED",
-                    "DAUB",
-                    "EMBER",
-                    "BRIE",
-                ],
-                [
-                    "ORIOLE",
-                    "ROBIN",
-                    "BRINDLE",
-                    "PAIGE",
-                    "ROSETAIL",
-                    "SAFI",
-                    "DAPPLENIGHT",
-                    "BLANKET",
-                    "BELOVED",
-                    "BODY",
-                ],
-                ["SHILOH", "FRECKLED", "HEARTBEAT"],
-            ]
+        # tortiepatchesmasks
+        tortiepatchesmasks = [
+            [
+                "ONE",
+                "TWO",
+                "THREE",
+                "FOUR",
+                "REDTAIL",
+                "DELILAH",
+                "HALF",
+                "STREAK",
+                "MASK",
+                "SMOKE",
+            ],
+            [
+                "MINIMALONE",
+                "MINIMALTWO",
+                "MINIMALTHREE",
+                "MINIMALFOUR",
+                "OREO",
+                "SWOOP",
+                "CHIMERA",
+                "CHEST",
+                "ARMTAIL",
+                "GRUMPYFACE",
+            ],
+            [
+                "MOTTLED",
+                "SIDEMASK",
+                "EYEDOT",
+                "BANDANA",
+                "PACMAN",
+                "STREAMSTRIKE",
+                "SMUDGED",
+                "DAUB",
+                "EMBER",
+                "BRIE",
+            ],
+            [
+                "ORIOLE",
+                "ROBIN",
+                "BRINDLE",
+                "PAIGE",
+                "ROSETAIL",
+                "SAFI",
+                "DAPPLENIGHT",
+                "BLANKET",
+                "BELOVED",
+                "BODY",
+            ],
+            ["SHILOH", "FRECKLED", "HEARTBEAT"],
+        ]
 
-            for row, masks in enumerate(tortiepatchesmasks):
-                for col, mask in enumerate(masks):
-                    self.make_group("tortiepatchesmasks", (col, row), f"tortiemask{f}_{mask}")
+        for row, masks in enumerate(tortiepatchesmasks):
+            for col, mask in enumerate(masks):
+                self.make_group("tortiepatchesmasks", (col, row), f"tortiemask{f}_{mask}")
 
-            # Define skin colors
-            skin_colors = [
-                ["BLACK", "RED", "PINK", "DARKBROWN", "BROWN", "LIGHTBROWN"],
-                ["DARK", "DARKGREY", "GREY", "DARKSALMON", "SALMON", "PEACH"],
-                ["DARKMARBLED", "MARBLED", "LIGHTMARBLED", "DARKBLUE", "BLUE", "LIGHTBLUE"],
-            ]
+        # Define skin colors
+        skin_colors = [
+            ["BLACK", "RED", "PINK", "DARKBROWN", "BROWN", "LIGHTBROWN"],
+            ["DARK", "DARKGREY", "GREY", "DARKSALMON", "SALMON", "PEACH"],
+            ["DARKMARBLED", "MARBLED", "LIGHTMARBLED", "DARKBLUE", "BLUE", "LIGHTBLUE"],
+        ]
 
-            for row, colors in enumerate(skin_colors):
-                for col, color in enumerate(colors):
-                    self.make_group("skin", (col, row), f"skin{f}_{color}")
+        for row, colors in enumerate(skin_colors):
+            for col, color in enumerate(colors):
+                self.make_group("skin", (col, row), f"skin{f}_{color}")
 
-            self.load_scars(f)
-        self.load_symbols()
+        self.load_scars(f)
 
     def load_scars(self, f):
         """
@@ -0,0 +1,208 @@
+"""
+Loads the spritesheets, keeping decoded copies of them on disk so later starts can skip the PNG decoding.
+
+Each spritesheet is stored as raw pixels in the same layout convert_alpha() gives, so it can be
+memory-mapped and used as a surface straight away with pygame.image.frombuffer. Only the parts of a sheet
+that are actually drawn get read from disk. The mapping is copy-on-write, so drawing on a cached sheet
+changes a private copy of the pages drawn on, never the file. The index records the modification time and size of every
+source PNG, and a sheet is decoded again when its PNG changes.
+
+Sheets which aren't in the cache are decoded on several threads at once. Decoding doesn't need the display,
+so it can also be done ahead of time on another thread with read_spritesheets; converting the decoded
+sheets for the display is always left to the thread that asks for them.
+"""
+
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import pygame
+import ujson
+
+# bump this if the way sheets are stored changes, so old caches are rebuilt
+SPRITESHEET_CACHE_VERSION = 1
+PIXEL_FORMAT = "BGRA"
+
+
+def read_spritesheets(
+    paths: Iterable[str], max_workers: int = 8
+) -> Dict[str, pygame.Surface]:
+    """
+    Decodes PNG files on several threads, without converting them. Safe to call from any thread.
+    :param paths: The files to load
+    :param max_workers: How many files can be decoded at once
+    :return: The decoded surfaces, by path
+    """
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return dict(zip(paths, executor.map(pygame.image.load, paths)))
+
+
+def decode_spritesheets(
+    paths: Iterable[str],
+    max_workers: int = 8,
+    decoded: Optional[Dict[str, pygame.Surface]] = None,
+) -> Dict[str, pygame.Surface]:
+    """
+    Decodes PNG files on several threads, and converts them for fast blitting.
+    :param paths: The files to load
+    :param max_workers: How many files can be decoded at once
+    :param decoded: Files already decoded by read_spritesheets, by path. They are only converted.
+    :return: The converted surfaces, by path
+    """
+    decoded = decoded or {}
+    paths = list(dict.fromkeys(paths))
+    surfaces = {path: decoded[path] for path in paths if path in decoded}
+    surfaces.update(
+        read_spritesheets([path for path in paths if path not in decoded], max_workers)
+    )
+    # converting needs the display's pixel format, so it is done here rather than on the decoding threads
+    return {path: surfaces[path].convert_alpha() for path in paths}
+
+
+class SpritesheetCache:
+    """Decoded spritesheets, stored in a folder with an index.json describing them."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.index = {}
+        # the memory maps have to stay open for as long as their surfaces are used
+        self._maps = []
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as read_file:
+                index = ujson.loads(read_file.read())
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != SPRITESHEET_CACHE_VERSION:
+            return {}
+        return index
+
+    def load_index(self):
+        index = self._read_index()
+        if index.get("masks") == list(self._get_masks()):
+            self.index = index.get("sheets", {})
+        else:
+            self.index = {}
+
+    def get_uncached(self, paths: Iterable[str]) -> List[str]:
+        """
+        Returns the PNGs which aren't in the cache, or have changed since they were cached.
+        Doesn't need the display, so it can be used from any thread.
+        """
+        sheets = self._read_index().get("sheets", {})
+        return [
+            path
+            for path in dict.fromkeys(paths)
+            if path not in sheets
+            or sheets[path]["source"] != self._get_source_info(path)
+        ]
+
+    def save_index(self):
+        with open(self.index_path, "w", encoding="utf-8") as write_file:
+            write_file.write(
+                ujson.dumps(
+                    {
+                        "version": SPRITESHEET_CACHE_VERSION,
+                        "masks": list(self._get_masks()),
+                        "sheets": self.index,
+                    }
+                )
+            )
+
+    @staticmethod
+    def _get_masks():
+        return pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+
+    @staticmethod
+    def _get_source_info(path: str) -> list:
+        stat = os.stat(path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _cache_file(self, path: str, source_info: list) -> str:
+        name = path.replace("\\", "/").strip("./").replace("/", "_")
+        return f"{os.path.splitext(name)[0]}_{source_info[0]}_{source_info[1]}.raw"
+
+    def get(self, path: str) -> Optional[pygame.Surface]:
+        """Returns the cached sheet for a PNG, or None if it isn't cached or the PNG has changed since."""
+        entry = self.index.get(path)
+        if entry is None or entry["source"] != self._get_source_info(path):
+            return None
+        try:
+            with open(os.path.join(self.directory, entry["file"]), "rb") as read_file:
+                # not ACCESS_READ: pygame writes straight into the buffer, and a read-only mapping would crash
+                pixels = mmap.mmap(read_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        width, height = entry["size"]
+        if len(pixels) != width * height * 4:
+            pixels.close()
+            return None
+        self._maps.append(pixels)
+        return pygame.image.frombuffer(pixels, (width, height), PIXEL_FORMAT)
+
+    def put(self, path: str, surface: pygame.Surface):
+        """Stores a converted sheet for a PNG, replacing any older copy."""
+        source_info = self._get_source_info(path)
+        file_name = self._cache_file(path, source_info)
+        with open(os.path.join(self.directory, file_name), "wb") as write_file:
+            write_file.write(pygame.image.tobytes(surface, PIXEL_FORMAT))
+
+        old_entry = self.index.get(path)
+        if old_entry and old_entry["file"] != file_name:
+            try:
+                os.remove(os.path.join(self.directory, old_entry["file"]))
+            except OSError:
+                # it may still be mapped, it will be replaced the next time round
+                pass
+        self.index[path] = {
+            "file": file_name,
+            "size": list(surface.get_size()),
+            "source": source_info,
+        }
+
+    def load_spritesheets(
+        self,
+        paths: Iterable[str],
+        decoded: Optional[Dict[str, pygame.Surface]] = None,
+    ) -> Dict[str, pygame.Surface]:
+        """
+        Returns the spritesheets for a list of PNGs, from the cache where possible.
+        Sheets which had to be decoded are added to the cache.
+        :param paths: The files to load
+        :param decoded: Files already decoded by read_spritesheets, by path
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.load_index()
+
+        sheets = {}
+        missing = []
+        for path in dict.fromkeys(paths):
+            sheet = self.get(path)
+            if sheet is None:
+                missing.append(path)
+            else:
+                sheets[path] = sheet
+        self.stats["hits"] += len(sheets)
+        self.stats["misses"] += len(missing)
+
+        if missing:
+            decoded = decode_spritesheets(missing, decoded=decoded)
+            for path, sheet in decoded.items():
+                try:
+                    self.put(path, sheet)
+                except OSError as e:
+                    print(f"WARNING: could not cache spritesheet {path}: {e}")
+            sheets.update(decoded)
+            try:
+                self.save_index()
+            except OSError as e:
+                print(f"WARNING: could not save the spritesheet cache index: {e}")
+
+        return sheets
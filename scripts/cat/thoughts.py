@@ -1,5 +1,6 @@
 import traceback
 from random import choice
+from typing import Dict, List
 
 import i18n
 
@@ -7,6 +8,11 @@ from scripts.game_structure.localization import load_lang_resource
 
 
 class Thoughts:
+    # Thoughts that pass the Clan-level constraints, keyed by (thought file, status, biome, season, camp).
+    # Only the constraints that depend on the cats themselves are left to check each moon.
+    thought_pools: Dict[tuple, List[dict]] = {}
+    thought_pools_lang = None
+
     @staticmethod
     def thought_fulfill_rel_constraints(main_cat, random_cat, constraint) -> bool:
         """Check if the relationship fulfills the interaction relationship constraints."""
@@ -57,6 +63,13 @@ class Thoughts:
         main_cat, random_cat, thought, game_mode, biome, season, camp
     ) -> bool:
         """Check if the two cats fulfills the thought constraints."""
+        return Thoughts.thought_fulfill_clan_constraints(
+            thought, main_cat.status, biome, season, camp
+        ) and Thoughts.thought_fulfill_cat_constraints(main_cat, random_cat, thought)
+
+    @staticmethod
+    def thought_fulfill_clan_constraints(thought, status, biome, season, camp) -> bool:
+        """Check the constraints that are the same for every cat of a status, so they can be checked ahead of time."""
 
         # This is for checking biome
         if "biome" in thought:
@@ -73,6 +86,20 @@ class Thoughts:
             if camp not in thought["camp"]:
                 return False
 
+        # Constraints for the status of the main cat
+        if "main_status_constraint" in thought:
+            if (
+                status not in thought["main_status_constraint"]
+                and "any" not in thought["main_status_constraint"]
+            ):
+                return False
+
+        return True
+
+    @staticmethod
+    def thought_fulfill_cat_constraints(main_cat, random_cat, thought) -> bool:
+        """Check the constraints that depend on the two cats."""
+
         # This is for checking the 'not_working' status
         if "not_working" in thought:
             if thought["not_working"] != main_cat.not_working():
@@ -92,14 +119,6 @@ class Thoughts:
             ):
                 return False
 
-        # Constraints for the status of the main cat
-        if "main_status_constraint" in thought:
-            if (
-                main_cat.status not in thought["main_status_constraint"]
-                and "any" not in thought["main_status_constraint"]
-            ):
-                return False
-
         # Constraints for the status of the random cat
         if "random_status_constraint" in thought and random_cat:
             if (
@@ -324,6 +343,37 @@ class Thoughts:
                 created_list.append(inter)
         return created_list
 
+    @staticmethod
+    def clear_thought_pools():
+        """Forgets the thought pools, so they are rebuilt from the thought files on next use."""
+        Thoughts.thought_pools.clear()
+        Thoughts.thought_pools_lang = None
+
+    @staticmethod
+    def get_thought_pool(location, status, biome, season, camp) -> List[dict]:
+        """
+        Returns the thoughts from a thought file that pass the Clan-level constraints. The pools are built the first
+        time they are needed and are rebuilt when the language changes or on clear_thought_pools.
+        :param location: The thought file, relative to the lang folder
+        :param status: Status of the cats the pool is for
+        """
+        if Thoughts.thought_pools_lang != i18n.config.get("locale"):
+            Thoughts.clear_thought_pools()
+            Thoughts.thought_pools_lang = i18n.config.get("locale")
+
+        key = (location, status, biome, season, camp)
+        pool = Thoughts.thought_pools.get(key)
+        if pool is None:
+            pool = [
+                thought
+                for thought in load_lang_resource(location)
+                if Thoughts.thought_fulfill_clan_constraints(
+                    thought, status, biome, season, camp
+                )
+            ]
+            Thoughts.thought_pools[key] = pool
+        return pool
+
     @staticmethod
     def load_thoughts(main_cat, other_cat, game_mode, biome, season, camp):
         status = main_cat.status
@@ -358,21 +408,26 @@ class Thoughts:
         # newborns only pull from their status thoughts. this is done for convenience
         try:
             if main_cat.age == "newborn":
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/newborn.json"
+                loaded_thoughts = Thoughts.get_thought_pool(
+                    f"thoughts/{life_dir}{spec_dir}/newborn.json",
+                    main_cat.status, biome, season, camp,
                 )
             else:
-                thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/{status}.json"
+                thoughts = Thoughts.get_thought_pool(
+                    f"thoughts/{life_dir}{spec_dir}/{status}.json",
+                    main_cat.status, biome, season, camp,
                 )
-                genthoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/general.json"
+                genthoughts = Thoughts.get_thought_pool(
+                    f"thoughts/{life_dir}{spec_dir}/general.json",
+                    main_cat.status, biome, season, camp,
                 )
                 loaded_thoughts = thoughts + genthoughts
 
-            final_thoughts = Thoughts.create_thoughts(
-                loaded_thoughts, main_cat, other_cat, game_mode, biome, season, camp
-            )
+            final_thoughts = [
+                thought
+                for thought in loaded_thoughts
+                if Thoughts.thought_fulfill_cat_constraints(main_cat, other_cat, thought)
+            ]
             return final_thoughts
         except IOError:
             print("ERROR: loading thoughts")
@@ -0,0 +1,84 @@
+"""
+Keeps track of which cats are parents and mates of which, in both directions.
+
+Every family relation (kits, siblings, aunts/uncles, cousins, grandkits) is built from parents, so
+with a parent -> children map the Inheritance of a cat only has to look at the children of its own
+family, rather than going through every cat. The graph is updated from a cat's parent1, parent2,
+adoptive_parents, mate and previous_mates whenever those change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+
+class FamilyGraph:
+    """Parent -> children and mate adjacency maps, by cat ID."""
+
+    def __init__(self):
+        self._parents: Dict[str, Tuple[str, ...]] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._mates: Dict[str, Tuple[str, ...]] = {}
+        self._mated_by: Dict[str, Set[str]] = {}
+        # when each cat was first added, so results come out in the same order as Cat.all_cats
+        self._order: Dict[str, int] = {}
+
+    def update(self, cat: Cat):
+        """Adds a cat, or brings its parents and mates up to date."""
+        if cat.ID not in self._order:
+            self._order[cat.ID] = len(self._order)
+
+        parents = tuple(p for p in (cat.parent1, cat.parent2) if p) + tuple(
+            cat.adoptive_parents
+        )
+        self._set_edges(cat.ID, parents, self._parents, self._children)
+
+        mates = tuple(cat.mate) + tuple(cat.previous_mates)
+        self._set_edges(cat.ID, mates, self._mates, self._mated_by)
+
+    def remove(self, cat: Cat):
+        """Forgets the parents and mates a cat lists. Cats listing it as their parent or mate are kept."""
+        self._set_edges(cat.ID, (), self._parents, self._children)
+        self._set_edges(cat.ID, (), self._mates, self._mated_by)
+        self._parents.pop(cat.ID, None)
+        self._mates.pop(cat.ID, None)
+
+    def clear(self):
+        self.__init__()
+
+    @staticmethod
+    def _set_edges(cat_id, targets, forward, backward):
+        old_targets = forward.get(cat_id, ())
+        if old_targets == targets:
+            return
+        for target in old_targets:
+            backward.get(target, set()).discard(cat_id)
+        for target in targets:
+            backward.setdefault(target, set()).add(cat_id)
+        forward[cat_id] = targets
+
+    # ---------------------------------------------------------------------------- #
+    #                                    lookups                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def get_children(self, cat_ids: Iterable[str]) -> Set[str]:
+        """Returns the IDs of every cat that has one of the given cats as a blood or adoptive parent."""
+        children = set()
+        for cat_id in cat_ids:
+            children.update(self._children.get(cat_id, ()))
+        return children
+
+    def get_mates(self, cat_id: str) -> Set[str]:
+        """Returns the IDs of current and previous mates of a cat, whichever side listed them."""
+        return set(self._mates.get(cat_id, ())) | self._mated_by.get(cat_id, set())
+
+    def sort(self, cat_ids: Iterable[str]) -> List[str]:
+        """Puts cat IDs in the order the cats were added."""
+        order = self._order
+        return sorted(cat_ids, key=lambda cat_id: order.get(cat_id, len(order)))
+
+
+family_graph = FamilyGraph()
@@ -10,6 +10,7 @@ while mating and for the display of the family tree screen.
 import i18n
 from strenum import StrEnum  # pylint: disable=no-name-in-module
 
+from scripts.cat_relations.family_graph import family_graph
 from scripts.utility import adjust_list_text
 
 
@@ -32,6 +33,7 @@ BLOOD_RELATIVE_TYPES = [
 
 class Inheritance:
     all_inheritances = {}  # ID: object
+    family_graph = family_graph
 
     def __init__(self, cat, born=False):
         self.need_update = False
@@ -89,8 +91,22 @@ class Inheritance:
         # mates
         self.init_mates()
 
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
+        # Only the children of this cat, its parents, its grandparents and their children
+        # can be kits, siblings, parents' siblings or cousins
+        all_cats = self.cat.all_cats
+        graph = self.family_graph
+        graph.update(self.cat)
+        grand_parents_kits = graph.get_children(self.grand_parents)
+        candidates = (
+            graph.get_children([self.cat.ID])
+            | graph.get_children(self.parents)
+            | grand_parents_kits
+            | graph.get_children(grand_parents_kits)
+        )
+
+        for inter_id in graph.sort(candidates):
+            inter_cat = all_cats.get(inter_id)
+            if inter_id == self.cat.ID or inter_cat is None:
                 continue
 
             # kits + their mates
@@ -106,8 +122,9 @@ class Inheritance:
             self.init_cousins(inter_id, inter_cat)
 
         # since grand kits depending on kits, ALL KITS HAVE TO BE SET FIRST!
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
+        for inter_id in graph.sort(graph.get_children(self.kits)):
+            inter_cat = all_cats.get(inter_id)
+            if inter_id == self.cat.ID or inter_cat is None:
                 continue
 
             # grand kits
@@ -151,8 +168,25 @@ class Inheritance:
         It renews all inheritances, where this cat is listed as a mate of a kit or sibling.
         """
         self.update_inheritance()
-        for inter_inheritances in self.all_inheritances.values():
-            if (
+
+        # Cats listing this cat as a mate of theirs, their kits or their siblings are
+        # its mates and the parents and siblings of its mates
+        mate_ids = self.family_graph.get_mates(self.cat.ID)
+        mates_parents = set()
+        for mate_id in mate_ids:
+            mate = self.cat.all_cats.get(mate_id)
+            if mate:
+                mates_parents.update(self.get_parents(mate))
+        related_ids = (
+            set(self.all_involved)
+            | mate_ids
+            | mates_parents
+            | self.family_graph.get_children(mates_parents)
+        )
+
+        for inter_id in self.family_graph.sort(related_ids):
+            inter_inheritances = self.all_inheritances.get(inter_id)
+            if inter_inheritances and (
                 self.cat.ID in inter_inheritances.other_mates
                 or self.cat.ID in inter_inheritances.all_involved
             ):
@@ -222,6 +256,7 @@ class Inheritance:
             self.cat.adoptive_parents.append(parent.ID)
         self.all_involved.append(parent.ID)
         self.all_but_cousins.append(parent.ID)
+        self.family_graph.update(self.cat)
         self.update_all_related_inheritance()
 
     # ---------------------------------------------------------------------------- #
@@ -490,8 +525,13 @@ class Inheritance:
                 }
                 self.other_mates.append(mate_id)
 
-            # iterate over all cats, to get the children of the sibling
-            for _c in self.cat.all_cats.values():
+            # get the children of the sibling
+            for _c_id in self.family_graph.sort(
+                self.family_graph.get_children([inter_id])
+            ):
+                _c = self.cat.all_cats.get(_c_id)
+                if _c is None:
+                    continue
                 _c_parents = self.get_parents(_c)
                 _c_adoptive = self.get_adoptive_parents(_c)
                 if inter_id in _c_parents:
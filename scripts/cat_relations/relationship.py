@@ -1,4 +1,5 @@
 import random
+from copy import deepcopy
 from random import choice
 
 import i18n
@@ -10,9 +11,22 @@ from scripts.cat_relations.interaction import (
     rebuild_relationship_dicts,
 )
 import scripts.cat_relations.interaction as interactions
+from scripts.cat_relations.relationship_store import (
+    relationship_store,
+    MATES_FLAG,
+    FAMILY_FLAG,
+    ROMANTIC_LOVE,
+    PLATONIC_LIKE,
+    DISLIKE,
+    ADMIRATION,
+    COMFORTABLE,
+    JEALOUSY,
+    TRUST,
+)
 from scripts.event_class import Single_Event
 from scripts.game_structure.game_essentials import game
 from scripts.utility import get_personality_compatibility, process_text
+from scripts.weighted_sampler import WeightedSampler
 
 
 # ---------------------------------------------------------------------------- #
@@ -21,6 +35,24 @@ from scripts.utility import get_personality_compatibility, process_text
 
 
 class Relationship:
+    """
+    The relationship of one cat towards another. The values are kept in the shared relationship store,
+    so a relationship object itself is only a small view on its row.
+    """
+
+    __slots__ = (
+        "_row",
+        "_history",
+        "_log",
+        "_saved_log_length",
+        "chosen_interaction",
+        "cat_from",
+        "cat_to",
+        "opposite_relationship",
+        "interaction_str",
+        "triggered_event",
+    )
+
     used_interaction_ids = []
     currently_loaded_lang = None
 
@@ -39,30 +71,34 @@ class Relationship:
         trust=0,
         log=None,
     ) -> None:
+        self._row = relationship_store.allocate()
+        self._history = None
         self.chosen_interaction = None
-        self.history = History()
         self.cat_from = cat_from
         self.cat_to = cat_to
-        self.mates = mates
-        self.family = family
         self.opposite_relationship = (
             None  # link to opposite relationship will be created later
         )
         self.interaction_str = ""
         self.triggered_event = False
-        if log:
-            self.log = log
-        else:
-            self.log = []
+        # most relationships never get a log entry, so the list is only made when needed
+        self._log = log if log else None
+        self._saved_log_length = 0
 
         # each stat can go from 0 to 100
-        self.romantic_love = romantic_love
-        self.platonic_like = platonic_like
-        self.dislike = dislike
-        self.admiration = admiration
-        self.comfortable = comfortable
-        self.jealousy = jealousy
-        self.trust = trust
+        relationship_store.set_row(
+            self._row,
+            (
+                romantic_love,
+                platonic_like,
+                dislike,
+                admiration,
+                comfortable,
+                jealousy,
+                trust,
+            ),
+            (MATES_FLAG if mates else 0) | (FAMILY_FLAG if family else 0),
+        )
 
     def link_relationship(self):
         """Add the other relationship object to this easily access and change the other side."""
@@ -153,7 +189,7 @@ class Relationship:
 
         # if the chosen_interaction is still in the TRIGGERED_SINGLE_INTERACTIONS, clean the list
         if chosen_interaction in self.used_interaction_ids:
-            self.used_interaction_ids = []
+            self.used_interaction_ids.clear()
 
         # add the chosen interaction id to the TRIGGERED_SINGLE_INTERACTIONS
         self.chosen_interaction = chosen_interaction
@@ -378,18 +414,22 @@ class Relationship:
 
         """
         # base for non-existing platonic like / dislike
-        list_to_choice = [True, True, False]
+        positive_weight, negative_weight = 2, 1
 
         # take personality in count
         comp = get_personality_compatibility(self.cat_from, self.cat_to)
-        if comp is not None:
-            list_to_choice.append(comp)
+        if comp is True:
+            positive_weight += 1
+        elif comp is False:
+            negative_weight += 1
 
         # further influence the partition based on the relationship
-        list_to_choice += [True] * int(self.platonic_like / 10)
-        list_to_choice += [False] * int(self.dislike / 10)
+        positive_weight += int(self.platonic_like / 10)
+        negative_weight += int(self.dislike / 10)
 
-        return choice(list_to_choice)
+        return WeightedSampler(
+            [True, False], [positive_weight, negative_weight]
+        ).choice()
 
     def get_interaction_type(self, positive: bool) -> str:
         """Returns the type of the interaction which should be made.
@@ -426,11 +466,6 @@ class Relationship:
         if self.mates:
             value_weights["romantic"] += 1
 
-        # create the list of choices
-        types = []
-        for rel_type, weight in value_weights.items():
-            types += [rel_type] * weight
-
         # if a romantic relationship is not possible, remove this type, mut only if there are no mates
         # if there already mates (set up by the user for example), don't remove this type
         mate_from_to = self.cat_from.is_potential_mate(
@@ -440,18 +475,19 @@ class Relationship:
             self.cat_from, for_love_interest=True
         )
         if (not mate_from_to or not mate_to_from) and not self.mates:
-            while "romantic" in types:
-                types.remove("romantic")
+            value_weights["romantic"] = 0
 
         # if cats have no romantic relationship already, don't allow romantic decrease
         if (
             not positive
-            and "romantic" in types
+            and value_weights["romantic"]
             and not self.cat_from.relationships[self.cat_to.ID].romantic_love
         ):
-            types.remove("romantic")
+            value_weights["romantic"] -= 1
 
-        rel_type = choice(types)
+        rel_type = WeightedSampler(
+            value_weights.keys(), value_weights.values()
+        ).choice()
         return rel_type
 
     def get_relevant_interactions(
@@ -626,86 +662,132 @@ class Relationship:
     #                                   property                                   #
     # ---------------------------------------------------------------------------- #
 
+    def __del__(self):
+        # give the row back once the relationship is gone
+        try:
+            relationship_store.release(self._row)
+        except (AttributeError, TypeError):
+            pass
+
+    def __copy__(self):
+        return self._copy_with(lambda value: value)
+
+    def __deepcopy__(self, memo):
+        return self._copy_with(lambda value: deepcopy(value, memo), memo)
+
+    def _copy_with(self, copy_value, memo=None):
+        """Copies are given their own row in the store, rather than sharing this one."""
+        new_rel = Relationship.__new__(Relationship)
+        if memo is not None:
+            memo[id(self)] = new_rel
+        new_rel._row = relationship_store.allocate()
+        relationship_store.copy_row(self._row, new_rel._row)
+        for attr in self.__slots__[1:]:
+            setattr(new_rel, attr, copy_value(getattr(self, attr)))
+        return new_rel
+
+    @property
+    def history(self):
+        if self._history is None:
+            self._history = History()
+        return self._history
+
+    @property
+    def log(self) -> list:
+        if self._log is None:
+            self._log = []
+        return self._log
+
+    @log.setter
+    def log(self, value: list):
+        self._log = value
+        relationship_store.set_dirty(self._row, True)
+
+    @property
+    def has_log(self) -> bool:
+        """True if anything was logged for this relationship. Unlike reading the log, this doesn't create it."""
+        return bool(self._log)
+
+    @property
+    def dirty(self) -> bool:
+        """True if this relationship changed since it was last saved or loaded."""
+        return relationship_store.is_dirty(self._row) or self._saved_log_length != (
+            len(self._log) if self._log else 0
+        )
+
+    def mark_saved(self):
+        """Records that the save file holds this relationship as it is now."""
+        relationship_store.set_dirty(self._row, False)
+        self._saved_log_length = len(self._log) if self._log else 0
+
+    @property
+    def mates(self):
+        return relationship_store.get_flag(self._row, MATES_FLAG)
+
+    @mates.setter
+    def mates(self, value):
+        relationship_store.set_flag(self._row, MATES_FLAG, value)
+
+    @property
+    def family(self):
+        return relationship_store.get_flag(self._row, FAMILY_FLAG)
+
+    @family.setter
+    def family(self, value):
+        relationship_store.set_flag(self._row, FAMILY_FLAG, value)
+
     @property
     def romantic_love(self):
-        return self._romantic_love
+        return relationship_store.get_stat(self._row, ROMANTIC_LOVE)
 
     @romantic_love.setter
     def romantic_love(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._romantic_love = value
+        relationship_store.set_stat(self._row, ROMANTIC_LOVE, value)
 
     @property
     def platonic_like(self):
-        return self._platonic_like
+        return relationship_store.get_stat(self._row, PLATONIC_LIKE)
 
     @platonic_like.setter
     def platonic_like(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._platonic_like = value
+        relationship_store.set_stat(self._row, PLATONIC_LIKE, value)
 
     @property
     def dislike(self):
-        return self._dislike
+        return relationship_store.get_stat(self._row, DISLIKE)
 
     @dislike.setter
     def dislike(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._dislike = value
+        relationship_store.set_stat(self._row, DISLIKE, value)
 
     @property
     def admiration(self):
-        return self._admiration
+        return relationship_store.get_stat(self._row, ADMIRATION)
 
     @admiration.setter
     def admiration(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._admiration = value
+        relationship_store.set_stat(self._row, ADMIRATION, value)
 
     @property
     def comfortable(self):
-        return self._comfortable
+        return relationship_store.get_stat(self._row, COMFORTABLE)
 
     @comfortable.setter
     def comfortable(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._comfortable = value
+        relationship_store.set_stat(self._row, COMFORTABLE, value)
 
     @property
     def jealousy(self):
-        return self._jealousy
+        return relationship_store.get_stat(self._row, JEALOUSY)
 
     @jealousy.setter
     def jealousy(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._jealousy = value
+        relationship_store.set_stat(self._row, JEALOUSY, value)
 
     @property
     def trust(self):
-        return self._trust
+        return relationship_store.get_stat(self._row, TRUST)
 
     @trust.setter
     def trust(self, value):
-        if value > 100:
-            value = 100
-        if value < 0:
-            value = 0
-        self._trust = value
+        relationship_store.set_stat(self._row, TRUST, value)
@@ -0,0 +1,118 @@
+"""
+Compact storage for the values of all relationships.
+
+Every Relationship owns one row in the shared store. The seven relationship values of a row are kept
+in a single byte array, and the mates/family flags in another, rather than as attributes of each
+Relationship object. Rows of relationships that no longer exist are reused.
+
+Each row also has a dirty flag, which is set whenever one of its values changes, so saving can
+skip relationships that are the same as in the save file.
+"""
+
+from array import array
+from typing import List
+
+STATS = (
+    "romantic_love",
+    "platonic_like",
+    "dislike",
+    "admiration",
+    "comfortable",
+    "jealousy",
+    "trust",
+)
+STAT_COUNT = len(STATS)
+(
+    ROMANTIC_LOVE,
+    PLATONIC_LIKE,
+    DISLIKE,
+    ADMIRATION,
+    COMFORTABLE,
+    JEALOUSY,
+    TRUST,
+) = range(STAT_COUNT)
+
+MATES_FLAG = 1
+FAMILY_FLAG = 2
+
+
+class RelationshipStore:
+    """Holds the values of all relationships. Values are whole numbers from 0 to 100."""
+
+    def __init__(self):
+        self.stats = array("B")
+        self.flags = bytearray()
+        self.dirty = bytearray()
+        self.free_rows: List[int] = []
+
+    def __len__(self):
+        """Number of rows in use"""
+        return len(self.flags) - len(self.free_rows)
+
+    def allocate(self) -> int:
+        """Returns a zeroed row for a new relationship"""
+        if self.free_rows:
+            row = self.free_rows.pop()
+            start = row * STAT_COUNT
+            self.stats[start : start + STAT_COUNT] = array("B", bytes(STAT_COUNT))
+            self.flags[row] = 0
+            self.dirty[row] = 1
+            return row
+
+        self.stats.frombytes(bytes(STAT_COUNT))
+        self.flags.append(0)
+        self.dirty.append(1)
+        return len(self.flags) - 1
+
+    def release(self, row: int):
+        """Marks a row as free, so it can be reused"""
+        self.free_rows.append(row)
+
+    def copy_row(self, source: int, target: int):
+        """Copies the values and flags of one row into another"""
+        start, new_start = source * STAT_COUNT, target * STAT_COUNT
+        self.stats[new_start : new_start + STAT_COUNT] = self.stats[
+            start : start + STAT_COUNT
+        ]
+        self.flags[target] = self.flags[source]
+        self.dirty[target] = 1
+
+    def get_stat(self, row: int, stat: int) -> int:
+        return self.stats[row * STAT_COUNT + stat]
+
+    def set_stat(self, row: int, stat: int, value):
+        if value > 100:
+            value = 100
+        if value < 0:
+            value = 0
+        index = row * STAT_COUNT + stat
+        if self.stats[index] != int(value):
+            self.stats[index] = int(value)
+            self.dirty[row] = 1
+
+    def set_row(self, row: int, stats, flags: int = 0):
+        """Sets all values of a row at once, given in the order of STATS, and its flags"""
+        start = row * STAT_COUNT
+        self.stats[start : start + STAT_COUNT] = array(
+            "B", [0 if v < 0 else 100 if v > 100 else int(v) for v in stats]
+        )
+        self.flags[row] = flags
+        self.dirty[row] = 1
+
+    def get_flag(self, row: int, flag: int) -> bool:
+        return bool(self.flags[row] & flag)
+
+    def set_flag(self, row: int, flag: int, value: bool):
+        flags = self.flags[row] | flag if value else self.flags[row] & ~flag
+        if self.flags[row] != flags:
+            self.flags[row] = flags
+            self.dirty[row] = 1
+
+    def is_dirty(self, row: int) -> bool:
+        return bool(self.dirty[row])
+
+    def set_dirty(self, row: int, value: bool):
+        self.dirty[row] = value
+
+
+relationship_store = RelationshipStore()
@@ -21,10 +21,12 @@ from scripts.cat.cats import Cat, cat_class
 from scripts.cat.history import History
 from scripts.cat.names import names
 from scripts.cat.sprites import sprites
+from scripts.cat_relations.family_graph import family_graph
 from scripts.clan_resources.freshkill import FreshkillPile, Nutrition
 from scripts.clan_resources.herb.herb_supply import HerbSupply
 from scripts.events_module.generate_events import OngoingEvent
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.save_file import load_save_file
 from scripts.housekeeping.datadir import get_save_dir
 from scripts.housekeeping.version import get_version_info, SAVE_VERSION_NUMBER
 from scripts.utility import (
@@ -132,6 +134,8 @@ class Clan:
         self.pregnancy_data = {}
         self.inheritance = {}
         self.custom_pronouns = {}
+        # if set, every moon's random numbers are seeded from this, so moons can be replayed
+        self.seed = None
 
         # Init Settings
         self.clan_settings = {}
@@ -292,6 +296,7 @@ class Clan:
         """Adds cat into the list of clan cats"""
         if cat.ID in Cat.all_cats and cat.ID not in self.clan_cats:
             self.clan_cats.append(cat.ID)
+            Cat.index.add(cat)
 
     def add_to_starclan(self, cat):  # Same as add_cat
         """
@@ -313,6 +318,7 @@ class Clan:
             if cat.ID in self.med_cat_list:
                 self.med_cat_list.remove(cat.ID)
                 self.med_cat_predecessors += 1
+            Cat.index.add(cat)
 
     def add_to_darkforest(self, cat):  # Same as add_cat
         """
@@ -328,6 +334,7 @@ class Clan:
             if cat.ID in self.med_cat_list:
                 self.med_cat_list.remove(cat.ID)
                 self.med_cat_predecessors += 1
+            Cat.index.add(cat)
             # update_sprite(Cat.all_cats[str(cat)])
             # The dead-value must be set to True before the cat can go to starclan
 
@@ -346,6 +353,7 @@ class Clan:
             if cat.ID in self.med_cat_list:
                 self.med_cat_list.remove(cat.ID)
                 self.med_cat_predecessors += 1
+            Cat.index.add(cat)
 
     def add_to_clan(self, cat):
         """
@@ -360,6 +368,7 @@ class Clan:
             # The outside-value must be set to True before the cat can go to cotc
             Cat.outside_cats.pop(cat.ID)
             cat.clan = str(game.clan.name)
+            Cat.index.add(cat)
 
     def add_to_outside(self, cat):  # same as add_cat
         """
@@ -369,6 +378,7 @@ class Clan:
         if cat.ID in Cat.all_cats and cat.outside and cat.ID not in Cat.outside_cats:
             # The outside-value must be set to True before the cat can go to cotc
             Cat.outside_cats.update({cat.ID: cat})
+            Cat.index.add(cat)
 
     def remove_cat(self, ID):  # ID is cat.ID
         """
@@ -379,6 +389,9 @@ class Clan:
         if Cat.all_cats[ID] in Cat.all_cats_list:
             Cat.all_cats_list.remove(Cat.all_cats[ID])
 
+        Cat.index.remove(Cat.all_cats[ID])
+        family_graph.remove(Cat.all_cats[ID])
+
         if ID in Cat.all_cats:
             Cat.all_cats.pop(ID)
 
@@ -485,6 +498,7 @@ class Clan:
             "version_commit": get_version_info().version_number,
             "source_build": get_version_info().is_source_build,
             "custom_pronouns": self.custom_pronouns,
+            "seed": self.seed,
         }
 
         # LEADER DATA
@@ -568,6 +582,8 @@ class Clan:
         """
         TODO: DOCS
         """
+        # the save being loaded may still be being written
+        game.save_queue.wait()
 
         version_info = None
         if os.path.exists(
@@ -774,12 +790,9 @@ class Clan:
             return
 
         game.switches["error_message"] = "There was an error loading the clan.json"
-        with open(
-            get_save_dir() + "/" + game.switches["clan_list"][0] + "clan.json",
-            "r",
-            encoding="utf-8",
-        ) as read_file:  # pylint: disable=redefined-outer-name
-            clan_data = ujson.loads(read_file.read())
+        clan_data = load_save_file(
+            get_save_dir() + "/" + game.switches["clan_list"][0] + "clan.json"
+        )
 
         if clan_data["leader"]:
             leader = Cat.all_cats[clan_data["leader"]]
@@ -896,6 +909,7 @@ class Clan:
                 for cat in clan_data["faded_cats"].split(","):
                     game.clan.faded_ids.append(cat)
 
+        game.clan.seed = clan_data.get("seed")
         game.clan.last_focus_change = clan_data.get("last_focus_change")
         game.clan.clans_in_focus = clan_data.get("clans_in_focus", [])
 
@@ -928,12 +942,9 @@ class Clan:
         if os.path.exists(
             get_save_dir() + f'/{game.switches["clan_list"][0]}/clan_settings.json'
         ):
-            with open(
-                get_save_dir() + f'/{game.switches["clan_list"][0]}/clan_settings.json',
-                "r",
-                encoding="utf-8",
-            ) as write_file:
-                _load_settings = ujson.loads(write_file.read())
+            _load_settings = load_save_file(
+                get_save_dir() + f'/{game.switches["clan_list"][0]}/clan_settings.json'
+            )
 
         for key, value in _load_settings.items():
             if key in self.clan_settings:
@@ -947,10 +958,7 @@ class Clan:
             return
         file_path = get_save_dir() + f"/{game.clan.name}/pregnancy.json"
         if os.path.exists(file_path):
-            with open(
-                file_path, "r", encoding="utf-8"
-            ) as read_file:  # pylint: disable=redefined-outer-name
-                clan.pregnancy_data = ujson.load(read_file)
+            clan.pregnancy_data = load_save_file(file_path)
         else:
             clan.pregnancy_data = {}
 
@@ -975,28 +983,25 @@ class Clan:
         file_path = get_save_dir() + f"/{game.clan.name}/disasters/primary.json"
         try:
             if os.path.exists(file_path):
-                with open(
-                    file_path, "r", encoding="utf-8"
-                ) as read_file:  # pylint: disable=redefined-outer-name
-                    disaster = ujson.load(read_file)
-                    if disaster:
-                        clan.primary_disaster = OngoingEvent(
-                            event=disaster["event"],
-                            tags=disaster["tags"],
-                            duration=disaster["duration"],
-                            current_duration=(
-                                disaster["current_duration"]
-                                if "current_duration"
-                                else disaster["duration"]
-                            ),  # pylint: disable=using-constant-test
-                            trigger_events=disaster["trigger_events"],
-                            progress_events=disaster["progress_events"],
-                            conclusion_events=disaster["conclusion_events"],
-                            secondary_disasters=disaster["secondary_disasters"],
-                            collateral_damage=disaster["collateral_damage"],
-                        )
-                    else:
-                        clan.primary_disaster = {}
+                disaster = load_save_file(file_path)
+                if disaster:
+                    clan.primary_disaster = OngoingEvent(
+                        event=disaster["event"],
+                        tags=disaster["tags"],
+                        duration=disaster["duration"],
+                        current_duration=(
+                            disaster["current_duration"]
+                            if "current_duration"
+                            else disaster["duration"]
+                        ),  # pylint: disable=using-constant-test
+                        trigger_events=disaster["trigger_events"],
+                        progress_events=disaster["progress_events"],
+                        conclusion_events=disaster["conclusion_events"],
+                        secondary_disasters=disaster["secondary_disasters"],
+                        collateral_damage=disaster["collateral_damage"],
+                    )
+                else:
+                    clan.primary_disaster = {}
             else:
                 os.makedirs(get_save_dir() + f"/{game.clan.name}/disasters")
                 clan.primary_disaster = None
@@ -1009,24 +1014,23 @@ class Clan:
         file_path = get_save_dir() + f"/{game.clan.name}/disasters/secondary.json"
         try:
             if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as read_file:
-                    disaster = ujson.load(read_file)
-                    if disaster:
-                        clan.secondary_disaster = OngoingEvent(
-                            event=disaster["event"],
-                            tags=disaster["tags"],
-                            duration=disaster["duration"],
-                            current_duration=(
-                                disaster["current_duration"]
-                                if "current_duration"
-                                else disaster["duration"]
-                            ),  # pylint: disable=using-constant-test
-                            progress_events=disaster["progress_events"],
-                            conclusion_events=disaster["conclusion_events"],
-                            collateral_damage=disaster["collateral_damage"],
-                        )
-                    else:
-                        clan.secondary_disaster = {}
+                disaster = load_save_file(file_path)
+                if disaster:
+                    clan.secondary_disaster = OngoingEvent(
+                        event=disaster["event"],
+                        tags=disaster["tags"],
+                        duration=disaster["duration"],
+                        current_duration=(
+                            disaster["current_duration"]
+                            if "current_duration"
+                            else disaster["duration"]
+                        ),  # pylint: disable=using-constant-test
+                        progress_events=disaster["progress_events"],
+                        conclusion_events=disaster["conclusion_events"],
+                        collateral_damage=disaster["collateral_damage"],
+                    )
+                else:
+                    clan.secondary_disaster = {}
             else:
                 os.makedirs(get_save_dir() + f"/{game.clan.name}/disasters")
                 clan.secondary_disaster = None
@@ -1097,21 +1101,15 @@ class Clan:
         try:
             # load the old file path and convert the save data into current format
             if os.path.exists(old_file_path):
-                with open(
-                    old_file_path, "r", encoding="utf-8"
-                ) as save_file:
-                    herbs = ujson.load(save_file)
-                    clan.herb_supply = HerbSupply()
-                    clan.herb_supply.convert_old_save(herbs)
+                herbs = load_save_file(old_file_path)
+                clan.herb_supply = HerbSupply()
+                clan.herb_supply.convert_old_save(herbs)
 
             # load the current file path, if it exists in save
             elif os.path.exists(current_file_path):
-                with open(
-                    current_file_path, "r", encoding="utf-8"
-                ) as save_file:
-                    herbs = ujson.load(save_file)
-                    clan.herb_supply = HerbSupply(herb_supply=herbs["storage"])
-                    clan.herb_supply.collected = herbs["collected"]
+                herbs = load_save_file(current_file_path)
+                clan.herb_supply = HerbSupply(herb_supply=herbs["storage"])
+                clan.herb_supply.collected = herbs["collected"]
 
             # else just start us with an empty herb supply
             else:
@@ -1147,24 +1145,20 @@ class Clan:
         file_path = get_save_dir() + f"/{game.clan.name}/freshkill_pile.json"
         try:
             if os.path.exists(file_path):
-                with open(
-                    file_path, "r", encoding="utf-8"
-                ) as read_file:  # pylint: disable=redefined-outer-name
-                    pile = ujson.load(read_file)
-                    clan.freshkill_pile = FreshkillPile(pile)
+                pile = load_save_file(file_path)
+                clan.freshkill_pile = FreshkillPile(pile)
 
                 file_path = get_save_dir() + f"/{game.clan.name}/nutrition_info.json"
                 if os.path.exists(file_path) and clan.freshkill_pile:
-                    with open(file_path, "r", encoding="utf-8") as read_file:
-                        nutritions = ujson.load(read_file)
-                        for k, nutr in nutritions.items():
-                            nutrition = Nutrition()
-                            nutrition.max_score = nutr["max_score"]
-                            nutrition.current_score = nutr["current_score"]
-                            clan.freshkill_pile.nutrition_info[k] = nutrition
-                        if len(nutritions) <= 0:
-                            for cat in Cat.all_cats_list:
-                                clan.freshkill_pile.add_cat_to_nutrition(cat)
+                    nutritions = load_save_file(file_path)
+                    for k, nutr in nutritions.items():
+                        nutrition = Nutrition()
+                        nutrition.max_score = nutr["max_score"]
+                        nutrition.current_score = nutr["current_score"]
+                        clan.freshkill_pile.nutrition_info[k] = nutrition
+                    if len(nutritions) <= 0:
+                        for cat in Cat.all_cats_list:
+                            clan.freshkill_pile.add_cat_to_nutrition(cat)
             else:
                 clan.freshkill_pile = FreshkillPile()
         except:
@@ -3,8 +3,11 @@ from typing import List
 from scripts.debug_commands.cat import CatsCommand
 from scripts.debug_commands.command import Command
 from scripts.debug_commands.eval import EvalCommand, UnderstandRisksCommand
+from scripts.debug_commands.events import EventsCommand
 from scripts.debug_commands.fps import FpsCommand
 from scripts.debug_commands.help import HelpCommand
+from scripts.debug_commands.moon import MoonTimingsCommand
+from scripts.debug_commands.seed import SeedCommand
 from scripts.debug_commands.settings import ToggleCommand, SetCommand, GetCommand
 from scripts.debug_commands.cat_pregnancy import PregnanciesCommand
 
@@ -15,7 +18,10 @@ commandList: List[Command] = [
     EvalCommand(),
     FpsCommand(),
     CatsCommand(),
-    PregnanciesCommand()
+    PregnanciesCommand(),
+    MoonTimingsCommand(),
+    EventsCommand(),
+    SeedCommand(),
 ]
 
 helpCommand = HelpCommand(commandList)
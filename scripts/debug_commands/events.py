@@ -0,0 +1,46 @@
+from typing import List
+
+from scripts.cat.thoughts import Thoughts
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.events_module.generate_events import GenerateEvents
+from scripts.events_module.patrol.patrol_catalog import patrol_catalog
+from scripts.game_structure.localization import clear_lang_resource_cache
+
+
+class EventStatsCommand(Command):
+    name = "stats"
+    description = "Show how many events and patrols are loaded and how often they were reused"
+    aliases = ["s"]
+
+    def callback(self, args: List[str]):
+        for key, value in GenerateEvents.get_loaded_events_info().items():
+            add_output_line_to_log(f"{key}: {value}")
+        for key, value in patrol_catalog.get_info().items():
+            add_output_line_to_log(f"patrol {key}: {value}")
+
+
+class ReloadEventsCommand(Command):
+    name = "reload"
+    description = "Forget the loaded events, patrols and thoughts, so changed or modded files are read again"
+    aliases = ["r"]
+
+    def callback(self, args: List[str]):
+        GenerateEvents.clear_loaded_events()
+        patrol_catalog.clear()
+        Thoughts.clear_thought_pools()
+        clear_lang_resource_cache()
+        add_output_line_to_log("Loaded events, patrols and thoughts cleared")
+
+
+class EventsCommand(Command):
+    name = "events"
+    description = "Manage the events and patrols loaded from the resource files"
+
+    sub_commands = [
+        EventStatsCommand(),
+        ReloadEventsCommand(),
+    ]
+
+    def callback(self, args: List[str]):
+        self.sub_commands[0].callback(args)
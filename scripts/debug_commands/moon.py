@@ -0,0 +1,78 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.events import events_class
+from scripts.game_structure.game_essentials import game
+
+
+class LastMoonTimingsCommand(Command):
+    name = "last"
+    description = "Show how long each stage of the last moon took"
+    aliases = ["l"]
+
+    def callback(self, args: List[str]):
+        if not events_class.moon_timings.moons:
+            add_output_line_to_log("No moons have been skipped yet")
+            return
+        for line in events_class.moon_timings.get_breakdown():
+            add_output_line_to_log(line)
+
+
+class TotalMoonTimingsCommand(Command):
+    name = "total"
+    description = "Show how long each stage took, summed over all moons since the last reset"
+    aliases = ["t"]
+
+    def callback(self, args: List[str]):
+        if not events_class.moon_timings.moons:
+            add_output_line_to_log("No moons have been skipped yet")
+            return
+        for line in events_class.moon_timings.get_breakdown(total=True):
+            add_output_line_to_log(line)
+
+
+class ResetMoonTimingsCommand(Command):
+    name = "reset"
+    description = "Reset the moon timings"
+    aliases = ["r"]
+
+    def callback(self, args: List[str]):
+        events_class.moon_timings.reset()
+        add_output_line_to_log("Moon timings reset")
+
+
+class ReportMoonTimingsCommand(Command):
+    name = "report"
+    description = "Toggle writing a JSON timing report to the logs folder after every moon"
+    usage = "[on|off]"
+
+    def callback(self, args: List[str]):
+        if len(args) == 0:
+            game.debug_settings["moontimings"] = not game.debug_settings["moontimings"]
+        elif args[0].lower() in ["on", "true", "1"]:
+            game.debug_settings["moontimings"] = True
+        elif args[0].lower() in ["off", "false", "0"]:
+            game.debug_settings["moontimings"] = False
+        else:
+            add_output_line_to_log(f"Invalid value, {args[0]}")
+            return
+        add_output_line_to_log(
+            f"Moon timing reports {'on' if game.debug_settings['moontimings'] else 'off'}"
+        )
+
+
+class MoonTimingsCommand(Command):
+    name = "timings"
+    description = "Show how long the stages of the moon skip take"
+    aliases = ["moontimings"]
+
+    sub_commands = [
+        LastMoonTimingsCommand(),
+        TotalMoonTimingsCommand(),
+        ResetMoonTimingsCommand(),
+        ReportMoonTimingsCommand(),
+    ]
+
+    def callback(self, args: List[str]):
+        self.sub_commands[0].callback(args)
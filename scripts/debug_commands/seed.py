@@ -0,0 +1,36 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure import rng
+from scripts.game_structure.game_essentials import game
+
+
+class SeedCommand(Command):
+    name = "seed"
+    description = "Show or set the Clan's seed. While it has one, every moon can be replayed exactly"
+    usage = "[<number>|new|off]"
+
+    def callback(self, args: List[str]):
+        if not game.clan:
+            add_output_line_to_log("No Clan is loaded")
+            return
+
+        if len(args) == 0:
+            pass
+        elif args[0] == "new":
+            game.clan.seed = rng.new_seed()
+        elif args[0] == "off":
+            game.clan.seed = None
+        elif args[0].isnumeric() and int(args[0]) <= rng.MAX_SEED:
+            game.clan.seed = int(args[0])
+        else:
+            add_output_line_to_log(f"Usage: {self.name} {self.usage}")
+            return
+
+        if game.clan.seed is None:
+            add_output_line_to_log("The Clan has no seed")
+        else:
+            add_output_line_to_log(
+                f"Seed: {game.clan.seed}, saved with the Clan when it is next saved"
+            )
@@ -24,13 +24,14 @@ from scripts.conditions import (
 )
 from scripts.event_class import Single_Event
 from scripts.events_module.short.condition_events import Condition_Events
-from scripts.events_module.generate_events import GenerateEvents, generate_events
+from scripts.events_module.generate_events import generate_events
+from scripts.events_module.moon_stages import MoonStage, CatMoonStage, MoonTimings
 from scripts.events_module.short.handle_short_events import handle_short_events
 from scripts.events_module.outsider_events import OutsiderEvents
 from scripts.events_module.relationship.relation_events import Relation_Events
 from scripts.events_module.relationship.pregnancy_events import Pregnancy_Events
 from scripts.game_structure.game_essentials import game
-from scripts.game_structure.windows import SaveError
+from scripts.game_structure.rng import seed_moon
 from scripts.events_module.patrol.patrol import Patrol
 from scripts.utility import (
     change_clan_relations,
@@ -67,11 +68,43 @@ class Events:
     def __init__(self):
         self.load_ceremonies()
         self.load_war_resources()
+        self.moon_stages = self.build_moon_stages()
+        self.moon_timings = MoonTimings(self.moon_stages)
 
     def one_moon(self):
         """
-        Handles the moon skipping of the whole Clan.
+        Handles the moon skipping of the whole Clan, by running each of the moon stages in order.
         """
+        self.moon_timings.start_moon()
+        for stage in self.moon_stages:
+            if stage.run():
+                break
+        self.moon_timings.finish_moon()
+
+    def build_moon_stages(self):
+        """Returns the stages of the moon skip, in the order they are run."""
+        return [
+            MoonStage("start", self.start_moon),
+            MoonStage("freshkill", self.moon_freshkill),
+            MoonStage("lead den", self.moon_lead_den),
+            MoonStage("lost cats", self.moon_lost_cats),
+            CatMoonStage(
+                "cats", self.handle_cat_moon, lambda: Cat.all_cats.copy().values()
+            ),
+            MoonStage("grief", self.moon_grief),
+            MoonStage("deaths", self.moon_deaths),
+            MoonStage("freshkill warning", self.moon_freshkill_warning),
+            MoonStage("focus", self.handle_focus),
+            MoonStage("herb supply", self.moon_herb_supply),
+            MoonStage("medicine cats", self.moon_med_cat_warning),
+            MoonStage("promotions", self.moon_promotions),
+            MoonStage("sort", self.moon_sort),
+            MoonStage("autosave", self.moon_autosave),
+        ]
+
+    def start_moon(self):
+        """Resets the per-moon state, ages up the Clan and sets the current season."""
+        seed_moon(game.clan.seed, game.clan.age)
         game.cur_events_list = []
         game.herb_events_list = []
         game.freshkill_events_list = []
@@ -107,155 +140,160 @@ class Events:
         Pregnancy_Events.handle_pregnancy_age(game.clan)
         self.check_war()
 
+    def moon_freshkill(self):
+        """Feeds the cats and adds the moon's auto freshkill."""
         if (
             game.clan.game_mode in ["expanded", "cruel season"]
             and game.clan.freshkill_pile
         ):
             # feed the cats and update the nutrient status
-            relevant_cats = list(
-                filter(
-                    lambda _cat: _cat.is_alive()
-                    and not _cat.exiled
-                    and not _cat.outside,
-                    Cat.all_cats.values(),
-                )
-            )
+            relevant_cats = Cat.index.get_cats()
             game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
             # get the moonskip freshkill
             self.get_moon_freshkill()
 
-        # Adding in any potential lead den events that have been saved
+    def moon_lead_den(self):
+        """Adding in any potential lead den events that have been saved"""
         if "lead_den_interaction" in game.clan.clan_settings:
             if game.clan.clan_settings["lead_den_interaction"]:
                 self.handle_lead_den_event()
 
-        # checking if a lost cat returns on their own
+    def moon_lost_cats(self):
+        """checking if a lost cat returns on their own"""
         rejoin_upperbound = game.config["lost_cat"]["rejoin_chance"]
         if random.randint(1, rejoin_upperbound) == 1:
             self.handle_lost_cats_return()
 
-        # Calling of "one_moon" functions.
-        for cat in Cat.all_cats.copy().values():
-            if not cat.outside or cat.dead:
-                self.one_moon_cat(cat)
-            else:
-                self.one_moon_outside_cat(cat)
-
-        # keeping this commented out till disasters are more polished
-        # self.disaster_events.handle_disasters()
-
-        # Handle grief events.
-        if Cat.grief_strings:
-            # Grab all the dead or outside cats, who should not have grief text
-            for ID in Cat.grief_strings.copy():
-                check_cat = Cat.all_cats.get(ID)
-                if isinstance(check_cat, Cat):
-                    if check_cat.dead or check_cat.outside:
-                        Cat.grief_strings.pop(ID)
-
-            # Generate events
-
-            for cat_id, values in Cat.grief_strings.items():
-                for _val in values:
-                    if _val[2] == "minor":
-                        # Apply the grief message as a thought to the cat
-                        text = event_text_adjust(
-                            Cat,
-                            _val[0],
-                            main_cat=Cat.fetch_cat(cat_id),
-                            random_cat=Cat.fetch_cat(_val[1][0]),
-                        )
+    def handle_cat_moon(self, cat):
+        """Calls the right "one_moon" function for the cat."""
+        if not cat.outside or cat.dead:
+            self.one_moon_cat(cat)
+        else:
+            self.one_moon_outside_cat(cat)
 
-                        Cat.fetch_cat(cat_id).thought = text
-                    else:
-                        game.cur_events_list.append(
-                            Single_Event(_val[0], ["birth_death", "relation"], _val[1])
-                        )
+    def moon_grief(self):
+        """Handle grief events."""
+        if not Cat.grief_strings:
+            return
 
-            Cat.grief_strings.clear()
+        # Grab all the dead or outside cats, who should not have grief text
+        for ID in Cat.grief_strings.copy():
+            check_cat = Cat.all_cats.get(ID)
+            if isinstance(check_cat, Cat):
+                if check_cat.dead or check_cat.outside:
+                    Cat.grief_strings.pop(ID)
+
+        # Generate events
+
+        for cat_id, values in Cat.grief_strings.items():
+            for _val in values:
+                if _val[2] == "minor":
+                    # Apply the grief message as a thought to the cat
+                    text = event_text_adjust(
+                        Cat,
+                        _val[0],
+                        main_cat=Cat.fetch_cat(cat_id),
+                        random_cat=Cat.fetch_cat(_val[1][0]),
+                    )
 
-        if Cat.dead_cats:
-            ghost_names = []
-            shaken_cats = []
-            extra_event = None
-            for ghost in Cat.dead_cats:
-                ghost_names.append(str(ghost.name))
-            insert = adjust_list_text(ghost_names)
+                    Cat.fetch_cat(cat_id).thought = text
+                else:
+                    game.cur_events_list.append(
+                        Single_Event(_val[0], ["birth_death", "relation"], _val[1])
+                    )
 
-            if len(Cat.dead_cats) > 1:
-                event = i18n.t(
-                    "hardcoded.event_deaths", count=len(Cat.dead_cats), insert=insert
-                )
+        Cat.grief_strings.clear()
 
-                if len(ghost_names) > 2:
-                    alive_cats = list(
-                        filter(
-                            lambda kitty: (
-                                kitty.status != "leader"
-                                and not kitty.dead
-                                and not kitty.outside
-                                and not kitty.exiled
-                            ),
-                            Cat.all_cats.values(),
-                        )
-                    )
-                    # finds a percentage of the living Clan to become shaken
+    def moon_deaths(self):
+        """
+        Creates the event listing the cats that died this moon.
+        Returns True if there are no living cats left, which ends the moon.
+        """
+        if not Cat.dead_cats:
+            return
 
-                    if len(alive_cats) == 0:
-                        return
-                    else:
-                        shaken_cats = random.sample(
-                            alive_cats,
-                            k=max(
-                                int((len(alive_cats) * random.randint(4, 6)) / 100),
-                                1,
-                            ),
-                        )
+        ghost_names = []
+        shaken_cats = []
+        extra_event = None
+        for ghost in Cat.dead_cats:
+            ghost_names.append(str(ghost.name))
+        insert = adjust_list_text(ghost_names)
 
-                    shaken_cat_names = []
-                    for cat in shaken_cats:
-                        shaken_cat_names.append(str(cat.name))
-                        cat.get_injured(
-                            "shock",
-                            event_triggered=False,
-                            lethal=False,
-                            severity="minor",
-                        )
+        if len(Cat.dead_cats) > 1:
+            event = i18n.t(
+                "hardcoded.event_deaths", count=len(Cat.dead_cats), insert=insert
+            )
 
-                    insert = adjust_list_text(shaken_cat_names)
+            if len(ghost_names) > 2:
+                alive_cats = list(
+                    filter(
+                        lambda kitty: (
+                            kitty.status != "leader"
+                            and not kitty.dead
+                            and not kitty.outside
+                            and not kitty.exiled
+                        ),
+                        Cat.all_cats.values(),
+                    )
+                )
+                # finds a percentage of the living Clan to become shaken
 
-                    extra_event = i18n.t(
-                        "hardcoded.event_shaken_grief",
-                        count=len(shaken_cat_names),
-                        insert=insert,
+                if len(alive_cats) == 0:
+                    return True
+                else:
+                    shaken_cats = random.sample(
+                        alive_cats,
+                        k=max(
+                            int((len(alive_cats) * random.randint(4, 6)) / 100),
+                            1,
+                        ),
                     )
 
-            else:
-                event = i18n.t("hardcoded.event_deaths", count=1)
+                shaken_cat_names = []
+                for cat in shaken_cats:
+                    shaken_cat_names.append(str(cat.name))
+                    cat.get_injured(
+                        "shock",
+                        event_triggered=False,
+                        lethal=False,
+                        severity="minor",
+                    )
 
+                insert = adjust_list_text(shaken_cat_names)
+
+                extra_event = i18n.t(
+                    "hardcoded.event_shaken_grief",
+                    count=len(shaken_cat_names),
+                    insert=insert,
+                )
+
+        else:
+            event = i18n.t("hardcoded.event_deaths", count=1)
+
+        game.cur_events_list.append(
+            Single_Event(
+                event,
+                ["birth_death"],
+                [i.ID for i in Cat.dead_cats],
+                cat_dict={"m_c": Cat.dead_cats[0]}
+                if len(Cat.dead_cats) == 1
+                else None,
+            )
+        )
+        if extra_event:
             game.cur_events_list.append(
                 Single_Event(
-                    event,
-                    ["birth_death"],
-                    [i.ID for i in Cat.dead_cats],
-                    cat_dict={"m_c": Cat.dead_cats[0]}
-                    if len(Cat.dead_cats) == 1
-                    else None,
+                    extra_event, ["birth_death"], [i.ID for i in shaken_cats]
                 )
             )
-            if extra_event:
-                game.cur_events_list.append(
-                    Single_Event(
-                        extra_event, ["birth_death"], [i.ID for i in shaken_cats]
-                    )
-                )
-            Cat.dead_cats.clear()
+        Cat.dead_cats.clear()
 
+    def moon_freshkill_warning(self):
+        """make a notification if the Clan does not have enough prey"""
         if (
             game.clan.game_mode in ["expanded", "cruel season"]
             and game.clan.freshkill_pile
         ):
-            # make a notification if the Clan does not have enough prey
             if (
                 FRESHKILL_EVENT_ACTIVE
                 and not game.clan.freshkill_pile.clan_has_enough_food()
@@ -264,9 +302,8 @@ class Events:
                 game.cur_events_list.insert(0, Single_Event(event_string))
                 game.freshkill_event_list.append(event_string)
 
-        self.handle_focus()
-
-        # handle the herb supply for the moon
+    def moon_herb_supply(self):
+        """handle the herb supply for the moon"""
         game.clan.herb_supply.handle_moon(
             clan_size=get_living_clan_cat_count(Cat),
             clan_cats=Cat.all_cats_list,
@@ -277,6 +314,8 @@ class Events:
             )
         )
 
+    def moon_med_cat_warning(self):
+        """make a notification if the Clan does not have enough medicine cats"""
         if game.clan.game_mode in ["expanded", "cruel season"]:
             amount_per_med = get_amount_cat_for_one_medic(game.clan)
             med_fulfilled = medical_cats_condition_fulfilled(
@@ -297,28 +336,27 @@ class Events:
                 string = i18n.t("defaults.warn_no_medcats")
                 game.cur_events_list.insert(0, Single_Event(string, "health"))
 
+    def moon_promotions(self):
+        """Promote leader and deputy, if needed."""
         # Clear the list of cats that died this moon.
         game.just_died.clear()
 
-        # Promote leader and deputy, if needed.
         self.check_and_promote_leader()
         self.check_and_promote_deputy()
 
-        # Resort
+    def moon_sort(self):
+        """Resort"""
         if game.sort_type != "id":
             Cat.sort_cats()
 
-        # Clear all the loaded event dicts.
-        GenerateEvents.clear_loaded_events()
-
-        # autosave
+    def moon_autosave(self):
+        """autosave"""
         if game.clan.clan_settings.get("autosave") and game.clan.age % 5 == 0:
             try:
-                game.save_cats()
-                game.clan.save_clan()
-                game.clan.save_pregnancy(game.clan)
-                game.save_events()
+                game.save_game()
             except:
+                from scripts.game_structure.windows import SaveError
+
                 SaveError(traceback.format_exc())
 
     def handle_lead_den_event(self):
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: ascii -*-
 import random
+from collections import OrderedDict
+from copy import copy
 
 import i18n
 import ujson
@@ -22,6 +24,7 @@ from scripts.utility import (
     get_living_clan_cat_count,
 )
 from scripts.game_structure.localization import load_lang_resource
+from scripts.weighted_sampler import WeightedSampler
 
 
 def get_resource_directory(fallback=False):
@@ -34,7 +37,15 @@ def get_resource_directory(fallback=False):
 
 
 class GenerateEvents:
-    loaded_events = {}
+    # events loaded from the resource files, by locale and file. These are kept between moons and only
+    # dropped when the locale or biome changes, when the budget is exceeded, or on clear_loaded_events
+    loaded_events = OrderedDict()
+    loaded_events_locale = None
+    loaded_events_biome = None
+    loaded_events_count = 0
+    loaded_events_stats = {"hits": 0, "misses": 0, "evictions": 0}
+    # short events that fit the Clan's location and season, by locale, event type, biome, camp, season and sub types
+    short_event_buckets = {}
 
     INJURY_DISTRIBUTION = None
     with open(
@@ -102,17 +113,90 @@ class GenerateEvents:
 
         return events
 
+    # ---------------------------------------------------------------------------- #
+    #                                 event catalog                                #
+    # ---------------------------------------------------------------------------- #
+
     @staticmethod
     def clear_loaded_events():
-        GenerateEvents.loaded_events = {}
+        """Forgets every loaded event, so they are read from the resource files again on next use."""
+        GenerateEvents.loaded_events = OrderedDict()
+        GenerateEvents.loaded_events_count = 0
+        GenerateEvents.short_event_buckets = {}
+
+    @staticmethod
+    def check_loaded_events():
+        """Clears the loaded events if the locale or the Clan's biome changed since they were loaded."""
+        locale = i18n.config.get("locale")
+        biome = game.clan.biome if game.clan else None
+        if (
+            locale != GenerateEvents.loaded_events_locale
+            or biome != GenerateEvents.loaded_events_biome
+        ):
+            GenerateEvents.clear_loaded_events()
+            GenerateEvents.loaded_events_locale = locale
+            GenerateEvents.loaded_events_biome = biome
+
+    @staticmethod
+    def get_loaded_events(file_path):
+        """Returns the loaded events of a file in the current locale, or None if it isn't loaded."""
+        key = (i18n.config.get("locale"), file_path)
+        events = GenerateEvents.loaded_events.get(key)
+        if events is None:
+            GenerateEvents.loaded_events_stats["misses"] += 1
+            return None
+        GenerateEvents.loaded_events_stats["hits"] += 1
+        GenerateEvents.loaded_events.move_to_end(key)
+        return events
+
+    @staticmethod
+    def store_loaded_events(file_path, events):
+        """
+        Keeps the events of a file for later use. If more events are loaded than the budget in the game
+        config allows, the files that were used least recently are dropped, along with the short event
+        buckets made from them.
+        """
+        key = (i18n.config.get("locale"), file_path)
+        loaded = GenerateEvents.loaded_events
+        if key in loaded:
+            GenerateEvents.loaded_events_count -= len(loaded.pop(key))
+        loaded[key] = events
+        GenerateEvents.loaded_events_count += len(events)
+
+        budget = game.config["event_generation"]["loaded_events_budget"]
+        while GenerateEvents.loaded_events_count > budget and len(loaded) > 1:
+            (locale, dropped_path), dropped = loaded.popitem(last=False)
+            GenerateEvents.loaded_events_count -= len(dropped)
+            GenerateEvents.loaded_events_stats["evictions"] += 1
+
+            # the buckets hold the dropped events too, so they would stay in memory otherwise
+            event_type = dropped_path.rpartition("/")[0]
+            GenerateEvents.short_event_buckets = {
+                bucket_key: bucket
+                for bucket_key, bucket in GenerateEvents.short_event_buckets.items()
+                if bucket_key[:2] != (locale, event_type)
+            }
+
+    @staticmethod
+    def get_loaded_events_info():
+        """Returns how many files and events are loaded, and how often the loaded events were reused."""
+        return {
+            "locale": GenerateEvents.loaded_events_locale,
+            "biome": GenerateEvents.loaded_events_biome,
+            "files": len(GenerateEvents.loaded_events),
+            "events": GenerateEvents.loaded_events_count,
+            "buckets": len(GenerateEvents.short_event_buckets),
+            **GenerateEvents.loaded_events_stats,
+        }
 
     @staticmethod
     def generate_short_events(event_triggered, biome):
         file_path = f"{event_triggered}/{biome}.json"
 
         try:
-            if file_path in GenerateEvents.loaded_events:
-                return GenerateEvents.loaded_events[file_path]
+            event_list = GenerateEvents.get_loaded_events(file_path)
+            if event_list is not None:
+                return event_list
             else:
                 events_dict = GenerateEvents.get_short_event_dicts(file_path)
 
@@ -130,6 +214,16 @@ class GenerateEvents:
                         print(
                             f"WARNING: some events resources which are used in generate_events have no 'event_text'."
                         )
+                    if event.get("history") and (
+                        not isinstance(event["history"], list)
+                        or "cats" not in event["history"][0]
+                    ):
+                        print(f"{event.get('event_id')} history formatted incorrectly")
+                    if event.get("injury") and (
+                        not isinstance(event["injury"], list)
+                        or "cats" not in event["injury"][0]
+                    ):
+                        print(f"{event.get('event_id')} injury formatted incorrectly")
                     event = ShortEvent(
                         event_id=event["event_id"] if "event_id" in event else "",
                         location=event["location"] if "location" in event else ["any"],
@@ -157,7 +251,7 @@ class GenerateEvents:
                     event_list.append(event)
 
                 # Add to loaded events.
-                GenerateEvents.loaded_events[file_path] = event_list
+                GenerateEvents.store_loaded_events(file_path, event_list)
                 return event_list
         except:
             print(f"WARNING: {file_path} was not found, check short event generation")
@@ -166,8 +260,10 @@ class GenerateEvents:
     def generate_ongoing_events(event_type, biome, specific_event=None):
         file_path = f"{get_resource_directory()}/{event_type}/{biome}.json"
 
-        if file_path in GenerateEvents.loaded_events:
-            return GenerateEvents.loaded_events[file_path]
+        event_list = GenerateEvents.get_loaded_events(file_path)
+        if event_list is not None and not specific_event:
+            # the loaded events are kept between moons, while the chosen disaster counts its duration up
+            return [copy(event) for event in event_list]
         else:
             events_dict = GenerateEvents.get_short_event_dicts(file_path)
 
@@ -190,7 +286,8 @@ class GenerateEvents:
                         collateral_damage=event["collateral_damage"],
                     )
                     event_list.append(event)
-                return event_list
+                GenerateEvents.store_loaded_events(file_path, event_list)
+                return [copy(event) for event in event_list]
             else:
                 event = None
                 for event in events_dict:
@@ -212,7 +309,33 @@ class GenerateEvents:
                 return event
 
     @staticmethod
-    def possible_short_events(event_type=None):
+    def possible_short_events(event_type=None, sub_types=None):
+        """
+        Returns the short events of the Clan's biome and the general events of a type.
+        :param event_type: The type of event
+        :param sub_types: If given, only return the events with exactly these sub types, which fit the Clan's
+            location and season. These are worked out once and then reused for every cat.
+        """
+        if sub_types is not None:
+            key = (
+                i18n.config.get("locale"),
+                event_type,
+                game.clan.biome,
+                game.clan.camp_bg,
+                game.clan.current_season,
+                frozenset(sub_types),
+            )
+            if key not in GenerateEvents.short_event_buckets:
+                GenerateEvents.short_event_buckets[key] = [
+                    event
+                    for event in GenerateEvents.possible_short_events(event_type)
+                    if set(event.sub_type) == key[-1]
+                    and event_for_location(event.location)
+                    and event_for_season(event.season)
+                ]
+            return GenerateEvents.short_event_buckets[key]
+
+        GenerateEvents.check_loaded_events()
         event_list = []
 
         # skip the rest of the loading if there is an unrecognised biome
@@ -243,49 +366,17 @@ class GenerateEvents:
         freshkill_trigger_factor,
         sub_types=None,
     ):
-        final_events = []
-        incorrect_format = []
+        """
+        Returns the events that are possible for the given cats, in a sampler weighted by the event weights.
+        possible_events should come from possible_short_events with the same sub_types, as the sub types,
+        location and season of the events aren't checked again here.
+        """
+        final_events = WeightedSampler()
 
         # Chance to bypass the skill or trait requirements.
         trait_skill_bypass = 15
 
-        # check if generated event should be a war event
-        if "war" in sub_types and random.randint(1, 10) == 1:
-            sub_types.remove("war")
-
         for event in possible_events:
-            if event.history:
-                if (
-                    not isinstance(event.history, list)
-                    or "cats" not in event.history[0]
-                ):
-                    if (
-                        f"{event.event_id} history formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} history formatted incorrectly"
-                        )
-            if event.injury:
-                if not isinstance(event.injury, list) or "cats" not in event.injury[0]:
-                    if (
-                        f"{event.event_id} injury formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} injury formatted incorrectly"
-                        )
-
-            # check for event sub_type
-            if set(event.sub_type) != set(sub_types):
-                continue
-
-            if not event_for_location(event.location):
-                continue
-
-            if not event_for_season(event.season):
-                continue
-
             # check tags
             if not event_for_tags(event.tags, cat, random_cat):
                 continue
@@ -457,15 +548,13 @@ class GenerateEvents:
                 if discard:
                     continue
 
-            final_events.extend([event] * event.weight)
-
-        for notice in incorrect_format:
-            print(notice)
+            final_events.add(event, event.weight)
 
         return final_events
 
     @staticmethod
     def possible_ongoing_events(event_type=None, specific_event=None):
+        GenerateEvents.check_loaded_events()
         event_list = []
 
         if game.clan.biome not in game.clan.BIOME_TYPES:
@@ -0,0 +1,166 @@
+"""
+Named, instrumented stages of the moon skip.
+
+Events.one_moon runs a list of MoonStage objects in order. Every stage keeps track of how long it
+took and how many times its function was called, both for the last moon and since the counters
+were last reset, so it is easy to see which parts of a moon skip dominate on large Clans.
+"""
+
+import os
+from time import perf_counter
+from typing import Callable, Iterable, List, Optional
+
+from scripts.game_structure.game_essentials import game
+from scripts.housekeeping.datadir import get_log_dir
+
+
+class MoonStage:
+    """A single phase of the moon skip."""
+
+    def __init__(self, name: str, func: Callable[[], Optional[bool]]):
+        """
+        :param name: Name shown in the timing breakdown
+        :param func: Function that runs the stage. If it returns True, the rest of the moon is skipped.
+        """
+        self.name = name
+        self.func = func
+
+        self.moon_time = 0.0
+        self.moon_calls = 0
+        self.total_time = 0.0
+        self.total_calls = 0
+
+    def run(self) -> bool:
+        """Runs the stage, recording its timing. Returns True if the moon should end early."""
+        start = perf_counter()
+        calls_before = self.moon_calls
+        try:
+            return bool(self._call())
+        finally:
+            elapsed = perf_counter() - start
+            self.moon_time += elapsed
+            self.total_time += elapsed
+            self.total_calls += self.moon_calls - calls_before
+
+    def _call(self):
+        self.moon_calls += 1
+        return self.func()
+
+    def reset_moon(self):
+        """Clears the timings of the last moon, so stages that don't run this moon report nothing."""
+        self.moon_time = 0.0
+        self.moon_calls = 0
+
+    def reset(self):
+        """Clears the accumulated timings."""
+        self.moon_time = 0.0
+        self.moon_calls = 0
+        self.total_time = 0.0
+        self.total_calls = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "moon_time": self.moon_time,
+            "moon_calls": self.moon_calls,
+            "total_time": self.total_time,
+            "total_calls": self.total_calls,
+        }
+
+
+class CatMoonStage(MoonStage):
+    """A phase of the moon skip that runs once for every cat. Its call count is the number of cats handled."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[object], None],
+        get_cats: Callable[[], Iterable],
+    ):
+        """
+        :param name: Name shown in the timing breakdown
+        :param func: Function that is called with each cat
+        :param get_cats: Returns the cats to run the stage on. It is called fresh every moon.
+        """
+        super().__init__(name, func)
+        self.get_cats = get_cats
+
+    def _call(self):
+        for cat in self.get_cats():
+            self.moon_calls += 1
+            self.func(cat)
+
+
+class MoonTimings:
+    """Collects the timings of the moon stages and reports them."""
+
+    def __init__(self, stages: List[MoonStage]):
+        self.stages = stages
+        self.moons = 0
+        self.last_moon_time = 0.0
+        self.total_time = 0.0
+        self.last_clan_age = None
+        self._moon_start = None
+
+    def start_moon(self):
+        for stage in self.stages:
+            stage.reset_moon()
+        self._moon_start = perf_counter()
+
+    def finish_moon(self):
+        self.last_moon_time = perf_counter() - self._moon_start
+        self.total_time += self.last_moon_time
+        self.moons += 1
+        self.last_clan_age = game.clan.age if game.clan else None
+
+        if game.debug_settings.get("moontimings"):
+            self.write_report()
+
+    def reset(self):
+        self.moons = 0
+        self.last_moon_time = 0.0
+        self.total_time = 0.0
+        for stage in self.stages:
+            stage.reset()
+
+    def get_report(self) -> dict:
+        """Returns the timings of the last moon, and the totals since the last reset."""
+        return {
+            "clan": game.clan.name if game.clan else None,
+            "clan_age": self.last_clan_age,
+            "moons": self.moons,
+            "moon_time": self.last_moon_time,
+            "total_time": self.total_time,
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+    def get_breakdown(self, total=False) -> List[str]:
+        """
+        Returns a human-readable breakdown of the stage timings, slowest stage first.
+        :param total: If True, show the totals since the last reset rather than the last moon
+        """
+        if total:
+            overall = self.total_time
+            header = f"{self.moons} moons: {overall * 1000:.1f} ms"
+            rows = [(s.name, s.total_time, s.total_calls) for s in self.stages]
+        else:
+            overall = self.last_moon_time
+            header = f"Last moon: {overall * 1000:.1f} ms"
+            rows = [(s.name, s.moon_time, s.moon_calls) for s in self.stages]
+
+        lines = [header]
+        for name, seconds, calls in sorted(rows, key=lambda row: row[1], reverse=True):
+            share = (seconds / overall * 100) if overall else 0
+            lines.append(
+                f"  {name}: {seconds * 1000:.1f} ms ({share:.0f}%), {calls} calls"
+            )
+        return lines
+
+    def write_report(self):
+        """Writes the report of the last moon as JSON into the log folder."""
+        directory = get_log_dir() + "/moon_timings"
+        os.makedirs(directory, exist_ok=True)
+        clan_name = game.clan.name if game.clan else "no_clan"
+        game.safe_save(
+            f"{directory}/{clan_name}_moon_{self.last_clan_age}.json", self.get_report()
+        )
@@ -4,8 +4,8 @@ import random
 from copy import deepcopy
 from itertools import repeat
 from os.path import exists as path_exists
-from random import choice, randint, choices
-from typing import List, Tuple, Optional
+from random import choice, randint
+from typing import Dict, List, Tuple, Optional
 
 import i18n
 import pygame
@@ -15,6 +15,10 @@ from scripts.cat.cats import Cat
 from scripts.cat.enums import CatAgeEnum
 from scripts.clan import Clan
 from scripts.game_structure.game_essentials import game
+from scripts.events_module.patrol.patrol_catalog import (
+    build_patrol_events,
+    patrol_catalog,
+)
 from scripts.events_module.patrol.patrol_event import PatrolEvent
 from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
 from scripts.special_dates import get_special_date, contains_special_date_tag
@@ -28,7 +32,7 @@ from scripts.utility import (
     get_special_snippet_list,
     adjust_list_text,
 )
-from scripts.game_structure.localization import load_lang_resource
+from scripts.weighted_sampler import WeightedSampler
 
 # ---------------------------------------------------------------------------- #
 #                              PATROL CLASS START                              #
@@ -39,7 +43,8 @@ When adding new patrols, use \n to add a paragraph break in the text
 
 
 class Patrol:
-    used_patrols = []
+    # IDs of the patrols that already happened, in the order they happened. Kept as a dict for fast lookups
+    used_patrols: Dict[str, None] = {}
 
     def __init__(self):
         self.patrol_event: Optional[PatrolEvent] = None
@@ -57,27 +62,6 @@ class Patrol:
         # Holds new cats for easy access
         self.new_cats: List[List[Cat]] = []
 
-        # the patrols
-        self.HUNTING_SZN = None
-        self.HUNTING = None
-        self.TRAINING_SZN = None
-        self.TRAINING = None
-        self.BORDER_SZN = None
-        self.BORDER = None
-        self.MEDCAT_SZN = None
-        self.MEDCAT = None
-        self.NEW_CAT = None
-        self.NEW_CAT_HOSTILE = None
-        self.NEW_CAT_WELCOMING = None
-        self.OTHER_CLAN = None
-        self.OTHER_CLAN_HOSTILE = None
-        self.OTHER_CLAN_ALLIES = None
-        self.HUNTING_GEN = None
-        self.BORDER_GEN = None
-        self.TRAINING_GEN = None
-        self.MEDCAT_GEN = None
-        self.DISASTER = None
-
     def setup_patrol(self, patrol_cats: List[Cat], patrol_type: str) -> str:
         # Add cats
 
@@ -98,18 +82,18 @@ class Patrol:
         )
 
         if final_patrols:
-            normal_event_choice = choices(
-                final_patrols, weights=[x.weight for x in final_patrols]
-            )[0]
+            normal_event_choice = WeightedSampler(
+                final_patrols, [x.weight for x in final_patrols]
+            ).choice()
         else:
             print("ERROR: NO POSSIBLE NORMAL PATROLS FOUND for: ", self.patrol_statuses)
             raise RuntimeError
 
         romantic_event_choice = None
         if final_romance_patrols:
-            romantic_event_choice = choices(
+            romantic_event_choice = WeightedSampler(
                 final_romance_patrols, [x.weight for x in final_romance_patrols]
-            )[0]
+            ).choice()
 
         if romantic_event_choice and Patrol.decide_if_romantic(
             romantic_event_choice,
@@ -121,8 +105,10 @@ class Patrol:
             self.patrol_event = romantic_event_choice
         else:
             self.patrol_event = normal_event_choice
+        # the chosen patrol is shared with the patrol catalog, so run a copy of it
+        self.patrol_event = self.patrol_event.copy()
 
-        Patrol.used_patrols.append(self.patrol_event.patrol_id)
+        Patrol.used_patrols[self.patrol_event.patrol_id] = None
 
         return self.process_text(self.patrol_event.intro_text, None)
 
@@ -267,59 +253,28 @@ class Patrol:
             else game.clan.clan_settings["disasters"]
         )
         season = current_season.lower()
-        leaf = f"{season}"
-        biome_dir = f"{biome}/"
-        self.update_resources(biome_dir, leaf)
+        patrol_size = len(self.patrol_cats)
+        patrol_files = Patrol.get_patrol_files(f"{biome}/", season)
+
+        def add_patrols(*names):
+            for name in names:
+                possible_patrols.extend(
+                    patrol_catalog.get_patrols(
+                        patrol_files[name], biome, camp, season, patrol_size
+                    )
+                )
 
         possible_patrols = []
         # This is for debugging purposes, load-in *ALL* the possible patrols when debug_override_patrol_stat_requirements is true. (May require longer loading time)
         if game.config["patrol_generation"]["debug_override_patrol_stat_requirements"]:
             leaves = ["greenleaf", "leaf-bare", "leaf-fall", "newleaf", "any"]
-            for biome in game.clan.BIOME_TYPES:
+            for debug_biome in game.clan.BIOME_TYPES:
                 for leaf in leaves:
-                    biome_dir = f"{biome.lower()}/"
-                    self.update_resources(biome_dir, leaf)
-                    possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_SZN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_GEN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                    )
+                    for name, location in Patrol.get_patrol_files(
+                        f"{debug_biome.lower()}/", leaf
+                    ).items():
+                        if name not in ("NEW_CAT", "OTHER_CLAN"):
+                            possible_patrols.extend(patrol_catalog.get_file(location))
 
         # this next one is needed for Classic specifically
         patrol_type = (
@@ -327,7 +282,6 @@ class Patrol:
             if ["medicine cat", "medicine cat apprentice"] in self.patrol_status_list
             else patrol_type
         )
-        patrol_size = len(self.patrol_cats)
         reputation = game.clan.reputation  # reputation with outsiders
         other_clan = self.other_clan
         clan_relations = int(other_clan.relations) if other_clan else 0
@@ -373,49 +327,43 @@ class Patrol:
             welcoming_rep = True
             chance = welcoming_chance
 
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_GEN))
+        add_patrols(
+            "HUNTING",
+            "HUNTING_SZN",
+            "BORDER",
+            "BORDER_SZN",
+            "TRAINING",
+            "TRAINING_SZN",
+            "MEDCAT",
+            "MEDCAT_SZN",
+            "HUNTING_GEN",
+            "BORDER_GEN",
+            "TRAINING_GEN",
+            "MEDCAT_GEN",
+        )
 
         if game_setting_disaster:
             dis_chance = int(random.getrandbits(3))  # disaster patrol chance
             if dis_chance == 1:
-                possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
+                add_patrols("DISASTER")
 
         # new cat patrols
         if chance == 1:
             if welcoming_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                )
+                add_patrols("NEW_CAT_WELCOMING")
             elif neutral_rep:
-                possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
+                add_patrols("NEW_CAT")
             elif hostile_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                )
+                add_patrols("NEW_CAT_HOSTILE")
 
         # other Clan patrols
         if other_clan_chance == 1:
             if clan_neutral:
-                possible_patrols.extend(self.generate_patrol_events(self.OTHER_CLAN))
+                add_patrols("OTHER_CLAN")
             elif clan_allies:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                )
+                add_patrols("OTHER_CLAN_ALLIES")
             elif clan_hostile:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                )
+                add_patrols("OTHER_CLAN_HOSTILE")
 
         final_patrols, final_romance_patrols = self.get_filtered_patrols(
             possible_patrols, biome, camp, current_season, patrol_type
@@ -550,6 +498,11 @@ class Patrol:
         current_season: str,
         patrol_type: str,
     ):
+        """
+        Returns the normal and the romantic patrols that can happen with the current patrol cats.
+        possible_patrols should come from the patrol catalog, so they already fit the biome, camp,
+        season and number of patrol cats, and these aren't checked again here.
+        """
         filtered_patrols = []
         romantic_patrols = []
         special_date = get_special_date()
@@ -558,9 +511,14 @@ class Patrol:
         if patrol_type == "general":
             patrol_type = random.choice(["hunting", "border", "training"])
 
-        # makes sure that it grabs patrols in the correct biomes, season, with the correct number of cats
         for patrol in possible_patrols:
-            if not self._check_constraints(patrol):
+            if "hunting" not in patrol.types and patrol_type == "hunting":
+                continue
+            elif "border" not in patrol.types and patrol_type == "border":
+                continue
+            elif "training" not in patrol.types and patrol_type == "training":
+                continue
+            elif "herb_gathering" not in patrol.types and patrol_type == "med":
                 continue
 
             # Don't check for repeat patrols if ensure_patrol_id is being used.
@@ -577,35 +535,10 @@ class Patrol:
                 if not special_date or special_date.patrol_tag not in patrol.tags:
                     continue
 
-            if not (patrol.min_cats <= len(self.patrol_cats) <= patrol.max_cats):
-                continue
-
-            flag = False
-            for sta, num in patrol.min_max_status.items():
-                if len(num) != 2:
-                    print(f"Issue with status limits: {patrol.patrol_id}")
-                    continue
-
-                if not (num[0] <= self.patrol_statuses.get(sta, -1) <= num[1]):
-                    flag = True
-                    break
-            if flag:
-                continue
-
-            if biome not in patrol.biome and "any" not in patrol.biome:
-                continue
-            if camp not in patrol.camp and "any" not in patrol.camp:
-                continue
-            if current_season not in patrol.season and "any" not in patrol.season:
-                continue
-
-            if "hunting" not in patrol.types and patrol_type == "hunting":
-                continue
-            elif "border" not in patrol.types and patrol_type == "border":
-                continue
-            elif "training" not in patrol.types and patrol_type == "training":
-                continue
-            elif "herb_gathering" not in patrol.types and patrol_type == "med":
+            if not all(
+                num[0] <= self.patrol_statuses.get(sta, -1) <= num[1]
+                for sta, num in patrol.min_max_status.items()
+            ):
                 continue
 
             # cruel season tag check
@@ -613,6 +546,9 @@ class Patrol:
                 if game.clan and game.clan.game_mode != "cruel_season":
                     continue
 
+            if not self._check_constraints(patrol):
+                continue
+
             if "romantic" in patrol.tags:
                 romantic_patrols.append(patrol)
             else:
@@ -651,7 +587,7 @@ class Patrol:
                 "No normal patrols possible. Repeating filter with used patrols cleared."
             )
             self.used_patrols.clear()
-            print("used patrols cleared", self.used_patrols)
+            print("used patrols cleared", list(self.used_patrols))
             filtered_patrols, romantic_patrols = self._filter_patrols(
                 possible_patrols, biome, camp, current_season, patrol_type
             )
@@ -664,44 +600,7 @@ class Patrol:
         return filtered_patrols, romantic_patrols
 
     def generate_patrol_events(self, patrol_dict):
-        all_patrol_events = []
-        for patrol in patrol_dict:
-            patrol_event = PatrolEvent(
-                patrol_id=patrol.get("patrol_id"),
-                biome=patrol.get("biome"),
-                camp=patrol.get("camp"),
-                season=patrol.get("season"),
-                tags=patrol.get("tags"),
-                weight=patrol.get("weight", 20),
-                types=patrol.get("types"),
-                intro_text=patrol.get("intro_text"),
-                patrol_art=patrol.get("patrol_art"),
-                patrol_art_clean=patrol.get("patrol_art_clean"),
-                success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("success_outcomes")
-                ),
-                fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("fail_outcomes"), success=False
-                ),
-                decline_text=patrol.get("decline_text"),
-                chance_of_success=patrol.get("chance_of_success"),
-                min_cats=patrol.get("min_cats", 1),
-                max_cats=patrol.get("max_cats", 6),
-                min_max_status=patrol.get("min_max_status"),
-                antag_success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_success_outcomes"), antagonize=True
-                ),
-                antag_fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_fail_outcomes"), success=False, antagonize=True
-                ),
-                relationship_constraints=patrol.get("relationship_constraint"),
-                pl_skill_constraints=patrol.get("pl_skill_constraint"),
-                pl_trait_constraints=patrol.get("pl_trait_constraints"),
-            )
-
-            all_patrol_events.append(patrol_event)
-
-        return all_patrol_events
+        return build_patrol_events(patrol_dict)
 
     def determine_outcome(self, antagonize=False) -> Tuple[str, str, Optional[str]]:
         if self.patrol_event is None:
@@ -726,12 +625,12 @@ class Patrol:
         fail_outcomes = PatrolOutcome.prepare_allowed_outcomes(fail_outcomes, self)
 
         # Choose a success and fail outcome
-        chosen_success = choices(
-            success_outcomes, weights=[x.weight for x in success_outcomes]
-        )[0]
-        chosen_failure = choices(
-            fail_outcomes, weights=[x.weight for x in fail_outcomes]
-        )[0]
+        chosen_success = WeightedSampler(
+            success_outcomes, [x.weight for x in success_outcomes]
+        ).choice()
+        chosen_failure = WeightedSampler(
+            fail_outcomes, [x.weight for x in fail_outcomes]
+        ).choice()
 
         final_event, success = self.calculate_success(chosen_success, chosen_failure)
 
@@ -811,35 +710,30 @@ class Patrol:
 
         return (success_outcome if success else fail_outcome, success)
 
-    def update_resources(self, biome_dir, leaf):
-        resources = [
-            ("HUNTING_SZN", f"{biome_dir}hunting/{leaf}.json"),
-            ("HUNTING", f"{biome_dir}hunting/any.json"),
-            ("BORDER_SZN", f"{biome_dir}border/{leaf}.json"),
-            ("BORDER", f"{biome_dir}border/any.json"),
-            ("TRAINING_SZN", f"{biome_dir}training/{leaf}.json"),
-            ("TRAINING", f"{biome_dir}training/any.json"),
-            ("MEDCAT_SZN", f"{biome_dir}med/{leaf}.json"),
-            ("MEDCAT", f"{biome_dir}med/any.json"),
-            ("NEW_CAT", "new_cat.json"),
-            ("NEW_CAT_HOSTILE", "new_cat_hostile.json"),
-            ("NEW_CAT_WELCOMING", "new_cat_welcoming.json"),
-            ("OTHER_CLAN", "other_clan.json"),
-            ("OTHER_CLAN_HOSTILE", "other_clan_hostile.json"),
-            ("OTHER_CLAN_ALLIES", "other_clan_allies.json"),
-            ("HUNTING_GEN", "general/hunting.json"),
-            ("BORDER_GEN", "general/border.json"),
-            ("MEDCAT_GEN", "general/medcat.json"),
-            ("TRAINING_GEN", "general/training.json"),
-            ("DISASTER", "disaster.json"),
-        ]
-        for patrol_property, location in resources:
-            try:
-                setattr(
-                    self, patrol_property, load_lang_resource(f"patrols/{location}")
-                )
-            except:
-                raise Exception("Something went wrong loading patrols!")
+    @staticmethod
+    def get_patrol_files(biome_dir, leaf) -> Dict[str, str]:
+        """Returns the locations of the patrol files in the patrols folder, by the kind of patrols they hold"""
+        return {
+            "HUNTING_SZN": f"{biome_dir}hunting/{leaf}.json",
+            "HUNTING": f"{biome_dir}hunting/any.json",
+            "BORDER_SZN": f"{biome_dir}border/{leaf}.json",
+            "BORDER": f"{biome_dir}border/any.json",
+            "TRAINING_SZN": f"{biome_dir}training/{leaf}.json",
+            "TRAINING": f"{biome_dir}training/any.json",
+            "MEDCAT_SZN": f"{biome_dir}med/{leaf}.json",
+            "MEDCAT": f"{biome_dir}med/any.json",
+            "NEW_CAT": "new_cat.json",
+            "NEW_CAT_HOSTILE": "new_cat_hostile.json",
+            "NEW_CAT_WELCOMING": "new_cat_welcoming.json",
+            "OTHER_CLAN": "other_clan.json",
+            "OTHER_CLAN_HOSTILE": "other_clan_hostile.json",
+            "OTHER_CLAN_ALLIES": "other_clan_allies.json",
+            "HUNTING_GEN": "general/hunting.json",
+            "BORDER_GEN": "general/border.json",
+            "MEDCAT_GEN": "general/medcat.json",
+            "TRAINING_GEN": "general/training.json",
+            "DISASTER": "disaster.json",
+        }
 
     def balance_hunting(self, possible_patrols: list):
         """Filter the incoming hunting patrol list to balance the different kinds of hunting patrols.
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: ascii -*-
+"""
+Keeps the patrols of each patrol file as ready-built PatrolEvents.
+
+Building the PatrolEvents and their outcomes from the patrol files takes a while, so it is done once per
+locale and file rather than every time a patrol is started. The patrols of each file are also indexed by
+the biome, camp, season and patrol size they fit, so finding the possible patrols is a dict lookup.
+
+The PatrolEvents in the catalog are shared, so they must not be changed. Use PatrolEvent.copy to get one
+which can be run.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import i18n
+
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
+from scripts.game_structure.localization import load_lang_resource
+
+
+def build_patrol_events(patrol_dicts: List[dict]) -> List[PatrolEvent]:
+    """Creates a PatrolEvent for every patrol dict from a patrol file"""
+    all_patrol_events = []
+    for patrol in patrol_dicts:
+        patrol_event = PatrolEvent(
+            patrol_id=patrol.get("patrol_id"),
+            biome=patrol.get("biome"),
+            camp=patrol.get("camp"),
+            season=patrol.get("season"),
+            tags=patrol.get("tags"),
+            weight=patrol.get("weight", 20),
+            types=patrol.get("types"),
+            intro_text=patrol.get("intro_text"),
+            patrol_art=patrol.get("patrol_art"),
+            patrol_art_clean=patrol.get("patrol_art_clean"),
+            success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("success_outcomes")
+            ),
+            fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("fail_outcomes"), success=False
+            ),
+            decline_text=patrol.get("decline_text"),
+            chance_of_success=patrol.get("chance_of_success"),
+            min_cats=patrol.get("min_cats", 1),
+            max_cats=patrol.get("max_cats", 6),
+            min_max_status=patrol.get("min_max_status"),
+            antag_success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_success_outcomes"), antagonize=True
+            ),
+            antag_fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_fail_outcomes"), success=False, antagonize=True
+            ),
+            relationship_constraints=patrol.get("relationship_constraint"),
+            pl_skill_constraints=patrol.get("pl_skill_constraint"),
+            pl_trait_constraints=patrol.get("pl_trait_constraints"),
+        )
+
+        all_patrol_events.append(patrol_event)
+
+    return all_patrol_events
+
+
+class PatrolCatalog:
+    """Built PatrolEvents by locale and patrol file, and an index of them by biome, camp, season and size."""
+
+    def __init__(self):
+        self._locale = None
+        self._files: Dict[str, Tuple[PatrolEvent, ...]] = {}
+        self._index: Dict[tuple, Dict[Optional[int], Tuple[PatrolEvent, ...]]] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def clear(self):
+        """Forgets every built patrol, so the patrol files are read again on next use."""
+        self._files.clear()
+        self._index.clear()
+
+    def _check_locale(self):
+        locale = (i18n.config.get("locale"), i18n.config.get("fallback"))
+        if locale != self._locale:
+            self.clear()
+            self._locale = locale
+
+    def get_file(self, location: str) -> Tuple[PatrolEvent, ...]:
+        """
+        Returns the PatrolEvents of a patrol file.
+        :param location: Location of the file in the patrols folder, such as "forest/hunting/any.json"
+        """
+        self._check_locale()
+        patrols = self._files.get(location)
+        if patrols is None:
+            self.stats["misses"] += 1
+            patrols = tuple(
+                build_patrol_events(load_lang_resource(f"patrols/{location}"))
+            )
+            self._files[location] = patrols
+        else:
+            self.stats["hits"] += 1
+        return patrols
+
+    def get_patrols(
+        self, location: str, biome: str, camp: str, season: str, patrol_size: int
+    ) -> Tuple[PatrolEvent, ...]:
+        """
+        Returns the PatrolEvents of a patrol file which can happen in a biome, camp and season,
+        with the given number of cats.
+        """
+        self._check_locale()
+        key = (location, biome, camp, season)
+        if key not in self._index:
+            fitting = tuple(
+                patrol
+                for patrol in self.get_file(location)
+                if (biome in patrol.biome or "any" in patrol.biome)
+                and (camp in patrol.camp or "any" in patrol.camp)
+                and (season in patrol.season or "any" in patrol.season)
+            )
+            by_size = {None: fitting}
+            for size in range(1, 7):
+                by_size[size] = tuple(
+                    patrol
+                    for patrol in fitting
+                    if patrol.min_cats <= size <= patrol.max_cats
+                )
+            self._index[key] = by_size
+
+        by_size = self._index[key]
+        if patrol_size in by_size:
+            return by_size[patrol_size]
+        return tuple(
+            patrol
+            for patrol in by_size[None]
+            if patrol.min_cats <= patrol_size <= patrol.max_cats
+        )
+
+    def get_info(self) -> dict:
+        return {
+            "files": len(self._files),
+            "patrols": sum(len(patrols) for patrols in self._files.values()),
+            "indexed": len(self._index),
+            **self.stats,
+        }
+
+
+patrol_catalog = PatrolCatalog()
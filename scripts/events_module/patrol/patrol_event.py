@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: ascii -*-
+from copy import copy
 from typing import List, Union
 
 from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
@@ -58,7 +59,22 @@ class PatrolEvent:
                                                                     is not None else []
         self.pl_skill_constraints = pl_skill_constraints if pl_skill_constraints is not None else []
         self.pl_trait_constraints = pl_trait_constraints if pl_trait_constraints is not None else []
-        self.min_max_status = min_max_status if min_max_status is not None else {}
+        self.min_max_status = {}
+        # status limits are checked here once, so filtering the patrols doesn't have to
+        for status, limits in (min_max_status or {}).items():
+            if len(limits) != 2:
+                print(f"Issue with status limits: {patrol_id}")
+                continue
+            self.min_max_status[status] = limits
+
+    def copy(self) -> "PatrolEvent":
+        """Returns a copy with its own outcomes, which can be run without changing this patrol"""
+        patrol_event = copy(self)
+        patrol_event.success_outcomes = [out.copy() for out in self.success_outcomes]
+        patrol_event.fail_outcomes = [out.copy() for out in self.fail_outcomes]
+        patrol_event.antag_success_outcomes = [out.copy() for out in self.antag_success_outcomes]
+        patrol_event.antag_fail_outcomes = [out.copy() for out in self.antag_fail_outcomes]
+        return patrol_event
 
     @property
     def new_cat(self) -> bool:
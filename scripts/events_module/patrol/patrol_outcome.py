@@ -2,6 +2,7 @@
 # -*- coding: ascii -*-
 import random
 import re
+from copy import copy, deepcopy
 from os.path import exists as path_exists
 from random import choice, choices
 from typing import List, Dict, Union, TYPE_CHECKING, Optional, Tuple
@@ -110,6 +111,16 @@ class PatrolOutcome:
         # This will hold the stat cat, for filtering purposes
         self.stat_cat = stat_cat
 
+    def copy(self) -> "PatrolOutcome":
+        """
+        Returns a copy without a stat cat. The relationship effects are copied too,
+        as their logs are filled in with the patrol cats when the outcome is executed.
+        """
+        outcome = copy(self)
+        outcome.stat_cat = None
+        outcome.relationship_effects = deepcopy(self.relationship_effects)
+        return outcome
+
     @staticmethod
     def prepare_allowed_outcomes(
         outcomes: List["PatrolOutcome"], patrol: "Patrol"
@@ -58,9 +58,7 @@ class Pregnancy_Events:
     def biggest_family_is_big():
         """Returns if the current biggest family is big enough to 'activates' additional inbreeding counters."""
 
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if not (i.dead or i.outside or i.exiled)]
-        )
+        living_cats = Cat.index.count()
         return len(Pregnancy_Events.biggest_family) > (living_cats / 10)
 
     @staticmethod
@@ -1155,9 +1153,7 @@ class Pregnancy_Events:
 
         # CURRENT CAT AMOUNT
         # - increase the inverse chance if the clan is bigger
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if not (i.dead or i.outside or i.exiled)]
-        )
+        living_cats = Cat.index.count()
         if living_cats < 10:
             inverse_chance = int(inverse_chance * 0.5)
         elif living_cats > 30:
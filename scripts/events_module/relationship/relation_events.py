@@ -268,13 +268,7 @@ class Relation_Events:
     @staticmethod
     def cats_with_relationship_constraints(main_cat, constraint):
         """Returns a list of cats, where the relationship from main_cat towards the cat fulfill the given constraints."""
-        cat_list = list(
-            filter(
-                lambda cat: (not cat.dead and not cat.outside and not cat.exiled),
-                Cat.all_cats.values(),
-            )
-        )
-        cat_list.remove(main_cat)
+        cat_list = Cat.index.get_cats(exclude=main_cat)
         filtered_cat_list = []
 
         for inter_cat in cat_list:
@@ -223,7 +223,7 @@ class RomanticEvents:
 
         # if the chosen_interaction is still in the TRIGGERED_SINGLE_INTERACTIONS, clean the list
         if chosen_interaction in relationship.used_interaction_ids:
-            relationship.used_interaction_ids = []
+            relationship.used_interaction_ids.clear()
         relationship.used_interaction_ids.append(chosen_interaction.id)
 
         # affect relationship - it should always be in a romantic way
@@ -1,4 +1,5 @@
 import random
+from copy import copy
 from typing import List
 
 import i18n
@@ -31,6 +32,7 @@ from scripts.utility import (
     get_alive_status_cats,
     adjust_list_text,
 )
+from scripts.weighted_sampler import WeightedSampler
 
 
 # ---------------------------------------------------------------------------- #
@@ -128,7 +130,14 @@ class HandleShortEvents:
             event_type = "death"
         elif event_type == "health":
             event_type = "injury"
-        possible_short_events = GenerateEvents.possible_short_events(event_type)
+
+        # check if generated event should be a war event
+        if "war" in self.sub_types and random.randint(1, 10) == 1:
+            self.sub_types.remove("war")
+
+        possible_short_events = GenerateEvents.possible_short_events(
+            event_type, self.sub_types
+        )
 
         final_events = GenerateEvents.filter_possible_short_events(
             Cat_class=Cat,
@@ -148,7 +157,7 @@ class HandleShortEvents:
                     _event.event_id
                     == game.config["event_generation"]["debug_ensure_event_id"]
                 ):
-                    final_events = [_event]
+                    final_events = WeightedSampler([_event])
                     print(
                         f"FOUND debug_ensure_event_id: {game.config['event_generation']['debug_ensure_event_id']} "
                         f"was set as the only event option"
@@ -164,7 +173,8 @@ class HandleShortEvents:
         #                               do the event                                   #
         # ---------------------------------------------------------------------------- #
         try:
-            self.chosen_event = random.choice(final_events)
+            # the loaded events are kept between moons, so take a copy before the text gets added to
+            self.chosen_event = copy(final_events.choice())
             # this print is good for testing, but gets spammy in large clans
             # print(f"CHOSEN: {self.chosen_event.event_id}")
         except IndexError:
@@ -807,7 +817,7 @@ class HandleShortEvents:
 
         # adjust entire herb store
         if supply_type == "all_herb":
-            for herb, count in herb_supply.entire_supply.copy():
+            for herb, count in herb_supply.entire_supply.copy().items():
                 herb_list.append(herb)
                 if adjustment == "reduce_full":
                     herb_supply.remove_herb(herb, count)
@@ -1,14 +1,28 @@
 import os
 import traceback
 from ast import literal_eval
-from shutil import move as shutil_move
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pygame
 import ujson
 
 from scripts.event_class import Single_Event
+from scripts.game_structure import save_database
+from scripts.game_structure.save_file import (
+    MANIFEST_NAME,
+    deferred_directory_sync,
+    dump_json,
+    load_save_file,
+    write_save_file,
+)
+from scripts.game_structure.save_queue import (
+    SaveBatch,
+    SaveQueue,
+    collect_save,
+    get_collecting_batch,
+)
 from scripts.game_structure.screen_settings import toggle_fullscreen
-from scripts.housekeeping.datadir import get_save_dir, get_temp_dir
+from scripts.housekeeping.datadir import get_save_dir
 
 pygame.init()
 
@@ -38,6 +52,13 @@ class Game:
 
     allegiance_list = []
     language = {}
+
+    # Hash of the data last written to (or read from) each save file, by path
+    saved_file_hashes = {}
+    # Save files that were read ahead of time by prefetch_save_files, by path
+    prefetched_files = {}
+    # Writes the saves made by save_game in the background
+    save_queue = SaveQueue()
     game_mode = ""
     language_list = ["english", "spanish", "german"]
     game_mode_list = ["classic", "expanded", "cruel season"]
@@ -154,6 +175,7 @@ class Game:
         "showbounds": False,
         "visualdebugmode": False,
         "showfps": False,
+        "moontimings": False,
     }
 
     # Init Settings
@@ -220,64 +242,106 @@ class Game:
             self.switch_screens = True
         self.clicked = False
         self.keyspressed = []
+        self.report_save_errors()
 
     @staticmethod
-    def safe_save(path: str, write_data, check_integrity=False, max_attempts: int = 15):
-        """If write_data is not a string, assumes you want this
-        in json format. If check_integrity is true, it will read back the file
-        to check that the correct data has been written to the file.
-        If not, it will simply write the data to the file with no other
-        checks."""
+    def safe_save(path: str, write_data, pretty: bool = False):
+        """Writes a save file atomically, so a crash can't leave it half written. If write_data is not
+        a string, it is saved as JSON, which is compact unless pretty is True. JSON files get a checksum,
+        which is checked when they are loaded with load_save_file. While a save is being collected by
+        save_game, the file is added to that save instead, and written in the background."""
 
         # If write_data is not a string,
         if type(write_data) is not str:
-            _data = ujson.dumps(write_data, indent=4)
+            _data = dump_json(write_data, pretty)
         else:
             _data = write_data
 
-        dir_name, file_name = os.path.split(path)
+        batch = get_collecting_batch()
+        if batch is not None:
+            batch.write(path, _data)
+            return
 
-        if check_integrity:
-            if not file_name:
-                raise RuntimeError(f"Safe_Save: No file name was found in {path}")
+        write_save_file(path, _data)
 
-            temp_file_path = get_temp_dir() + "/" + file_name + ".tmp"
-            i = 0
-            while True:
-                # Attempt to write to temp file
-                with open(temp_file_path, "w", encoding="utf-8") as write_file:
-                    write_file.write(_data)
-                    write_file.flush()
-                    os.fsync(write_file.fileno())
+    def save_if_changed(self, path: str, write_data) -> bool:
+        """Saves write_data like safe_save, unless the file already holds exactly this data.
+        Returns True if the file was written."""
+        if type(write_data) is not str:
+            write_data = dump_json(write_data)
 
-                # Read the entire file back in
-                with open(temp_file_path, "r", encoding="utf-8") as read_file:
-                    _read_data = read_file.read()
-
-                if _data != _read_data:
-                    i += 1
-                    if i > max_attempts:
-                        print(
-                            f"Safe_Save ERROR: {file_name} was unable to properly save {i} times. Saving Failed."
-                        )
-                        raise RuntimeError(
-                            f"Safe_Save: {file_name} was unable to properly save {i} times!"
-                        )
-                    print(
-                        f"Safe_Save: {file_name} was incorrectly saved. Trying again."
-                    )
-                    continue
-
-                # This section is reached is the file was not nullied. Move the file and return True
-
-                shutil_move(temp_file_path, path)
-                return
-        else:
-            os.makedirs(dir_name, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as write_file:
-                write_file.write(_data)
-                write_file.flush()
-                os.fsync(write_file.fileno())
+        data_hash = hash(write_data)
+        if self.saved_file_hashes.get(path) == data_hash and os.path.exists(path):
+            return False
+
+        self.safe_save(path, write_data)
+        self.saved_file_hashes[path] = data_hash
+        return True
+
+    @staticmethod
+    def remove_save_file(path: str):
+        """Removes a save file. While a save is being collected by save_game, it is removed in the background
+        along with the rest of that save, so it can't be written again by a save that is still queued."""
+        batch = get_collecting_batch()
+        if batch is not None:
+            batch.remove(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def save_game(self) -> Future:
+        """
+        Saves the cats, the Clan and the events in the background. The save is collected here, so the
+        game can carry on as soon as this returns, and is written after any saves that are still queued.
+        This covers Clans using the save database too. Only fading cats and switching between JSON files
+        and the database are written straight away. Errors while writing are shown by report_save_errors.
+        :return: A future which is done once the save is written
+        """
+        batch = SaveBatch()
+        with collect_save(batch):
+            self.save_cats()
+            self.clan.save_clan()
+            self.save_events()
+        return self.save_queue.submit(batch, self.safe_save)
+
+    def report_save_errors(self):
+        """Shows an error window if a save made by save_game couldn't be written."""
+        errors = self.save_queue.pop_errors()
+        if not errors:
+            return
+
+        # Files that weren't written must be written by the next save, even if they don't change
+        self.saved_file_hashes.clear()
+        for inter_cat in list(self.cat_class.all_cats.values()):
+            inter_cat.mark_relationships_unsaved()
+
+        from scripts.game_structure.windows import SaveError
+
+        SaveError(errors[0])
+
+    def mark_saved(self, path: str, data):
+        """Records that the file at path holds data, so save_if_changed won't rewrite it with the same data."""
+        self.saved_file_hashes[path] = hash(dump_json(data))
+
+    def prefetch_save_files(self, paths, max_workers: int = 8):
+        """Reads and parses save files on a thread pool, so read_save_file doesn't have to wait on the disk.
+        Files that can't be read are skipped, so that read_save_file reports the error as usual."""
+
+        def read(path):
+            try:
+                return path, load_save_file(path)
+            except (OSError, ValueError):
+                return path, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for path, data in pool.map(read, paths):
+                if data is not None:
+                    self.prefetched_files[path] = data
+
+    def read_save_file(self, path: str):
+        """Returns the parsed contents of a JSON save file, using the prefetched copy if there is one."""
+        if path in self.prefetched_files:
+            return self.prefetched_files.pop(path)
+        return load_save_file(path)
 
     def read_clans(self):
         """with open(get_save_dir() + '/clanlist.txt', 'r') as read_file:
@@ -373,10 +437,7 @@ class Game:
         """Load settings that user has saved from previous use"""
 
         try:
-            with open(
-                get_save_dir() + "/settings.json", "r", encoding="utf-8"
-            ) as read_file:
-                settings_data = ujson.loads(read_file.read())
+            settings_data = load_save_file(get_save_dir() + "/settings.json")
         except FileNotFoundError:
             return
 
@@ -403,6 +464,7 @@ class Game:
                 list_index + 1
             ]
 
+    @deferred_directory_sync()
     def save_cats(self):
         """Save the cat data."""
 
@@ -417,15 +479,25 @@ class Game:
         if not os.path.exists(directory):
             os.makedirs(directory)
 
-        # Delete all existing relationship files
+        if game.clan is not None and game.clan.clan_settings.get("database save"):
+            self.save_cats_to_database(clanname)
+            return
+        if save_database.get_save_database(clanname) is not None:
+            # Switching back to JSON files. Write out everything first, as histories
+            # that were never loaded aren't saved again below. The database is removed
+            # straight away, so the files can't wait for a background save.
+            self.save_queue.wait()
+            with collect_save(None), deferred_directory_sync():
+                save_database.database_to_json(clanname)
+            save_database.remove_save_database(clanname)
+
         if not os.path.exists(directory + "/relationships"):
             os.makedirs(directory + "/relationships")
-        for f in os.listdir(directory + "/relationships"):
-            os.remove(os.path.join(directory + "/relationships", f))
 
-        self.save_faded_cats(clanname)  # Fades cat and saves them, if needed
+        self._save_faded_cats_now(clanname)
 
         clan_cats = []
+        relationship_files = set()
         for inter_cat in self.cat_class.all_cats.values():
             cat_data = inter_cat.get_save_dict()
             clan_cats.append(cat_data)
@@ -438,8 +510,71 @@ class Game:
                 inter_cat.history = None
             if not inter_cat.dead:
                 inter_cat.save_relationship_of_cat(directory + "/relationships")
+                relationship_files.add(f"{inter_cat.ID}_relations.json")
+
+        # Only remove the relationship files of cats that no longer have any,
+        # unchanged files are left as they are
+        batch = get_collecting_batch()
+        if batch is not None:
+            batch.prune(directory + "/relationships", relationship_files)
+        else:
+            for f in os.listdir(directory + "/relationships"):
+                if f not in relationship_files and f != MANIFEST_NAME:
+                    os.remove(os.path.join(directory + "/relationships", f))
+
+        self.save_if_changed(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
 
-        self.safe_save(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
+    def save_cats_to_database(self, clanname):
+        """Save the cat data to the Clan's save database. Only rows that changed are written."""
+        from scripts.cat.history import History
+
+        database = save_database.get_save_database(clanname)
+        if database is None:
+            # Switching from JSON files. Bring everything over before the files are removed.
+            self.save_queue.wait()
+            database = save_database.json_to_database(clanname)
+            save_database.remove_json_cat_files(clanname)
+
+        self._save_faded_cats_now(clanname)
+
+        tables = {"cats": {}, "relationships": {}, "conditions": {}, "history": {}}
+        for inter_cat in self.cat_class.all_cats.values():
+            tables["cats"][inter_cat.ID] = inter_cat.get_save_dict()
+
+            conditions = inter_cat.get_condition_dict()
+            if conditions is not None:
+                tables["conditions"][inter_cat.ID] = conditions
+
+            if inter_cat.history:
+                tables["history"][inter_cat.ID] = History.make_dict(inter_cat)
+                # after saving, dump the history info
+                inter_cat.history = None
+            if not inter_cat.dead:
+                tables["relationships"][
+                    inter_cat.ID
+                ] = inter_cat.get_relationship_save_list()
+
+        # Histories are only saved when they were loaded, so missing ones are kept
+        self._save_to_database(database, tables, partial_tables=("history",))
+
+    @staticmethod
+    def _save_to_database(database, tables, documents=None, partial_tables=()):
+        """Saves rows to a save database. If a save is being collected, the rows are turned into JSON
+        text now, and written to the database along with the rest of the save."""
+        tables, documents = database.serialize(tables, documents)
+        batch = get_collecting_batch()
+        if batch is not None:
+            batch.call(database.write, tables, documents, partial_tables)
+        else:
+            database.write(tables, documents, partial_tables)
+
+    def _save_faded_cats_now(self, clanname):
+        """Fades cats, if needed. The files of faded parents are read back while fading, so unlike the rest
+        of a save they are written straight away, once any queued saves are done."""
+        if game.cat_to_fade:
+            self.save_queue.wait()
+        with collect_save(None):
+            self.save_faded_cats(clanname)
 
     def save_faded_cats(self, clanname):
         """Deals with fades cats, if needed, adding them as faded"""
@@ -524,6 +659,11 @@ class Game:
         events_list = []
         for event in game.cur_events_list:
             events_list.append(event.to_dict())
+
+        if game.clan.clan_settings.get("database save"):
+            database = save_database.get_save_database(game.clan.name, create=True)
+            self._save_to_database(database, {}, {"events": events_list})
+            return
         game.safe_save(f"{get_save_dir()}/{game.clan.name}/events.json", events_list)
 
     def add_faded_offspring_to_faded_cat(self, parent, offspring):
@@ -531,17 +671,9 @@ class Game:
         both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file.
         """
         try:
-            with open(
-                get_save_dir()
-                + "/"
-                + self.clan.name
-                + "/faded_cats/"
-                + parent
-                + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
+            cat_info = load_save_file(
+                get_save_dir() + "/" + self.clan.name + "/faded_cats/" + parent + ".json"
+            )
         except:
             print("ERROR: loading faded cat")
             return False
@@ -563,8 +695,11 @@ class Game:
         events_path = f"{get_save_dir()}/{clanname}/events.json"
         events_list = []
         try:
-            with open(events_path, "r", encoding="utf-8") as f:
-                events_list = ujson.loads(f.read())
+            database = save_database.get_save_database(clanname)
+            if database is not None:
+                events_list = database.read_document("events") or []
+            else:
+                events_list = load_save_file(events_path)
             for event_dict in events_list:
                 event_obj = Single_Event.from_dict(event_dict, game.cat_class)
                 if event_obj:
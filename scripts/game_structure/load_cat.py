@@ -10,9 +10,11 @@ from scripts.cat.cats import Cat, BACKSTORIES
 from scripts.game_structure.localization import get_new_pronouns
 from ..cat.personality import Personality
 from scripts.cat.pelts import Pelt
-from scripts.cat_relations.inheritance import Inheritance
+from scripts.cat_relations.family_graph import family_graph
 from scripts.housekeeping.version import SAVE_VERSION_NUMBER
 from .game_essentials import game
+from .save_database import get_save_database
+from .save_file import CorruptSaveFileError, load_save_file, remove_temp_files
 from ..cat.skills import CatSkills
 from ..housekeeping.datadir import get_save_dir
 
@@ -20,6 +22,11 @@ logger = logging.getLogger(__name__)
 
 
 def load_cats():
+    # nothing is being saved yet, so any temporary save files are left over from a crash
+    clanname = game.switches["clan_list"][0]
+    remove_temp_files(get_save_dir(), recursive=False)
+    if clanname:
+        remove_temp_files(f"{get_save_dir()}/{clanname}")
     try:
         json_load()
     except FileNotFoundError:
@@ -40,8 +47,11 @@ def json_load():
     ) as read_file:
         convert = ujson.loads(read_file.read())
     try:
-        with open(clan_cats_json_path, "r", encoding="utf-8") as read_file:
-            cat_data = ujson.loads(read_file.read())
+        database = get_save_database(clanname)
+        if database is not None:
+            cat_data = database.read_all("cats")
+        else:
+            cat_data = load_save_file(clan_cats_json_path)
     except PermissionError as e:
         game.switches["error_message"] = f"Can\t open {clan_cats_json_path}!"
         game.switches["traceback"] = e
@@ -50,6 +60,10 @@ def json_load():
         game.switches["error_message"] = f"{clan_cats_json_path} is malformed!"
         game.switches["traceback"] = e
         raise
+    except CorruptSaveFileError as e:
+        game.switches["error_message"] = f"{clan_cats_json_path} is damaged!"
+        game.switches["traceback"] = e
+        raise
 
     old_tortie_patches = convert["old_tortie_patches"]
 
@@ -235,6 +249,8 @@ def json_load():
                     cat["scar_event"] if "scar_event" in cat else [],
                 )
 
+            # parents and mates were set after the cat was created
+            family_graph.update(new_cat)
             all_cats.append(new_cat)
 
         except KeyError as e:
@@ -248,52 +264,68 @@ def json_load():
             game.switches["traceback"] = e
             raise
 
-    # replace cat ids with cat objects and add other needed variables
-    for cat in all_cats:
-        cat.load_conditions()
-
-        # this is here to handle paralyzed cats in old saves
-        if cat.pelt.paralyzed and "paralyzed" not in cat.permanent_condition:
-            cat.get_permanent_condition("paralyzed")
-        elif "paralyzed" in cat.permanent_condition and not cat.pelt.paralyzed:
-            cat.pelt.paralyzed = True
-
-        # load the relationships
-        try:
-            if not cat.dead:
-                cat.load_relationship_of_cat()
-                if cat.relationships is not None and len(cat.relationships) < 1:
-                    cat.init_all_relationships()
-            else:
-                cat.relationships = {}
-        except Exception as e:
-            logger.exception(
-                f"There was an error loading relationships for cat #{cat}."
-            )
-            game.switches[
-                "error_message"
-            ] = f"There was an error loading relationships for cat #{cat}."
-            game.switches["traceback"] = e
-            raise
-
-        cat.inheritance = Inheritance(cat)
+    if database is None:
+        prefetch_cat_files(clanname, all_cats)
 
-        try:
-            # initialization of thoughts
-            cat.thoughts()
-        except Exception as e:
-            logger.exception(
-                f"There was an error when thoughts for cat #{cat} are created."
-            )
-            game.switches[
-                "error_message"
-            ] = f"There was an error when thoughts for cat #{cat} are created."
-            game.switches["traceback"] = e
-            raise
-
-        # Save integrety checks
-        if game.config["save_load"]["load_integrity_checks"]:
-            save_check()
+    try:
+        # replace cat ids with cat objects and add other needed variables
+        for cat in all_cats:
+            cat.load_conditions()
+
+            # this is here to handle paralyzed cats in old saves
+            if cat.pelt.paralyzed and "paralyzed" not in cat.permanent_condition:
+                cat.get_permanent_condition("paralyzed")
+            elif "paralyzed" in cat.permanent_condition and not cat.pelt.paralyzed:
+                cat.pelt.paralyzed = True
+
+            # load the relationships
+            try:
+                if not cat.dead:
+                    cat.load_relationship_of_cat()
+                    if cat.relationships is not None and len(cat.relationships) < 1:
+                        cat.init_all_relationships()
+                else:
+                    cat.relationships = {}
+            except Exception as e:
+                logger.exception(
+                    f"There was an error loading relationships for cat #{cat}."
+                )
+                game.switches[
+                    "error_message"
+                ] = f"There was an error loading relationships for cat #{cat}."
+                game.switches["traceback"] = e
+                raise
+
+            # The inheritance is created the first time it's needed, and the thought the
+            # first time it's shown (or on the next moon), rather than for every cat here
+            cat.thought = None
+
+            # Save integrety checks
+            if game.config["save_load"]["load_integrity_checks"]:
+                save_check()
+    finally:
+        # prefetched files that weren't read would stay in memory, and could be served stale
+        # on a later load of the same Clan
+        game.prefetched_files.clear()
+
+
+def prefetch_cat_files(clanname, cats):
+    """Reads the condition and relationship files of the loaded cats ahead of time, on a thread pool."""
+    paths = []
+    for folder, suffix, wanted in (
+        ("conditions", "_conditions.json", cats),
+        ("relationships", "_relations.json", [c for c in cats if not c.dead]),
+    ):
+        directory = f"{get_save_dir()}/{clanname}/{folder}/"
+        if not os.path.isdir(directory):
+            continue
+        existing = set(os.listdir(directory))
+        paths.extend(
+            directory + cat.ID + suffix
+            for cat in wanted
+            if cat.ID + suffix in existing
+        )
+    game.prefetch_save_files(paths)
 
 
 def csv_load(all_cats):
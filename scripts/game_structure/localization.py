@@ -1,5 +1,5 @@
 import os.path
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Any
 
 import i18n
 import i18n.translations
@@ -65,22 +65,50 @@ def get_default_adj():
     return get_lang_config()["pronouns"]["adj_default"]
 
 
+# Parsed lang resources, keyed by (locale, fallback, root directory, location).
+# Emptied whenever the locale or the lang directory changes.
+_resource_cache: Dict[tuple, Any] = {}
+_resource_cache_locale: Optional[tuple] = None
+_resource_cache_stats = {"hits": 0, "misses": 0}
+
+
 def load_lang_resource(location: str, *, root_directory=None):
     """
-    Get a resource from the resources/lang folder for the loaded language
+    Get a resource from the resources/lang folder for the loaded language. Resources are only read from disk
+    the first time they are requested for a locale, so the returned object is shared and shouldn't be modified.
     :param location: If the language code is required, substitute `{lang}`. Relative location
     from the resources/lang/[language]/ folder. Don't include a slash.
     :param root_directory: for testing only.
     :return: Whatever resource was there, from either the locale or fallback
     :exception FileNotFoundError: If requested resource doesn't exist in selected locale or fallback
     """
+    global _resource_cache_locale
     location = os.path.normpath(location)
     locale, fallback = str(i18n.config.get("locale")), str(i18n.config.get("fallback"))
     if root_directory is None:
         root_directory = os.path.join("resources", "lang")
+    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
+
+    if _resource_cache_locale != (locale, fallback):
+        clear_lang_resource_cache()
+        _resource_cache_locale = (locale, fallback)
+
+    key = (locale, fallback, os.path.normpath(root_directory), location)
+    try:
+        resource = _resource_cache[key]
+        _resource_cache_stats["hits"] += 1
+        return resource
+    except KeyError:
+        _resource_cache_stats["misses"] += 1
+
+    resource = _read_lang_resource(location, locale, fallback, root_directory)
+    _resource_cache[key] = resource
+    return resource
+
+
+def _read_lang_resource(location: str, locale: str, fallback: str, root_directory: str):
     resource_directory = os.path.join(root_directory, locale)
     fallback_directory = os.path.join(root_directory, fallback)
-    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
     try:
         with open(
             os.path.join(resource_directory, location.replace("{lang}", locale)),
@@ -97,6 +125,18 @@ def load_lang_resource(location: str, *, root_directory=None):
             return ujson.loads(string_file.read())
 
 
+def clear_lang_resource_cache():
+    """Forgets all loaded lang resources, so they are read from disk again on next use."""
+    global _resource_cache_locale
+    _resource_cache.clear()
+    _resource_cache_locale = None
+
+
+def get_lang_resource_cache_info() -> Dict[str, int]:
+    """:return: the hits, misses and current size of the lang resource cache"""
+    return {**_resource_cache_stats, "size": len(_resource_cache)}
+
+
 def get_lang_config() -> Dict:
     """
     :return: the config file for the currently-loaded language. Raises error if config doesn't exist.
@@ -121,6 +161,7 @@ def set_lang_config_directory(directory: str):
     global _lang_config_directory, _directory_changed
     _lang_config_directory = directory
     _directory_changed = True
+    clear_lang_resource_cache()
 
 
 def get_default_pronouns(lang=None):
@@ -0,0 +1,73 @@
+"""
+Seeding for the random numbers of the moon skip.
+
+Every part of the simulation draws its random numbers from the random module's shared generator, through
+imports like ``from random import choice`` - so that generator is the one to seed, rather than giving each
+module a generator of its own. A Clan can be given a seed, which is saved with it. While a Clan has a seed,
+the shared generator is seeded from it and the Clan's age at the start of every moon, so running the same
+moon of the same Clan always gives the same result, whatever random numbers the screens used in between.
+Clans without a seed keep drawing unseeded random numbers, as the game always has.
+
+Iterating over a set of strings is in a different order each time Python starts unless PYTHONHASHSEED is
+set, and some events pick from sets, so replays must also use the same PYTHONHASHSEED. Scripts that replay
+seeded moons use rerun_with_hash_seed for that.
+"""
+
+import os
+import random
+import subprocess
+import sys
+from typing import List, Optional
+
+MAX_SEED = 2**32 - 1
+
+
+def new_seed() -> int:
+    """Returns a new random seed, without drawing from (and so changing) the shared generator."""
+    return random.SystemRandom().randint(0, MAX_SEED)
+
+
+def get_moon_seed(clan_seed: int, moon: int) -> str:
+    """Returns what the shared generator is seeded with for one moon of a Clan."""
+    # str seeds are hashed with SHA-512, so this gives the same numbers on every run and platform
+    return f"{clan_seed}/{moon}"
+
+
+def seed_moon(clan_seed: Optional[int], moon: int):
+    """
+    Seeds the shared generator for a moon. Does nothing if the Clan has no seed.
+    :param clan_seed: The Clan's seed
+    :param moon: The Clan's age at the start of the moon
+    """
+    if clan_seed is None:
+        return
+    random.seed(get_moon_seed(clan_seed, moon))
+
+
+def seed(value: Optional[int] = None) -> int:
+    """
+    Seeds the shared generator directly, for things that happen outside a moon skip, like making a Clan.
+    :param value: The seed, or None for a new random one
+    :return: The seed used
+    """
+    if value is None:
+        value = new_seed()
+    random.seed(value)
+    return value
+
+
+def rerun_with_hash_seed(module: str, argv: List[str]):
+    """
+    Runs a script again in a new process with PYTHONHASHSEED set, and exits with its exit code.
+    Does nothing if PYTHONHASHSEED is already set.
+    :param module: The script, as it is run with python -m
+    :param argv: The script's command line arguments
+    """
+    if "PYTHONHASHSEED" in os.environ:
+        return
+    environment = dict(os.environ, PYTHONHASHSEED="0")
+    sys.exit(
+        subprocess.run(
+            [sys.executable, "-m", module, *argv], env=environment
+        ).returncode
+    )
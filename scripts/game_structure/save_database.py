@@ -0,0 +1,288 @@
+"""
+Optional single-file save format.
+
+When the "database save" Clan setting is on, the cats, relationships, conditions, history and events
+of a Clan are kept in one SQLite file in the Clan's save folder, instead of one JSON file per cat.
+Every row holds the same JSON that would otherwise be written to a file, so converting between
+the two layouts is lossless. A save only writes the rows that changed since the last save, all
+in one transaction.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import ujson
+
+from scripts.game_structure.save_file import load_save_file
+from scripts.housekeeping.datadir import get_save_dir
+
+SAVE_DATABASE_NAME = "clan_save.db"
+
+# table name: (folder of the JSON layout, file name suffix)
+CAT_TABLES = {
+    "relationships": ("relationships", "_relations.json"),
+    "conditions": ("conditions", "_conditions.json"),
+    "history": ("history", "_history.json"),
+}
+# table name: file of the JSON layout. These are stored as a single row.
+DOCUMENTS = {
+    "events": "events.json",
+}
+
+
+class SaveDatabase:
+    """A Clan's save database. Keeps track of what was last written, so unchanged rows are skipped."""
+
+    tables = ("cats", *CAT_TABLES)
+
+    def __init__(self, path: str):
+        """
+        :param path: Path of the database file. It is created if it doesn't exist yet.
+        """
+        self.path = path
+        # saves are written on the save queue's thread, while rows can be read on any other
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            for table in self.tables:
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    f"(key TEXT PRIMARY KEY, position INTEGER, data TEXT NOT NULL)"
+                )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+        # The JSON text and position of every row as they are in the file, by table and key
+        self.written: Dict[str, Dict[str, str]] = {}
+        self.positions: Dict[str, Dict[str, int]] = {}
+        self.rows_written = 0
+
+    def close(self):
+        self.connection.close()
+
+    def _get_written(self, table: str) -> Dict[str, str]:
+        with self._lock:
+            if table not in self.written:
+                rows = self.connection.execute(
+                    f"SELECT key, position, data FROM {table}"
+                ).fetchall()
+                self.written[table] = {key: data for key, _, data in rows}
+                self.positions[table] = {key: position for key, position, _ in rows}
+            return self.written[table]
+
+    # ---------------------------------------------------------------------------- #
+    #                                    reading                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def read(self, table: str, key: str):
+        """Returns the stored value of a row, or None if there is no such row."""
+        data = self._get_written(table).get(key)
+        return ujson.loads(data) if data is not None else None
+
+    def read_all(self, table: str) -> List:
+        """Returns the values of all rows of a table, in the order they were saved in."""
+        with self._lock:
+            self._get_written(table)
+            rows = self.connection.execute(
+                f"SELECT data FROM {table} ORDER BY position"
+            ).fetchall()
+        return [ujson.loads(data) for (data,) in rows]
+
+    def keys(self, table: str) -> Iterable[str]:
+        return self._get_written(table).keys()
+
+    def read_document(self, key: str):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT data FROM documents WHERE key = ?", (key,)
+            ).fetchone()
+        return ujson.loads(row[0]) if row else None
+
+    # ---------------------------------------------------------------------------- #
+    #                                    writing                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def save(
+        self,
+        tables: Dict[str, Dict[str, object]],
+        documents: Optional[Dict[str, object]] = None,
+        partial_tables: Iterable[str] = (),
+    ):
+        """
+        Writes the changed rows of the given tables, and removes rows that are no longer there, in one transaction.
+        :param tables: Rows to save by table, each a dict of key: value. The order of the rows is kept.
+        :param documents: Single documents to save, by key
+        :param partial_tables: Tables that only contain some of their rows. Rows that are missing aren't removed.
+        """
+        self.write(*self.serialize(tables, documents), partial_tables)
+
+    @staticmethod
+    def serialize(
+        tables: Dict[str, Dict[str, object]], documents: Optional[Dict[str, object]] = None
+    ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+        """Turns the rows and documents of a save into JSON text, ready for write."""
+        return (
+            {
+                table: {key: ujson.dumps(value) for key, value in rows.items()}
+                for table, rows in tables.items()
+            },
+            {key: ujson.dumps(value) for key, value in (documents or {}).items()},
+        )
+
+    def write(
+        self,
+        tables: Dict[str, Dict[str, str]],
+        documents: Optional[Dict[str, str]] = None,
+        partial_tables: Iterable[str] = (),
+    ):
+        """Same as save, with the rows and documents already turned into JSON text by serialize."""
+        with self._lock, self.connection:
+            for table, rows in tables.items():
+                written = self._get_written(table)
+                positions = self.positions[table]
+                partial = table in partial_tables
+                for position, (key, data) in enumerate(rows.items()):
+                    if written.get(key) == data:
+                        # the order of a partial table's rows means nothing, as most of them are missing
+                        if partial or positions.get(key) == position:
+                            continue
+                        # a row was added or removed ahead of this one
+                        self.connection.execute(
+                            f"UPDATE {table} SET position = ? WHERE key = ?",
+                            (position, key),
+                        )
+                    else:
+                        self.connection.execute(
+                            f"INSERT OR REPLACE INTO {table} (key, position, data) VALUES (?, ?, ?)",
+                            (key, position, data),
+                        )
+                        written[key] = data
+                    positions[key] = position
+                    self.rows_written += 1
+
+                if partial:
+                    continue
+                for key in [key for key in written if key not in rows]:
+                    self.connection.execute(
+                        f"DELETE FROM {table} WHERE key = ?", (key,)
+                    )
+                    del written[key]
+                    del positions[key]
+
+            for key, data in (documents or {}).items():
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO documents (key, data) VALUES (?, ?)",
+                    (key, data),
+                )
+
+
+_databases: Dict[str, SaveDatabase] = {}
+
+
+def get_database_path(clanname: str) -> str:
+    return f"{get_save_dir()}/{clanname}/{SAVE_DATABASE_NAME}"
+
+
+def get_save_database(clanname: str, create=False) -> Optional[SaveDatabase]:
+    """
+    Returns the save database of a Clan. The same object is returned every time, so it remembers what was saved.
+    :param clanname: Name of the Clan
+    :param create: If True, create the database if the Clan doesn't have one yet. Otherwise, return None.
+    """
+    path = get_database_path(clanname)
+    if path in _databases:
+        if os.path.exists(path):
+            return _databases[path]
+        _databases.pop(path).close()
+
+    if not create and not os.path.exists(path):
+        return None
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _databases[path] = SaveDatabase(path)
+    return _databases[path]
+
+
+def remove_save_database(clanname: str):
+    """Deletes a Clan's save database, so the Clan is loaded from its JSON files again."""
+    path = get_database_path(clanname)
+    if path in _databases:
+        _databases.pop(path).close()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def remove_json_cat_files(clanname: str):
+    """Deletes the JSON files that the save database replaces."""
+    directory = f"{get_save_dir()}/{clanname}"
+    for folder, _ in CAT_TABLES.values():
+        folder_path = f"{directory}/{folder}"
+        if not os.path.isdir(folder_path):
+            continue
+        for file in os.listdir(folder_path):
+            os.remove(os.path.join(folder_path, file))
+    for file in ("clan_cats.json", *DOCUMENTS.values()):
+        if os.path.exists(f"{directory}/{file}"):
+            os.remove(f"{directory}/{file}")
+
+
+# ---------------------------------------------------------------------------- #
+#                                  converters                                  #
+# ---------------------------------------------------------------------------- #
+
+
+def json_to_database(clanname: str) -> SaveDatabase:
+    """Reads a Clan's JSON save files into its save database. The JSON files are left in place."""
+    directory = f"{get_save_dir()}/{clanname}"
+    tables = {}
+
+    tables["cats"] = {}
+    if os.path.exists(f"{directory}/clan_cats.json"):
+        tables["cats"] = {
+            cat["ID"]: cat for cat in load_save_file(f"{directory}/clan_cats.json")
+        }
+
+    for table, (folder, suffix) in CAT_TABLES.items():
+        tables[table] = {}
+        if not os.path.isdir(f"{directory}/{folder}"):
+            continue
+        for file in sorted(os.listdir(f"{directory}/{folder}")):
+            if not file.endswith(suffix):
+                continue
+            tables[table][file[: -len(suffix)]] = load_save_file(
+                f"{directory}/{folder}/{file}"
+            )
+
+    documents = {}
+    for key, file in DOCUMENTS.items():
+        if os.path.exists(f"{directory}/{file}"):
+            documents[key] = load_save_file(f"{directory}/{file}")
+
+    database = get_save_database(clanname, create=True)
+    database.save(tables, documents)
+    return database
+
+
+def database_to_json(clanname: str):
+    """Writes a Clan's save database out as JSON save files. The database is left in place."""
+    from scripts.game_structure.game_essentials import game
+
+    database = get_save_database(clanname)
+    if database is None:
+        return
+    directory = f"{get_save_dir()}/{clanname}"
+
+    game.safe_save(f"{directory}/clan_cats.json", database.read_all("cats"))
+    for table, (folder, suffix) in CAT_TABLES.items():
+        os.makedirs(f"{directory}/{folder}", exist_ok=True)
+        for key in database.keys(table):
+            game.safe_save(
+                f"{directory}/{folder}/{key}{suffix}", database.read(table, key)
+            )
+    for key, file in DOCUMENTS.items():
+        document = database.read_document(key)
+        if document is not None:
+            game.safe_save(f"{directory}/{file}", document)
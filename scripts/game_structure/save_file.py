@@ -0,0 +1,240 @@
+"""
+Writing and reading save files.
+
+Files are written atomically: the data goes to a temporary file next to the save file, which is
+flushed to disk and then renamed over the save file. A crash leaves either the old file or the new
+one, never half of one. The rename itself only lasts once the folder holding the file is synced too.
+
+Every folder written to has a manifest, MANIFEST_NAME, holding the checksum of each save file in it
+along with the file's size and modification time. Keeping the checksums out of the files means they
+stay plain JSON, which older versions of the game and save editors can still read. A file is checked
+against its checksum when it is loaded, rather than read back after every write. The check is only
+made if the file's size and modification time are still the ones recorded: a file changed by anything
+else, like a save editor or an older version of the game, is loaded without a check.
+
+Saves that write many files can update each folder's manifest and sync the folder once at the end with
+deferred_directory_sync, instead of after every file. It can also be used as a decorator.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+import ujson
+
+MANIFEST_NAME = ".checksums"
+TEMP_SUFFIX = ".tmp"
+
+# the permissions new files get, as open() would create them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_deferred = threading.local()
+# the manifest of each folder, as read from or written to disk, by folder:
+# [modification time of the manifest, {file name: [checksum, size, modification time]}]
+_manifests: Dict[str, list] = {}
+# files are written on the save thread, while they can be read on any other
+_manifest_lock = threading.RLock()
+
+
+class CorruptSaveFileError(ValueError):
+    """A save file's checksum doesn't match its contents."""
+
+
+def dump_json(data, pretty: bool = False) -> str:
+    """Serializes save data. Compact, unless pretty is True."""
+    if pretty:
+        return ujson.dumps(data, indent=4)
+    return ujson.dumps(data)
+
+
+def get_checksum(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_manifest(directory: str) -> dict:
+    """Returns the checksums of the files in a folder. Only call this while holding _manifest_lock."""
+    path = os.path.join(directory, MANIFEST_NAME)
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except OSError:
+        modified = None
+
+    cached = _manifests.get(directory)
+    if cached is not None and cached[0] == modified:
+        return cached[1]
+
+    entries = {}
+    if modified is not None:
+        try:
+            with open(path, "r", encoding="utf-8") as read_file:
+                entries = ujson.loads(read_file.read())
+        except (OSError, ValueError):
+            # a damaged manifest only means the files in the folder can't be checked
+            entries = {}
+    _manifests[directory] = [modified, entries]
+    return entries
+
+
+def _check_file(path: str, text: str, stat: os.stat_result):
+    """Raises CorruptSaveFileError if a file's contents don't match the checksum recorded for them."""
+    directory, file_name = os.path.split(os.path.normpath(path))
+    with _manifest_lock:
+        entry = _get_manifest(directory or ".").get(file_name)
+    if entry is None or entry[1:] != [stat.st_size, stat.st_mtime_ns]:
+        return
+    if entry[0] != get_checksum(text):
+        raise CorruptSaveFileError(
+            f"{path} doesn't match its checksum, so it is damaged. If it was changed on purpose, "
+            f"delete {os.path.join(directory, MANIFEST_NAME)} to load it anyway."
+        )
+
+
+def read_save_text(path: str) -> str:
+    """
+    Returns the contents of a save file.
+    :raises CorruptSaveFileError: If the file doesn't match its checksum
+    """
+    with open(path, "r", encoding="utf-8") as read_file:
+        text = read_file.read()
+        stat = os.fstat(read_file.fileno())
+    _check_file(path, text, stat)
+    return text
+
+
+def load_save_file(path: str):
+    """Returns the parsed contents of a JSON save file, with the checksum checked."""
+    return ujson.loads(read_save_text(path))
+
+
+def _replace_file(path: str, text: str):
+    """Writes a file atomically, keeping the permissions of the file it replaces."""
+    dir_name, file_name = os.path.split(path)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+
+    # the temporary file has to be in the same folder, so that it can be renamed over the save file
+    handle, temp_path = tempfile.mkstemp(
+        prefix=f".{file_name}.", suffix=TEMP_SUFFIX, dir=dir_name
+    )
+    try:
+        with open(handle, "w", encoding="utf-8") as write_file:
+            write_file.write(text)
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        # temporary files are only readable by their owner
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_save_file(path: str, text: str):
+    """
+    Writes a save file atomically, and records its checksum.
+    :param path: Path of the file. Its folder is created if it doesn't exist.
+    :param text: Contents of the file
+    """
+    dir_name, file_name = os.path.split(os.path.normpath(path))
+    if not file_name:
+        raise RuntimeError(f"Safe_Save: No file name was found in {path}")
+    dir_name = dir_name or "."
+    os.makedirs(dir_name, exist_ok=True)
+
+    _replace_file(path, text)
+
+    stat = os.stat(path)
+    with _manifest_lock:
+        _get_manifest(dir_name)[file_name] = [
+            get_checksum(text),
+            stat.st_size,
+            stat.st_mtime_ns,
+        ]
+
+    directories = getattr(_deferred, "directories", None)
+    if directories is not None:
+        directories.add(dir_name)
+    else:
+        finish_directory(dir_name)
+
+
+def write_manifest(directory: str):
+    """Writes the checksums of a folder's files to its manifest. Files that are gone are left out."""
+    with _manifest_lock:
+        existing = set(os.listdir(directory))
+        entries = {
+            name: entry
+            for name, entry in _get_manifest(directory).items()
+            if name in existing
+        }
+        path = os.path.join(directory, MANIFEST_NAME)
+        _replace_file(path, ujson.dumps(entries))
+        _manifests[directory] = [os.stat(path).st_mtime_ns, entries]
+
+
+def finish_directory(directory: str):
+    """Writes a folder's manifest, and syncs the folder so the files renamed into it stay after a crash."""
+    if not os.path.isdir(directory):
+        # removed since, along with the files
+        return
+    write_manifest(directory)
+    sync_directory(directory)
+
+
+def sync_directory(path: str):
+    """Flushes a folder to disk, so files renamed into it stay renamed after a crash. Not possible on Windows,
+    where renames are flushed along with the file."""
+    if os.name == "nt":
+        return
+    try:
+        handle = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(handle)
+    except OSError:
+        pass
+    finally:
+        os.close(handle)
+
+
+@contextmanager
+def deferred_directory_sync():
+    """Finishes the folders written to on this thread once, when the block ends, rather than after every file."""
+    if getattr(_deferred, "directories", None) is not None:
+        # already deferred by an outer block
+        yield
+        return
+
+    _deferred.directories = set()
+    try:
+        yield
+    finally:
+        directories = _deferred.directories
+        _deferred.directories = None
+        for directory in directories:
+            finish_directory(directory)
+
+
+def remove_temp_files(directory: str, recursive: bool = True):
+    """
+    Removes the temporary files left in a folder by saves that crashed. Only call this while nothing is being saved.
+    :param directory: The folder to clean up
+    :param recursive: If True, the folders in it are cleaned up too
+    """
+    for folder, _, files in os.walk(directory):
+        if not recursive and folder != directory:
+            break
+        for file in files:
+            if file.startswith(".") and file.endswith(TEMP_SUFFIX):
+                try:
+                    os.remove(os.path.join(folder, file))
+                except OSError:
+                    pass
@@ -0,0 +1,176 @@
+"""
+Saving in the background.
+
+A save happens in two steps. First, on the thread that asks for it, every file the save would write is
+collected into a SaveBatch instead of being written: while collect_save is active, Game.safe_save adds
+the file to the batch as the JSON text it will hold. This is the snapshot of the Clan, and after it is
+taken the game can carry on changing. ujson turns the save dicts into text faster than they could be
+copied in Python, so serializing is how the snapshot is taken.
+
+Then the batch is written to disk by the SaveQueue, on a single worker thread, so a moon skip or a
+screen doesn't wait on the disk. Batches are written one at a time, in the order they were queued, so
+a later save always ends up on top of an earlier one. Files that have to be removed are part of the
+batch too, so they aren't removed before an earlier save has written them. Saves to a Clan's save
+database are queued the same way, with their rows already turned into JSON text.
+"""
+
+import os
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from scripts.game_structure.save_file import MANIFEST_NAME, deferred_directory_sync
+
+_collecting = threading.local()
+
+
+def get_collecting_batch() -> Optional["SaveBatch"]:
+    """Returns the batch that saves on this thread are being collected into, or None."""
+    return getattr(_collecting, "batch", None)
+
+
+@contextmanager
+def collect_save(batch: Optional["SaveBatch"]):
+    """
+    Collects the files saved on this thread into batch, rather than writing them.
+    :param batch: Batch to collect into. If None, files are written straight away, even inside another collect_save.
+    """
+    previous = get_collecting_batch()
+    _collecting.batch = batch
+    try:
+        yield batch
+    finally:
+        _collecting.batch = previous
+
+
+class SaveBatch:
+    """The files written and removed by one save, in order."""
+
+    def __init__(self):
+        # ("write", path, text), ("remove", path, None), ("prune", directory, names to keep)
+        # or ("call", function, arguments)
+        self.operations: List[Tuple[str, object, object]] = []
+
+    def __len__(self):
+        return len(self.operations)
+
+    def write(self, path: str, data: str):
+        self.operations.append(("write", path, data))
+
+    def remove(self, path: str):
+        self.operations.append(("remove", path, None))
+
+    def prune(self, directory: str, keep: Iterable[str]):
+        """Removes every save file in directory that isn't in keep."""
+        self.operations.append(("prune", directory, frozenset(keep)))
+
+    def call(self, function: Callable, *args):
+        """Calls function with args when the batch is written, after the operations before it."""
+        self.operations.append(("call", function, args))
+
+    def get_written_paths(self) -> List[str]:
+        return [path for operation, path, _ in self.operations if operation == "write"]
+
+    def run(
+        self,
+        write_file: Callable[[str, str], None],
+        progress: Callable[[int], None] = None,
+    ):
+        """
+        Carries out the batch.
+        :param write_file: Writes text to a path
+        :param progress: Called with the number of operations done after each one
+        """
+        # each folder is synced once, after all of its files are written
+        with deferred_directory_sync():
+            for done, (operation, target, data) in enumerate(self.operations, start=1):
+                if operation == "write":
+                    write_file(target, data)
+                elif operation == "remove":
+                    if os.path.exists(target):
+                        os.remove(target)
+                elif operation == "prune" and os.path.isdir(target):
+                    for file in os.listdir(target):
+                        if file not in data and file != MANIFEST_NAME:
+                            os.remove(os.path.join(target, file))
+                elif operation == "call":
+                    target(*data)
+                if progress:
+                    progress(done)
+
+
+class SaveQueue:
+    """Writes SaveBatches one after another on a worker thread, and keeps track of how far along they are."""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        # operations done and in total, of the batch being written
+        self._progress = (0, 0)
+        # tracebacks of the saves that failed, waiting to be shown
+        self.errors: List[str] = []
+
+    def submit(
+        self, batch: SaveBatch, write_file: Callable[[str, str], None]
+    ) -> Future:
+        """
+        Queues a batch to be written after the ones already queued.
+        :param batch: The batch to write
+        :param write_file: Writes text to a path. Runs on the worker thread.
+        :return: A future which is done once the batch is written. If writing failed, it holds the exception.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="save"
+                )
+            future = self._executor.submit(self._run, batch, write_file)
+            self._pending.append(future)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _run(self, batch: SaveBatch, write_file: Callable[[str, str], None]):
+        self._progress = (0, len(batch))
+        try:
+            batch.run(write_file, lambda done: self._set_progress(done, len(batch)))
+        except Exception:
+            self.errors.append(traceback.format_exc())
+            raise
+
+    def _set_progress(self, done: int, total: int):
+        self._progress = (done, total)
+
+    def _finished(self, future: Future):
+        with self._lock:
+            if future in self._pending:
+                self._pending.remove(future)
+
+    def is_saving(self) -> bool:
+        """True while there are batches that haven't been written yet."""
+        with self._lock:
+            return bool(self._pending)
+
+    def get_progress(self) -> float:
+        """How much of the batch being written is done, from 0 to 1. 1 if nothing is being saved."""
+        if not self.is_saving():
+            return 1
+        done, total = self._progress
+        return done / total if total else 0
+
+    def wait(self):
+        """Blocks until every queued batch is written. Failures are left in errors, not raised."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+
+    def pop_errors(self) -> List[str]:
+        errors = self.errors
+        self.errors = []
+        return errors
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import ujson
 
+from scripts.game_structure.save_file import load_save_file
 from scripts.housekeeping.datadir import get_save_dir
 
 if TYPE_CHECKING:
@@ -216,10 +217,7 @@ def determine_screen_scale(x, y, ingame_switch):
 
         screen_config = game.settings
     else:
-        with open(
-            get_save_dir() + "/settings.json", "r", encoding="utf-8"
-        ) as read_config:
-            screen_config = ujson.loads(read_config.read())
+        screen_config = load_save_file(get_save_dir() + "/settings.json")
 
     if "fullscreen scaling" in screen_config and screen_config["fullscreen scaling"]:
         scalex = (x - 20) // 80
@@ -286,10 +284,7 @@ def load_manager(res: Tuple[int, int], screen_offset: Tuple[int, int], scale: fl
         MANAGER = None
 
     try:
-        with open(
-            get_save_dir() + "/settings.json", "r", encoding="utf-8"
-        ) as read_file:
-            settings_data = ujson.loads(read_file.read())
+        settings_data = load_save_file(get_save_dir() + "/settings.json")
     except FileNotFoundError:
         return
 
@@ -20,6 +20,8 @@ from scripts.utility import (
     shorten_text_to_fit,
     ui_scale_dimensions,
     ui_scale_value,
+    render_sprites,
+    prefetch_adjacent_pages,
 )
 
 
@@ -633,7 +635,12 @@ class UISpriteButton:
         text_kwargs=None,
         tool_tip_text_kwargs=None,
         anchors=None,
+        prescaled=False,
     ):
+        """
+        :param prescaled: Set True if the sprite came from render_sprites(), and so is already
+                          premultiplied and the size of relative_rect
+        """
         # The transparent button. This a subclass that UIButton that also hold the cat_id.
 
         self.button = CatButton(
@@ -651,19 +658,22 @@ class UISpriteButton:
             container=container,
             anchors=anchors,
         )
-        input_sprite = sprite.premul_alpha()
-        # if it's going to be small on the screen, smoothscale out the crunch
-        input_sprite = (
-            pygame.transform.smoothscale(input_sprite, relative_rect.size)
-            if (
-                (
-                    relative_rect.height <= ui_scale_value(sprite.get_height())
-                    or relative_rect.width <= ui_scale_value(sprite.get_height())
+        if prescaled:
+            input_sprite = sprite
+        else:
+            input_sprite = sprite.premul_alpha()
+            # if it's going to be small on the screen, smoothscale out the crunch
+            input_sprite = (
+                pygame.transform.smoothscale(input_sprite, relative_rect.size)
+                if (
+                    (
+                        relative_rect.height <= ui_scale_value(sprite.get_height())
+                        or relative_rect.width <= ui_scale_value(sprite.get_height())
+                    )
+                    and not game.settings["no sprite antialiasing"]
                 )
-                and not game.settings["no sprite antialiasing"]
+                else pygame.transform.scale(input_sprite, relative_rect.size)
             )
-            else pygame.transform.scale(input_sprite, relative_rect.size)
-        )
 
         self.image = pygame_gui.elements.UIImage(
             relative_rect,
@@ -1293,8 +1303,10 @@ class UICatListDisplay(UIContainer):
             [self.create_favor_indicator(i, self.boxes[i]) for i in fav_indexes]
 
         # CAT SPRITE
+        cat_rect = ui_scale(pygame.Rect((0, 15), (50, 50)))
+        rendered = render_sprites(display_cats, cat_rect.size)
         [
-            self.create_cat_button(i, kitty, self.boxes[i])
+            self.create_cat_button(i, kitty, self.boxes[i], rendered[i])
             for i, kitty in enumerate(display_cats)
         ]
 
@@ -1305,10 +1317,13 @@ class UICatListDisplay(UIContainer):
                 for i, kitty in enumerate(display_cats)
             ]
 
-    def create_cat_button(self, i, kitty, container):
+        # so the next and previous pages show straight away
+        prefetch_adjacent_pages(self.cat_chunks, self.current_page - 1)
+
+    def create_cat_button(self, i, kitty, container, sprite=None):
         self.cat_sprites[f"sprite{i}"] = UISpriteButton(
             ui_scale(pygame.Rect((0, 15), (50, 50))),
-            kitty.sprite,
+            kitty.sprite if sprite is None else sprite,
             cat_object=kitty,
             cat_id=kitty.ID,
             container=container,
@@ -1316,6 +1331,7 @@ class UICatListDisplay(UIContainer):
             tool_tip_text=str(kitty.name) if self.tool_tip_name else None,
             starting_height=1,
             anchors={"centerx": "centerx"},
+            prescaled=sprite is not None,
         )
 
     def create_name(self, i, kitty, container):
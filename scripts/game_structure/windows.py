@@ -226,6 +226,8 @@ class SaveCheck(UIWindow):
         self.last_screen = last_screen
         self.isMainMenu = is_main_menu
         self.mm_btn = mm_btn
+        # the save started by the save button, while it is being written
+        self.save_future = None
         # adding a variable for starting_height to make sure that this menu is always on top
         top_stack_menu_layer_height = 10000
         if self.isMainMenu:
@@ -328,12 +330,7 @@ class SaveCheck(UIWindow):
                 if game.clan is not None:
                     self.save_button_saving_state.show()
                     self.save_button.disable()
-                    game.save_cats()
-                    game.clan.save_clan()
-                    game.clan.save_pregnancy(game.clan)
-                    game.save_events()
-                    self.save_button_saving_state.hide()
-                    self.save_button_saved_state.show()
+                    self.save_future = game.save_game()
             elif event.ui_element == self.back_button:
                 game.is_close_menu_open = False
                 self.kill()
@@ -343,6 +340,17 @@ class SaveCheck(UIWindow):
                 # only allow one instance of this window
         return super().process_event(event)
 
+    def update(self, time_delta: float):
+        if self.save_future is not None and self.save_future.done():
+            self.save_button_saving_state.hide()
+            if self.save_future.exception() is None:
+                self.save_button_saved_state.show()
+            else:
+                # the error is shown by game.report_save_errors
+                self.save_button.enable()
+            self.save_future = None
+        super().update(time_delta)
+
 
 class DeleteCheck(UIWindow):
     def __init__(self, reloadscreen, clan_name):
@@ -395,6 +403,8 @@ class DeleteCheck(UIWindow):
     def process_event(self, event):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             if event.ui_element == self.delete_it_button:
+                # a save that is still being written would put the files back
+                game.save_queue.wait()
                 rempath = get_save_dir() + "/" + self.clan_name
                 shutil.rmtree(rempath)
                 if os.path.exists(rempath + "clan.json"):
@@ -21,6 +21,8 @@ from scripts.utility import (
     ui_scale_dimensions,
     ui_scale_offset,
     shorten_text_to_fit,
+    render_sprites,
+    prefetch_adjacent_pages,
 )
 from .Screens import Screens
 from ..game_structure.screen_settings import MANAGER
@@ -476,16 +478,20 @@ class ChooseMateScreen(Screens):
         else:
             display_cats = []
 
+        rendered = render_sprites(display_cats, ui_scale_dimensions((50, 50)))
+        prefetch_adjacent_pages(self.all_mates, self.mates_page)
+
         pos_x = 15
         pos_y = 0
         i = 0
         for _mate in display_cats:
             self.mates_cat_buttons["cat" + str(i)] = UISpriteButton(
                 ui_scale(pygame.Rect((pos_x, pos_y), (50, 50))),
-                _mate.sprite,
+                rendered[i],
                 cat_object=_mate,
                 manager=MANAGER,
                 container=self.mates_container,
+                prescaled=True,
             )
             pos_x += 60
             if pos_x >= 600:
@@ -570,6 +576,9 @@ class ChooseMateScreen(Screens):
         else:
             display_cats = []
 
+        rendered = render_sprites(display_cats, ui_scale_dimensions((50, 50)))
+        prefetch_adjacent_pages(self.all_offspring, self.offspring_page)
+
         pos_x = 15
         pos_y = 0
         i = 0
@@ -593,12 +602,13 @@ class ChooseMateScreen(Screens):
 
             self.offspring_cat_buttons["cat" + str(i)] = UISpriteButton(
                 ui_scale(pygame.Rect((pos_x, pos_y), (50, 50))),
-                _off.sprite,
+                rendered[i],
                 cat_object=_off,
                 manager=MANAGER,
                 container=self.offspring_container,
                 tool_tip_text=info_text,
                 starting_height=2,
+                prescaled=True,
             )
             pos_x += 60
             if pos_x >= 495:
@@ -715,6 +725,9 @@ class ChooseMateScreen(Screens):
         else:
             display_cats = []
 
+        rendered = render_sprites(display_cats, ui_scale_dimensions((50, 50)))
+        prefetch_adjacent_pages(self.all_potential_mates, self.potential_mates_page)
+
         pos_x = 15
         pos_y = 0
         i = 0
@@ -722,9 +735,10 @@ class ChooseMateScreen(Screens):
         for _off in display_cats:
             self.potential_mates_buttons["cat" + str(i)] = UISpriteButton(
                 ui_scale(pygame.Rect((pos_x, pos_y), (50, 50))),
-                _off.sprite,
+                rendered[i],
                 cat_object=_off,
                 container=self.potential_container,
+                prescaled=True,
             )
             pos_x += 60
             if pos_x >= 495:
@@ -19,6 +19,8 @@ from scripts.utility import (
     ui_scale,
     ui_scale_dimensions,
     shorten_text_to_fit,
+    render_sprites,
+    prefetch_adjacent_pages,
 )
 from .Screens import Screens
 from ..game_structure.screen_settings import MANAGER
@@ -562,15 +564,19 @@ class ChooseMentorScreen(Screens):
             self.cat_list_buttons[ele].kill()
         self.cat_list_buttons = {}
 
+        rendered = render_sprites(display_cats, ui_scale_dimensions((50, 50)))
+        prefetch_adjacent_pages(valid_mentors, self.current_page - 1)
+
         pos_x = 0
         pos_y = 20
         i = 0
         for cat in display_cats:
             self.cat_list_buttons["cat" + str(i)] = UISpriteButton(
                 ui_scale(pygame.Rect((100 + pos_x, 365 + pos_y), (50, 50))),
-                cat.sprite,
+                rendered[i],
                 cat_object=cat,
                 manager=MANAGER,
+                prescaled=True,
             )
             pos_x += 60
             if pos_x >= 450:
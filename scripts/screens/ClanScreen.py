@@ -1,5 +1,6 @@
 import random
 import traceback
+from collections import OrderedDict
 from copy import deepcopy
 
 import pygame
@@ -21,6 +22,7 @@ from scripts.utility import (
     ui_scale,
     ui_scale_dimensions,
     get_current_season,
+    get_appearance_key,
 )
 from .Screens import Screens
 from ..ui.generate_button import ButtonStyles, get_button_dict
@@ -32,6 +34,12 @@ class ClanScreen(Screens):
     )
     cat_buttons = []
 
+    # the camp background blurred to shade the cats with, by biome, camp, season, light/dark, size and blur
+    shading_maps = {}
+    # shaded cat sprites, by shading map, appearance key and placement. Most recently used entries are at the end.
+    shaded_sprites = OrderedDict()
+    shaded_sprites_size = 2 * max_sprites_displayed
+
     def __init__(self, name=None):
         super().__init__(name)
         self.show_den_labels_text = None
@@ -46,29 +54,21 @@ class ClanScreen(Screens):
         self.leader_den_label = None
         self.warrior_den_label = None
         self.layout = None
+        # the save started by the save button, while it is being written
+        self.save_future = None
+        self.save_progress_text = None
 
     def on_use(self):
         if not game.clan.clan_settings["backgrounds"]:
             self.set_bg(None)
+        self.update_save_progress()
         super().on_use()
 
     def handle_event(self, event):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             self.mute_button_pressed(event)
             if event.ui_element == self.save_button:
-                try:
-                    self.save_button_saving_state.show()
-                    self.save_button.disable()
-                    game.save_cats()
-                    game.clan.save_clan()
-                    game.clan.save_pregnancy(game.clan)
-                    game.save_events()
-                    game.save_settings(self)
-                    game.switches["saved_clan"] = True
-                    self.update_buttons_and_text()
-                except RuntimeError:
-                    SaveError(traceback.format_exc())
-                    self.change_screen("start screen")
+                self.save()
             if event.ui_element in self.cat_buttons:
                 game.switches["cat"] = event.ui_element.return_cat_id()
                 self.change_screen("profile screen")
@@ -97,15 +97,44 @@ class ClanScreen(Screens):
             elif event.key == pygame.K_LEFT:
                 self.change_screen("events screen")
             elif event.key == pygame.K_SPACE:
-                self.save_button_saving_state.show()
-                self.save_button.disable()
-                game.save_cats()
-                game.clan.save_clan()
-                game.clan.save_pregnancy(game.clan)
-                game.save_events()
-                game.save_settings(self)
-                game.switches["saved_clan"] = True
-                self.update_buttons_and_text()
+                self.save()
+
+    def save(self):
+        """Starts saving the Clan in the background. The saving button shows how far along it is."""
+        self.save_button_saving_state.show()
+        self.save_button.disable()
+        try:
+            self.save_future = game.save_game()
+            game.save_settings(self)
+        except RuntimeError:
+            SaveError(traceback.format_exc())
+            self.change_screen("start screen")
+
+    def update_save_progress(self):
+        """Shows the progress of the save started by the save button, and the saved button once it's written."""
+        if self.save_future is None:
+            return
+
+        if not self.save_future.done():
+            text = f"{game.save_queue.get_progress():.0%}"
+            if text != self.save_progress_text:
+                self.save_progress_text = text
+                self.save_button_saving_state.set_text(
+                    "buttons.saving_progress", text_kwargs={"progress": text}
+                )
+            return
+
+        failed = self.save_future.exception() is not None
+        self.save_future = None
+        self.save_progress_text = None
+        self.save_button_saving_state.set_text("buttons.saving")
+        if failed:
+            # the error is shown by game.report_save_errors
+            self.save_button_saving_state.hide()
+            self.save_button.enable()
+        else:
+            game.switches["saved_clan"] = True
+            self.update_buttons_and_text()
 
     def screen_switches(self):
         super().screen_switches()
@@ -148,30 +177,7 @@ class ClanScreen(Screens):
                     break
 
                 try:
-                    image = Cat.all_cats[x].sprite.convert_alpha()
-                    blend_layer = (
-                        self.game_bgs[self.active_bg]
-                        .subsurface(
-                            ui_scale(
-                                pygame.Rect(tuple(Cat.all_cats[x].placement), (50, 50))
-                            )
-                        )
-                        .convert_alpha()
-                    )
-                    blend_layer = pygame.transform.box_blur(
-                        blend_layer, self.layout["cat_shading"]["blur"]
-                    )
-
-                    sprite = image.copy()
-                    sprite.fill(
-                        (255, 255, 255, 255), special_flags=pygame.BLEND_RGB_MAX
-                    )
-                    sprite.blit(
-                        blend_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
-                    )
-                    image.set_alpha(self.layout["cat_shading"]["blend_strength"])
-                    sprite.blit(image, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-                    sprite.set_alpha(255)
+                    sprite = self.get_shaded_sprite(Cat.all_cats[x])
 
                     self.cat_buttons.append(
                         UISpriteButton(
@@ -334,8 +340,63 @@ class ClanScreen(Screens):
         self.show_den_labels_text.kill()
         del self.show_den_labels_text
 
-        # reset save status
+        # reset save status. A save that is still being written carries on in the background
         game.switches["saved_clan"] = False
+        self.save_future = None
+        self.save_progress_text = None
+
+    def get_shading_map(self):
+        """
+        Returns the key and the surface of the blurred camp background that the cats are shaded with.
+        The background is only blurred once for each season, light/dark mode and screen scale.
+        """
+        background = self.game_bgs[self.active_bg]
+        key = (
+            game.clan.biome,
+            game.clan.camp_bg,
+            self.active_bg,
+            game.settings["dark mode"],
+            background.get_size(),
+            self.layout["cat_shading"]["blur"],
+        )
+        if key not in ClanScreen.shading_maps:
+            if len(ClanScreen.shading_maps) >= 8:
+                ClanScreen.shading_maps.clear()
+            ClanScreen.shading_maps[key] = pygame.transform.box_blur(
+                background.convert_alpha(), self.layout["cat_shading"]["blur"]
+            )
+        return key, ClanScreen.shading_maps[key]
+
+    def get_shaded_sprite(self, cat) -> pygame.Surface:
+        """Returns the sprite of a cat, shaded by the part of the camp background it is placed on."""
+        map_key, shading_map = self.get_shading_map()
+        key = (
+            map_key,
+            get_appearance_key(cat),
+            tuple(cat.placement),
+            self.layout["cat_shading"]["blend_strength"],
+        )
+        sprite = ClanScreen.shaded_sprites.get(key)
+        if sprite is not None:
+            ClanScreen.shaded_sprites.move_to_end(key)
+            return sprite
+
+        image = cat.sprite.convert_alpha()
+        blend_layer = shading_map.subsurface(
+            ui_scale(pygame.Rect(tuple(cat.placement), (50, 50)))
+        )
+
+        sprite = image.copy()
+        sprite.fill((255, 255, 255, 255), special_flags=pygame.BLEND_RGB_MAX)
+        sprite.blit(blend_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        image.set_alpha(self.layout["cat_shading"]["blend_strength"])
+        sprite.blit(image, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        sprite.set_alpha(255)
+
+        ClanScreen.shaded_sprites[key] = sprite
+        while len(ClanScreen.shaded_sprites) > ClanScreen.shaded_sprites_size:
+            ClanScreen.shaded_sprites.popitem(last=False)
+        return sprite
 
     def update_camp_bg(self):
         light_dark = "dark" if game.settings["dark mode"] else "light"
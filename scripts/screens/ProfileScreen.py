@@ -7,7 +7,6 @@ from re import sub
 import i18n
 import pygame
 import pygame_gui
-import ujson
 
 from scripts.cat.cats import Cat, BACKSTORIES
 from ..cat.enums import CatAgeEnum
@@ -15,6 +14,7 @@ from scripts.cat.pelts import Pelt
 from scripts.clan_resources.freshkill import FRESHKILL_ACTIVE
 from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.save_file import load_save_file
 from scripts.game_structure.ui_elements import (
     UIImageButton,
     UITextBoxTweaked,
@@ -1132,11 +1132,10 @@ class ProfileScreen(Screens):
             return
 
         try:
-            with open(notes_file_path, "r", encoding="utf-8") as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.user_notes = i18n.t("screens.profile.user_notes")
-                if str(self.the_cat.ID) in rel_data:
-                    self.user_notes = rel_data.get(str(self.the_cat.ID))
+            rel_data = load_save_file(notes_file_path)
+            self.user_notes = i18n.t("screens.profile.user_notes")
+            if str(self.the_cat.ID) in rel_data:
+                self.user_notes = rel_data.get(str(self.the_cat.ID))
         except Exception as e:
             print(
                 f"ERROR: there was an error reading the Notes file of cat #{self.the_cat.ID}.\n",
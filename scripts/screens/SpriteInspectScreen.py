@@ -8,7 +8,7 @@ from scripts.cat.cats import Cat
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.ui_elements import UIImageButton, UISurfaceImageButton
 from scripts.utility import (
-    generate_sprite,
+    get_cached_sprite,
     shorten_text_to_fit,
     ui_scale_dimensions,
     ui_scale_offset,
@@ -386,7 +386,7 @@ class SpriteInspectScreen(Screens):
         if "cat_image" in self.cat_elements:
             self.cat_elements["cat_image"].kill()
 
-        self.cat_image = generate_sprite(
+        self.cat_image = get_cached_sprite(
             self.the_cat,
             life_state=self.valid_life_stages[self.displayed_life_stage],
             scars_hidden=not self.scars_shown,
@@ -12,6 +12,7 @@ from scripts.housekeeping.version import get_version_info
 from scripts.ui.generate_box import get_box, BoxStyles
 from scripts.ui.generate_button import get_button_dict, ButtonStyles
 from scripts.ui.icon import Icon
+from scripts.ui.surface_effects import feather_surface
 from scripts.utility import (
     ui_scale,
     ui_scale_offset,
@@ -543,20 +544,4 @@ def process_blur_bg(
     return bg
 
 
-def feather_surface(surface, feather_width):
-    """
-    Run a per-pixel effect to make a fun fade-to-transparent border
-    :param surface: The surface to add a feathered edge to
-    :param feather_width: How fat to make the edge
-    :return: None
-    """
-    width, height = surface.get_size()
-    for x in range(width):
-        for y in range(height):
-            distance = min(x, y, width - x - 1, height - y - 1)
-            if distance < feather_width:
-                alpha = int(255 * (distance / feather_width))
-                surface.set_at((x, y), (0, 0, 0, alpha))
-
-
 rebuild_core()
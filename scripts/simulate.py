@@ -0,0 +1,248 @@
+"""
+Runs moon skips without a window, for soak-testing and profiling big Clans on a server or in CI.
+
+Run from the repository root:
+    python -m scripts.simulate --clan <name> --moons 500 --seed 42
+
+If there is a save for the Clan it is loaded, otherwise a new Clan with that name is made. Each moon is
+run with Events.one_moon, exactly as the events screen does, but on this thread and with SDL's dummy video
+and audio drivers. None of the screens are imported. The Clan is only saved at the end if --save is given,
+and autosaving is off while the moons run. The moons stop early if no living cats are left.
+
+With --seed, the Clan is given that seed (see scripts/game_structure/rng.py), so running the same moons
+from the same save again gives the same events. The seed is saved with the Clan. Replays also need the
+same PYTHONHASHSEED, so with --seed the script runs itself again with it set, if it isn't already.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Optional, Tuple
+
+# these have to be set before pygame is first imported
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.housekeeping.datadir import setup_data_dir
+
+setup_data_dir()
+
+from scripts.cat.cats import Cat, create_cat
+from scripts.cat.sprites import sprites
+from scripts.clan import Clan, clan_class
+from scripts.clan_resources.herb.herb_supply import HerbSupply
+from scripts.events import events_class
+from scripts.events_module.patrol.patrol import Patrol
+from scripts.game_structure.game_essentials import game
+from scripts.game_structure import rng
+from scripts.game_structure.load_cat import load_cats, version_convert
+from scripts.game_structure.save_file import deferred_directory_sync
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.simulate",
+        description="Run moon skips without a window.",
+    )
+    parser.add_argument(
+        "--clan",
+        required=True,
+        help="name of the Clan, without 'Clan'. A new Clan is made if there is no save for it",
+    )
+    parser.add_argument(
+        "--moons", type=int, default=100, help="how many moons to run (default 100)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed for the Clan's random numbers. A loaded Clan keeps the seed it was saved with if not given",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="save the Clan after the last moon"
+    )
+    parser.add_argument(
+        "--cats",
+        type=int,
+        default=30,
+        help="how many cats a new Clan starts with (default 30)",
+    )
+    parser.add_argument(
+        "--biome",
+        default="Forest",
+        choices=["Forest", "Mountainous", "Plains", "Beach"],
+        help="biome of a new Clan (default Forest)",
+    )
+    parser.add_argument(
+        "--game-mode",
+        default="classic",
+        choices=["classic", "expanded", "cruel season"],
+        help="game mode of a new Clan (default classic). No patrols are run, so in the other modes the "
+        "Clan soon runs out of prey and starves",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="print how long each moon stage took in total",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="also trace the peak Python memory use. This slows the moons down a lot",
+    )
+    return parser.parse_args(argv)
+
+
+def load_clan(name: str):
+    """Loads a saved Clan, the same way the game does when it starts."""
+    clan_list = game.read_clans() or []
+    game.switches["clan_list"] = [name] + [clan for clan in clan_list if clan != name]
+    load_cats()
+    version_info = clan_class.load_clan()
+    version_convert(version_info)
+    game.load_events()
+
+
+def generate_clan(
+    name: str, size: int, biome: str, game_mode: str, season: str = "Newleaf"
+):
+    """
+    Makes a new Clan with randomly made cats, the same way the Clan creation screen does.
+    The Clan the game opens with is left as it was.
+    """
+    current_clan = (game.read_clans() or [None])[0]
+
+    statuses = ["kitten", "apprentice", "warrior", "warrior", "elder"]
+    leader = create_cat(status="warrior")
+    deputy = create_cat(status="warrior")
+    medicine_cat = create_cat(status="medicine cat")
+    members = [leader, deputy, medicine_cat] + [
+        create_cat(status=random.choice(statuses)) for _ in range(max(0, size - 3))
+    ]
+
+    game.switches["biome"] = biome
+    game.switches["camp_bg"] = "camp1"
+    game.switches["game_mode"] = game_mode
+    game.clan = Clan(
+        name=name,
+        leader=leader,
+        deputy=deputy,
+        medicine_cat=medicine_cat,
+        biome=biome,
+        camp_bg="camp1",
+        game_mode=game_mode,
+        starting_members=members,
+        starting_season=season,
+    )
+    game.clan.create_clan()
+    game.cur_events_list.clear()
+    game.herb_events_list.clear()
+    # the herbs are only set up if there is a Clan already, which there isn't while the Clan is being made
+    game.clan.herb_supply = HerbSupply()
+    game.clan.herb_supply.start_storage(len(members))
+    Cat.grief_strings.clear()
+    Cat.sort_cats()
+
+    if current_clan:
+        game.save_clanlist(current_clan)
+
+
+def save_clan():
+    with deferred_directory_sync():
+        game.save_cats()
+        game.clan.save_clan()
+        game.clan.save_pregnancy(game.clan)
+        game.clan.save_herb_supply(game.clan)
+        game.save_events()
+
+
+def run_moons(moons: int) -> Tuple[int, float]:
+    """
+    Runs a number of moon skips, stopping early if there are no living cats left in the Clan.
+    :return: How many moons were run, and how long they took in seconds
+    """
+    autosave = game.clan.clan_settings.get("autosave")
+    game.clan.clan_settings["autosave"] = False
+    moons_run = 0
+    start = time.perf_counter()
+    try:
+        while moons_run < moons and Cat.index.count():
+            events_class.one_moon()
+            moons_run += 1
+    finally:
+        game.clan.clan_settings["autosave"] = autosave
+    return moons_run, time.perf_counter() - start
+
+
+def get_peak_memory() -> Optional[int]:
+    """Returns the most memory this process has used so far in bytes, or None where that can't be found."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes everywhere but macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    rng.seed(args.seed)
+
+    start = time.perf_counter()
+    # Clans need the symbol sheet. Cat sprites are only loaded if something draws one.
+    sprites.load_all()
+    if args.clan in (game.read_clans() or []):
+        load_clan(args.clan)
+        print(f"Loaded {game.clan.name}Clan", end="")
+    else:
+        generate_clan(args.clan, args.cats, args.biome, args.game_mode)
+        print(f"Made {game.clan.name}Clan", end="")
+    print(
+        f" with {len(Cat.all_cats)} cats in {time.perf_counter() - start:.2f}s"
+        f" (moon {game.clan.age})"
+    )
+    if args.seed is not None:
+        game.clan.seed = args.seed
+    print(f"Seed: {game.clan.seed}")
+    Patrol.used_patrols.clear()
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    moons_run, elapsed = run_moons(args.moons)
+
+    print(
+        f"Ran {moons_run} moons in {elapsed:.2f}s "
+        f"({moons_run / elapsed if elapsed else 0:.1f} moons/sec)"
+    )
+    if moons_run < args.moons:
+        print(
+            f"WARNING: stopped {args.moons - moons_run} moons early, as there are no living cats left"
+        )
+    print(
+        f"Clan is at moon {game.clan.age}: {len(Cat.all_cats)} cats, {Cat.index.count()} living"
+    )
+
+    peak = get_peak_memory()
+    if peak is not None:
+        print(f"Peak memory: {peak / 2 ** 20:.1f} MiB")
+    if args.tracemalloc:
+        print(f"Peak traced Python memory: {tracemalloc.get_traced_memory()[1] / 2 ** 20:.1f} MiB")
+        tracemalloc.stop()
+
+    if args.timings:
+        for line in events_class.moon_timings.get_breakdown(total=True):
+            print(line)
+
+    if args.save:
+        save_clan()
+        print(f"Saved {game.clan.name}Clan")
+
+
+if __name__ == "__main__":
+    if parse_args().seed is not None:
+        # sets of strings are iterated in a different order on every run otherwise, which a seed can't fix
+        rng.rerun_with_hash_seed("scripts.simulate", sys.argv[1:])
+    main()
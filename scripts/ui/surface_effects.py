@@ -0,0 +1,76 @@
+"""
+Whole-surface alpha effects for sprites and screen elements.
+
+Each effect works on the surface as a whole with pygame's blend and draw functions, which run in C,
+rather than reading and writing each pixel from Python with get_at/set_at. That makes no difference on
+a cat sprite, but a full-screen surface at a large UI scale has millions of pixels.
+"""
+
+import pygame
+
+
+def apply_opacity(surface: pygame.Surface, opacity: float) -> pygame.Surface:
+    """
+    Scales the alpha of every pixel of a surface, in place.
+    :param surface: A surface with per-pixel alpha
+    :param opacity: The new opacity, as a percentage of the current one
+    :return: The same surface
+    """
+    alpha = max(0, min(255, round(255 * opacity / 100)))
+    surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+
+def apply_fade_mask(surface: pygame.Surface, mask: pygame.Surface, pos=(0, 0)):
+    """
+    Multiplies the colour and alpha of a surface by those of a mask, in place. A white mask keeps the
+    surface as it is, where a transparent mask fades it out.
+    :param surface: The surface to fade
+    :param mask: The mask to multiply with
+    :param pos: Where to put the top left corner of the mask on the surface
+    :return: The same surface
+    """
+    surface.blit(mask, pos, special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+
+def make_fade_mask(size, fade_width: int) -> pygame.Surface:
+    """
+    Returns a white mask that goes from transparent at its border to opaque fade_width pixels in,
+    for use with apply_fade_mask.
+    :param size: The size of the mask
+    :param fade_width: How many pixels the fade takes
+    """
+    mask = pygame.Surface(size, pygame.SRCALPHA)
+    mask.fill((255, 255, 255, 255))
+    _draw_border_gradient(mask, fade_width, (255, 255, 255))
+    return mask
+
+
+def feather_surface(surface: pygame.Surface, feather_width: int):
+    """
+    Makes a fade-to-transparent border, by setting the border pixels to black going from transparent at
+    the edge to opaque feather_width pixels in. The rest of the surface is left as it is.
+    :param surface: The surface to add a feathered edge to
+    :param feather_width: How fat to make the edge
+    :return: None
+    """
+    _draw_border_gradient(surface, feather_width, (0, 0, 0))
+
+
+def _draw_border_gradient(surface: pygame.Surface, width: int, colour):
+    """Sets each ring of pixels less than width from the edge to colour, with an alpha going up towards the middle"""
+    surface_width, surface_height = surface.get_size()
+    for distance in range(min(width, (min(surface_width, surface_height) + 1) // 2)):
+        alpha = int(255 * (distance / width))
+        pygame.draw.rect(
+            surface,
+            (*colour, alpha),
+            (
+                distance,
+                distance,
+                surface_width - 2 * distance,
+                surface_height - 2 * distance,
+            ),
+            width=1,
+        )
@@ -9,11 +9,14 @@ TODO: Docs
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from itertools import combinations
 from math import floor
 from random import choice, choices, randint, random, sample, randrange, getrandbits
 from sys import exit as sys_exit
-from typing import List, Tuple, TYPE_CHECKING, Type, Union
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING, Type, Union
 
 import i18n
 import pygame
@@ -33,6 +36,7 @@ from scripts.cat.history import History
 from scripts.cat.names import names
 from scripts.cat.sprites import sprites
 from scripts.game_structure.game_essentials import game
+from scripts.ui.surface_effects import apply_fade_mask, apply_opacity
 import scripts.game_structure.screen_settings  # must be done like this to get updates when we change screen size etc
 
 if TYPE_CHECKING:
@@ -100,11 +104,7 @@ def get_alive_status_cats(
     :param bool sort: default False, set to True if you would like list sorted by descending moon age
     """
 
-    alive_cats = [
-        i
-        for i in Cat.all_cats.values()
-        if i.status in get_status and not i.dead and not i.outside
-    ]
+    alive_cats = Cat.index.get_cats(status=get_status)
 
     if working:
         alive_cats = [i for i in alive_cats if not i.not_working()]
@@ -133,12 +133,7 @@ def get_living_clan_cat_count(Cat):
     Returns the int of all living cats within the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if the_cat.dead or the_cat.exiled or the_cat.outside:
-            continue
-        count += 1
-    return count
+    return Cat.index.count()
 
 
 def get_cats_same_age(Cat, cat, age_range=10):
@@ -205,15 +200,7 @@ def get_random_moon_cat(
     random_cat = None
 
     # grab list of possible random cats
-    possible_r_c = list(
-        filter(
-            lambda c: not c.dead
-                      and not c.exiled
-                      and not c.outside
-                      and (c.ID != main_cat.ID),
-            Cat.all_cats.values(),
-        )
-    )
+    possible_r_c = Cat.index.get_cats(exclude=main_cat)
 
     if possible_r_c:
         random_cat = choice(possible_r_c)
@@ -1907,13 +1894,11 @@ def get_special_snippet_list(
         if (
                 chosen_list == "story_list"
         ):  # story list has some biome specific things to collect
-            snippets = SNIPPETS[chosen_list]["general"]
-            snippets.extend(SNIPPETS[chosen_list][biome])
+            snippets = SNIPPETS[chosen_list]["general"] + SNIPPETS[chosen_list][biome]
         elif (
                 chosen_list == "clair_list"
         ):  # the clair list also pulls from the dream list
-            snippets = SNIPPETS[chosen_list]
-            snippets.extend(SNIPPETS["dream_list"])
+            snippets = SNIPPETS[chosen_list] + SNIPPETS["dream_list"]
         else:  # the dream list just gets the one
             snippets = SNIPPETS[chosen_list]
 
@@ -2592,11 +2577,280 @@ def update_sprite(cat):
         return
 
     # apply
-    cat.sprite = generate_sprite(cat)
+    cat.sprite = get_cached_sprite(cat)
     # update class dictionary
     cat.all_cats[cat.ID] = cat
 
 
+# Finished sprites, keyed by appearance key. Most recently used entries are at the end.
+_sprite_cache = OrderedDict()
+_sprite_cache_stats = {"hits": 0, "misses": 0}
+SPRITE_CACHE_SIZE = 2048
+# Sprites scaled and premultiplied for UISpriteButton, keyed by (appearance key, size, smoothed).
+# These are screen sized, so only a few pages of cats are kept.
+_scaled_sprite_cache = OrderedDict()
+SCALED_SPRITE_CACHE_SIZE = 120
+# sprites can be composited on the worker threads, so every change to the caches holds this
+_sprite_cache_lock = threading.RLock()
+# Sprites being composited on the worker threads, by appearance key
+_pending_sprites: Dict[tuple, Future] = {}
+_sprite_executor = None
+SPRITE_WORKERS = 4
+
+
+def get_appearance_key(
+        cat,
+        life_state=None,
+        scars_hidden=False,
+        acc_hidden=False,
+        always_living=False,
+        no_not_working=False,
+) -> tuple:
+    """
+    Builds a hashable key out of everything generate_sprite() reads, so that two cats (or the same cat at two
+    different times) with equal keys are guaranteed to composite to identical sprites.
+    Takes the same optional arguments as generate_sprite().
+    """
+    pelt = cat.pelt
+    cat_sprite = _get_sprite_pose(cat, life_state, no_not_working)
+    dead = False if always_living else cat.dead
+
+    return (
+        cat.species,
+        cat_sprite,
+        pelt.name,
+        pelt.colour,
+        pelt.tortiebase,
+        pelt.tortiecolour,
+        pelt.tortiepattern,
+        pelt.pattern,
+        pelt.tint,
+        pelt.white_patches,
+        pelt.white_patches_tint,
+        pelt.points,
+        pelt.vitiligo,
+        pelt.eye_colour,
+        pelt.eye_colour2,
+        pelt.skin,
+        pelt.reverse,
+        None if scars_hidden else tuple(pelt.scars),
+        None if acc_hidden or not pelt.accessory else tuple(pelt.accessory),
+        dead,
+        cat.df if dead else False,
+        _get_fade_stage(cat, dead),
+        game.settings["shaders"],
+        sprites.size,
+    )
+
+
+def get_cached_sprite(cat, **kwargs) -> pygame.Surface:
+    """
+    Returns the sprite for a cat, only compositing it if no sprite with the same appearance key
+    is in the cache. Accepts the same optional arguments as generate_sprite().
+
+    The returned surface is shared between every cat with the same appearance - copy it before drawing on it.
+    """
+    return _lookup_sprite(cat, kwargs)
+
+
+def _lookup_sprite(cat, flags: dict, count: bool = True) -> pygame.Surface:
+    """
+    Returns the sprite for a cat from the cache, compositing it if it isn't there.
+    :param count: Whether to count this lookup as a hit or miss
+    """
+    key = get_appearance_key(cat, **flags)
+
+    with _sprite_cache_lock:
+        sprite = _sprite_cache.get(key)
+        if sprite is not None:
+            _sprite_cache.move_to_end(key)
+            if count:
+                _sprite_cache_stats["hits"] += 1
+            return sprite
+        if count:
+            _sprite_cache_stats["misses"] += 1
+
+    sprite = generate_sprite(cat, **flags)
+    _store_sprite(key, sprite)
+
+    return sprite
+
+
+def _store_sprite(key: tuple, sprite: pygame.Surface):
+    with _sprite_cache_lock:
+        _sprite_cache[key] = sprite
+        while len(_sprite_cache) > SPRITE_CACHE_SIZE:
+            _sprite_cache.popitem(last=False)
+
+
+def _get_sprite_executor() -> ThreadPoolExecutor:
+    global _sprite_executor
+    if _sprite_executor is None:
+        _sprite_executor = ThreadPoolExecutor(
+            max_workers=SPRITE_WORKERS, thread_name_prefix="sprites"
+        )
+    return _sprite_executor
+
+
+def _composite_sprite(cat, key: tuple, flags: dict):
+    """Runs on a worker thread. Only keeps the sprite if the cat didn't change while it was being drawn."""
+    try:
+        sprite = generate_sprite(cat, **flags)
+        if get_appearance_key(cat, **flags) == key:
+            _store_sprite(key, sprite)
+    finally:
+        with _sprite_cache_lock:
+            _pending_sprites.pop(key, None)
+
+
+def _queue_sprites(cats, flags: dict) -> list:
+    """
+    Starts compositing the sprites of a list of cats that aren't cached yet, once per appearance.
+    Faded cats have a fixed sprite of their own, so their key is None.
+    :return: The appearance key of each cat
+    """
+    keys = [None if cat.faded else get_appearance_key(cat, **flags) for cat in cats]
+    with _sprite_cache_lock:
+        queued = {}
+        for cat, key in zip(cats, keys):
+            if key is None or key in _sprite_cache or key in _pending_sprites:
+                continue
+            queued[key] = cat
+
+    if queued:
+        # loading a sprite folder converts its spritesheets, which needs the display, so that isn't
+        # left to the workers. The same goes for the placeholder drawn when a sprite fails.
+        sprites.load_species({cat.species for cat in queued.values()})
+        image_cache.load_image("sprites/error_placeholder.png")
+
+    with _sprite_cache_lock:
+        for key, cat in queued.items():
+            if key in _sprite_cache or key in _pending_sprites:
+                continue
+            _pending_sprites[key] = _get_sprite_executor().submit(
+                _composite_sprite, cat, key, flags
+            )
+    return keys
+
+
+def render_sprites(cats: Iterable, size: Tuple[int, int], **flags) -> List[pygame.Surface]:
+    """
+    Returns the sprites of several cats at once, scaled to size and premultiplied, ready to be given to
+    UISpriteButton with prescaled=True. Cats which look the same share one sprite, and sprites which
+    aren't cached are composited on worker threads together.
+
+    :param cats: The cats to draw
+    :param size: The size to draw them at, in screen pixels
+    :param flags: The same optional arguments as generate_sprite()
+    :return: One surface per cat, in the same order. They are shared, so don't draw on them.
+    """
+    cats = list(cats)
+    keys = _queue_sprites(cats, flags)
+    with _sprite_cache_lock:
+        pending = {
+            key: _pending_sprites[key] for key in set(keys) if key in _pending_sprites
+        }
+    wait(pending.values())
+
+    size = tuple(size)
+    smooth = (
+        size[1] <= ui_scale_value(sprites.size)
+        or size[0] <= ui_scale_value(sprites.size)
+    ) and not game.settings["no sprite antialiasing"]
+    rendered = []
+    # a sprite composited for this call is one miss, however many cats share it
+    missed = set()
+    for cat, key in zip(cats, keys):
+        if key is None:
+            rendered.append(_scale_sprite(cat.sprite, size, smooth))
+            continue
+
+        scaled_key = (key, size, smooth)
+        with _sprite_cache_lock:
+            if key in pending and key not in missed:
+                missed.add(key)
+                _sprite_cache_stats["misses"] += 1
+            else:
+                _sprite_cache_stats["hits"] += 1
+            scaled = _scaled_sprite_cache.get(scaled_key)
+            if scaled is not None:
+                _scaled_sprite_cache.move_to_end(scaled_key)
+                if key in _sprite_cache:
+                    _sprite_cache.move_to_end(key)
+                rendered.append(scaled)
+                continue
+
+        # scales the cached sprite. If the worker threw it away because the cat changed while it was
+        # drawn, it is composited here instead, so the key is worked out again.
+        scaled = _scale_sprite(_lookup_sprite(cat, flags, count=False), size, smooth)
+        scaled_key = (get_appearance_key(cat, **flags), size, smooth)
+        with _sprite_cache_lock:
+            _scaled_sprite_cache[scaled_key] = scaled
+            while len(_scaled_sprite_cache) > SCALED_SPRITE_CACHE_SIZE:
+                _scaled_sprite_cache.popitem(last=False)
+        rendered.append(scaled)
+
+    return rendered
+
+
+def prefetch_sprites(cats: Iterable, **flags):
+    """
+    Starts compositing the sprites of several cats on the worker threads, without waiting for them,
+    so that they are already cached when they are needed.
+    :param cats: The cats to draw
+    :param flags: The same optional arguments as generate_sprite()
+    """
+    _queue_sprites(list(cats), flags)
+
+
+def prefetch_adjacent_pages(pages: List[list], current_page: int, **flags):
+    """
+    Starts compositing the sprites on the pages either side of the one being shown, so that
+    paging through a list of cats doesn't have to wait for them.
+    :param pages: The cats of a list, split into pages
+    :param current_page: The index in pages of the page being shown
+    :param flags: The same optional arguments as generate_sprite()
+    """
+    prefetch_sprites(
+        (
+            cat
+            for page in (current_page + 1, current_page - 1)
+            if 0 <= page < len(pages)
+            for cat in pages[page]
+        ),
+        **flags,
+    )
+
+
+def _scale_sprite(sprite: pygame.Surface, size: Tuple[int, int], smooth: bool):
+    sprite = sprite.premul_alpha()
+    if smooth:
+        return pygame.transform.smoothscale(sprite, size)
+    return pygame.transform.scale(sprite, size)
+
+
+def clear_sprite_cache():
+    """Empties the sprite cache. Needed if the spritesheets themselves are reloaded."""
+    with _sprite_cache_lock:
+        _sprite_cache.clear()
+        _scaled_sprite_cache.clear()
+        _sprite_cache_stats["hits"] = 0
+        _sprite_cache_stats["misses"] = 0
+
+
+def get_sprite_cache_info() -> dict:
+    """Returns the current size and hit/miss counters of the sprite cache."""
+    return {
+        "size": len(_sprite_cache),
+        "max_size": SPRITE_CACHE_SIZE,
+        "scaled": len(_scaled_sprite_cache),
+        "scaled_max_size": SCALED_SPRITE_CACHE_SIZE,
+        "pending": len(_pending_sprites),
+        "hits": _sprite_cache_stats["hits"],
+        "misses": _sprite_cache_stats["misses"],
+    }
+
+
 def clan_symbol_sprite(clan, return_string=False, force_light=False):
     """
     returns the clan symbol for the given clan_name, if no symbol exists then random symbol is chosen
@@ -2666,43 +2920,13 @@ def generate_sprite(
                     If false, use the cat.not_working() to determine the no_working art.
     """
 
-    if life_state is not None:
-        age = life_state
-    else:
-        age = cat.age.value
-
     if always_living:
         dead = False
     else:
         dead = cat.dead
 
     # setting the cat_sprite (bc this makes things much easier)
-    if (
-            not no_not_working
-            and cat.not_working()
-            and age != "newborn"
-            and game.config["cat_sprites"]["sick_sprites"]
-    ):
-        if age in ["kitten", "adolescent"]:
-            cat_sprite = str(19)
-        else:
-            cat_sprite = str(18)
-    elif cat.pelt.paralyzed and age != "newborn":
-        if age in ["kitten", "adolescent"]:
-            cat_sprite = str(17)
-        else:
-            if cat.pelt.length == "long":
-                cat_sprite = str(16)
-            else:
-                cat_sprite = str(15)
-    else:
-        if age == "elder" and not game.config["fun"]["all_cats_are_newborn"]:
-            age = "senior"
-
-        if game.config["fun"]["all_cats_are_newborn"]:
-            cat_sprite = str(cat.pelt.cat_sprites["newborn"])
-        else:
-            cat_sprite = str(cat.pelt.cat_sprites[age])
+    cat_sprite = _get_sprite_pose(cat, life_state, no_not_working)
 
     new_sprite = pygame.Surface(
         (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
@@ -2711,7 +2935,8 @@ def generate_sprite(
     # generating the sprite
     try:
         # checks index of cat's species in the species list and uses matching folder's sprites
-        n = (list(game.species["species"]).index(cat.species)) + 1 #add 1 because people don't count from 0 smh
+        n = sprites.get_species_folder(cat.species)
+        sprites.load_folders((n,))
 
         if cat.pelt.name not in ["Tortie", "Calico"]:
             new_sprite.blit(
@@ -2753,14 +2978,14 @@ def generate_sprite(
             # Multiply with alpha does not work as you would expect - it just lowers the alpha of the
             # entire surface. To get around this, we first blit the tint onto a white background to dull it,
             # then blit the surface onto the sprite with pygame.BLEND_RGB_MULT
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+            tint = pygame.Surface((sprites.size, sprites.size), pygame.SRCALPHA)
             tint.fill(tuple(sprites.cat_tints["tint_colours"][cat.pelt.tint]))
             new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
         if (
                 cat.pelt.tint != "none"
                 and cat.pelt.tint in sprites.cat_tints["dilute_tint_colours"]
         ):
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+            tint = pygame.Surface((sprites.size, sprites.size), pygame.SRCALPHA)
             tint.fill(tuple(sprites.cat_tints["dilute_tint_colours"][cat.pelt.tint]))
             new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
 
@@ -2776,7 +3001,7 @@ def generate_sprite(
                     and cat.pelt.white_patches_tint
                     in sprites.white_patches_tints["tint_colours"]
             ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+                tint = pygame.Surface((sprites.size, sprites.size), pygame.SRCALPHA)
                 tint.fill(
                     tuple(
                         sprites.white_patches_tints["tint_colours"][
@@ -2797,7 +3022,7 @@ def generate_sprite(
                     and cat.pelt.white_patches_tint
                     in sprites.white_patches_tints["tint_colours"]
             ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+                tint = pygame.Surface((sprites.size, sprites.size), pygame.SRCALPHA)
                 tint.fill(
                     tuple(
                         sprites.white_patches_tints["tint_colours"][
@@ -2884,24 +3109,10 @@ def generate_sprite(
                             )
 
         # Apply fading fog
-        if (
-                cat.pelt.opacity <= 97
-                and not cat.prevent_fading
-                and game.clan.clan_settings["fading"]
-                and dead
-        ):
-            stage = "0"
-            if 80 >= cat.pelt.opacity > 45:
-                # Stage 1
-                stage = "1"
-            elif cat.pelt.opacity <= 45:
-                # Stage 2
-                stage = "2"
-
-            new_sprite.blit(
-                sprites.sprites["fademask" + f'{n}_' + stage + cat_sprite],
-                (0, 0),
-                special_flags=pygame.BLEND_RGBA_MULT,
+        stage = _get_fade_stage(cat, dead)
+        if stage is not None:
+            apply_fade_mask(
+                new_sprite, sprites.sprites["fademask" + f'{n}_' + stage + cat_sprite]
             )
 
             if cat.df:
@@ -2920,21 +3131,72 @@ def generate_sprite(
     except (TypeError, KeyError):
         logger.exception("Failed to load sprite")
 
-        # Placeholder image
-        new_sprite = image_cache.load_image(
-            f"sprites/error_placeholder.png"
-        ).convert_alpha()
+        # Placeholder image. It is loaded before the sprites are queued, as loading it needs the display.
+        new_sprite = image_cache.load_image(f"sprites/error_placeholder.png").copy()
 
     return new_sprite
 
 
-def apply_opacity(surface, opacity):
-    for x in range(surface.get_width()):
-        for y in range(surface.get_height()):
-            pixel = list(surface.get_at((x, y)))
-            pixel[3] = int(pixel[3] * opacity / 100)
-            surface.set_at((x, y), tuple(pixel))
-    return surface
+def _get_sprite_pose(cat, life_state=None, no_not_working=False) -> str:
+    """
+    Determines which pose a cat is drawn in.
+    :return: the pose index, as a string
+    """
+    if life_state is not None:
+        age = life_state
+    else:
+        age = cat.age.value
+
+    if (
+            not no_not_working
+            and cat.not_working()
+            and age != "newborn"
+            and game.config["cat_sprites"]["sick_sprites"]
+    ):
+        if age in ["kitten", "adolescent"]:
+            cat_sprite = str(19)
+        else:
+            cat_sprite = str(18)
+    elif cat.pelt.paralyzed and age != "newborn":
+        if age in ["kitten", "adolescent"]:
+            cat_sprite = str(17)
+        else:
+            if cat.pelt.length == "long":
+                cat_sprite = str(16)
+            else:
+                cat_sprite = str(15)
+    else:
+        if age == "elder" and not game.config["fun"]["all_cats_are_newborn"]:
+            age = "senior"
+
+        if game.config["fun"]["all_cats_are_newborn"]:
+            cat_sprite = str(cat.pelt.cat_sprites["newborn"])
+        else:
+            cat_sprite = str(cat.pelt.cat_sprites[age])
+
+    return cat_sprite
+
+
+def _get_fade_stage(cat, dead):
+    """
+    Returns which fading fog stage ("0", "1" or "2") should be drawn over a cat, or None if they aren't fading.
+    """
+    if not (
+            dead
+            and cat.pelt.opacity <= 97
+            and not cat.prevent_fading
+            and game.clan
+            and game.clan.clan_settings["fading"]
+    ):
+        return None
+
+    if 80 >= cat.pelt.opacity > 45:
+        # Stage 1
+        return "1"
+    elif cat.pelt.opacity <= 45:
+        # Stage 2
+        return "2"
+    return "0"
 
 
 # ---------------------------------------------------------------------------- #
@@ -2982,6 +3244,8 @@ def quit(savesettings=False, clearevents=False):
     """
     if savesettings:
         game.save_settings(None)
+    # don't lose a save that is still being written
+    game.save_queue.wait()
     if clearevents:
         game.cur_events_list.clear()
     game.rpc.close_rpc.set()
@@ -0,0 +1,64 @@
+"""
+Weighted random picks without repeating items by their weight.
+
+Instead of building a list where an item of weight 20 shows up 20 times and calling random.choice on
+it, items are added once together with their weight. A pick draws a number below the total weight and
+finds the item it falls on with a binary search of the running totals.
+"""
+
+import random
+from bisect import bisect_right
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class WeightedSampler(Generic[T]):
+    """Picks items at random, in proportion to their weights."""
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        weights: Optional[Iterable[float]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        :param items: The items to pick from
+        :param weights: The weight of each item, all items have a weight of 1 if not given
+        :param rng: A random.Random to draw from, for repeatable picks. By default, the random module is used.
+        """
+        self.items: List[T] = []
+        self.cum_weights: List[float] = []
+        self.rng = rng if rng is not None else random
+
+        items = list(items)
+        weights = [1] * len(items) if weights is None else weights
+        for item, weight in zip(items, weights):
+            self.add(item, weight)
+
+    def add(self, item: T, weight: float = 1):
+        """Adds an item. Items with a weight of 0 or less can never be picked, so they are left out."""
+        if weight <= 0:
+            return
+        self.items.append(item)
+        self.cum_weights.append(self.total + weight)
+
+    @property
+    def total(self) -> float:
+        return self.cum_weights[-1] if self.cum_weights else 0
+
+    def choice(self) -> T:
+        """Returns a random item. Like random.choice, raises IndexError if there is nothing to pick."""
+        if not self.items:
+            raise IndexError("Cannot choose from an empty WeightedSampler")
+        index = bisect_right(self.cum_weights, self.rng.random() * self.total)
+        return self.items[min(index, len(self.items) - 1)]
+
+    def weight_of(self, index: int) -> float:
+        return self.cum_weights[index] - (self.cum_weights[index - 1] if index else 0)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
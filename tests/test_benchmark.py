@@ -0,0 +1,58 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.benchmark.clan_generator import get_living_count
+from scripts.benchmark.results import compare_results, measure, new_results
+
+
+def make_results(**medians):
+    results = new_results()
+    results["results"]["100"] = {
+        name: {"min": median, "median": median, "mean": median, "max": median, "repeat": 1}
+        for name, median in medians.items()
+    }
+    return results
+
+
+class TestMeasure(unittest.TestCase):
+    def test_calls(self):
+        calls = []
+        timing = measure(lambda: calls.append(1), warmup=2, repeat=3)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(timing["repeat"], 3)
+        self.assertLessEqual(timing["min"], timing["median"])
+        self.assertLessEqual(timing["median"], timing["max"])
+
+
+class TestCompareResults(unittest.TestCase):
+    def test_regression(self):
+        lines, regressed = compare_results(
+            make_results(a=1.5, b=1.0), make_results(a=1.0, b=1.0)
+        )
+        self.assertTrue(regressed)
+        self.assertIn("SLOWER", lines[0])
+        self.assertIn("same", lines[1])
+
+    def test_within_tolerance(self):
+        _, regressed = compare_results(
+            make_results(a=1.05), make_results(a=1.0), tolerance=0.1
+        )
+        self.assertFalse(regressed)
+
+    def test_faster_and_missing(self):
+        lines, regressed = compare_results(
+            make_results(a=0.5, b=1.0), make_results(a=1.0)
+        )
+        self.assertFalse(regressed)
+        self.assertIn("faster", lines[0])
+        self.assertIn("not in the baseline", lines[1])
+
+
+class TestClanGenerator(unittest.TestCase):
+    def test_living_count(self):
+        self.assertEqual(get_living_count(20), 20)
+        self.assertLess(get_living_count(5000), 5000)
+        self.assertGreaterEqual(get_living_count(5000), 40)
@@ -8,6 +8,8 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
 from scripts.cat.enums import CatAgeEnum
+from scripts.cat.thoughts import Thoughts
+from scripts.cat_relations.family_graph import family_graph
 from scripts.cat_relations.relationship import Relationship
 
 class TestCreationAge(unittest.TestCase):
@@ -63,6 +65,20 @@ class TestRelativesFunction(unittest.TestCase):
         self.assertTrue(kit2.is_sibling(kit1))
         self.assertTrue(kit1.is_sibling(kit2))
 
+    # test that is_littermate works on loaded cats, whose inheritance is only made when it is first needed
+    def test_is_littermate_loaded(self):
+        parent = Cat(loading_cat=True)
+        kit1 = Cat(parent1=parent.ID, moons=3, loading_cat=True)
+        kit2 = Cat(parent1=parent.ID, moons=3, loading_cat=True)
+        older_kit = Cat(parent1=parent.ID, moons=10, loading_cat=True)
+        self.assertIsNone(kit1.inheritance)
+
+        self.assertTrue(kit1.is_littermate(kit2))
+        self.assertFalse(kit1.is_littermate(older_kit))
+        self.assertTrue(
+            Thoughts.thought_fulfill_rel_constraints(kit2, kit1, ["littermates"])
+        )
+
     # test that is_uncle_aunt returns True for a uncle/aunt-cat relationship and False otherwise
     def test_is_uncle_aunt(self):
         grand_parent = Cat()
@@ -421,3 +437,77 @@ class TestUpdateMentor(unittest.TestCase):
         self.assertFalse(app.ID in mentor.apprentice)
         self.assertTrue(app.ID in mentor.former_apprentices)
         self.assertIsNone(app.mentor)
+
+
+class TestCatIndex(unittest.TestCase):
+    def test_new_cat_is_living(self):
+        cat = Cat(status="warrior")
+        self.assertIn(cat, Cat.index.get_cats())
+        self.assertIn(cat, Cat.index.get_cats(status=["warrior"]))
+
+    def test_dead_cat_moves(self):
+        cat = Cat(status="warrior")
+        cat.dead = True
+        self.assertNotIn(cat, Cat.index.get_cats())
+        self.assertIn(cat, Cat.index.get_cats("dead"))
+
+    def test_outside_cat_moves(self):
+        cat = Cat(status="warrior")
+        cat.outside = True
+        self.assertNotIn(cat, Cat.index.get_cats())
+        self.assertIn(cat, Cat.index.get_cats("outside"))
+
+    def test_status_and_age_change(self):
+        cat = Cat(status="apprentice", moons=11)
+        cat.status = "warrior"
+        cat.moons = 12
+        self.assertNotIn(cat, Cat.index.get_cats(status=["apprentice"]))
+        self.assertIn(
+            cat,
+            Cat.index.get_cats(status=["warrior"], age=[CatAgeEnum.YOUNG_ADULT]),
+        )
+
+    def test_exclude(self):
+        cat = Cat(status="warrior")
+        self.assertNotIn(cat, Cat.index.get_cats(exclude=cat))
+
+    def test_copy_is_not_indexed(self):
+        cat = Cat(status="warrior")
+        copy_cat = deepcopy(cat)
+        copy_cat.dead = True
+        self.assertIn(cat, Cat.index.get_cats())
+
+
+class TestFamilyGraph(unittest.TestCase):
+    def test_children(self):
+        parent = Cat()
+        kit = Cat(parent1=parent.ID)
+        adopted = Cat(adoptive_parents=[parent.ID])
+        self.assertEqual(family_graph.get_children([parent.ID]), {kit.ID, adopted.ID})
+
+    def test_mates_both_ways(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.set_mate(cat2)
+        self.assertIn(cat2.ID, family_graph.get_mates(cat1.ID))
+        cat1.unset_mate(cat2)
+        # previous mates are still listed
+        self.assertIn(cat1.ID, family_graph.get_mates(cat2.ID))
+
+    def test_cousins_and_grand_kits(self):
+        grand_parent = Cat()
+        parent1 = Cat(parent1=grand_parent.ID)
+        parent2 = Cat(parent1=grand_parent.ID)
+        kit1 = Cat(parent1=parent1.ID)
+        kit2 = Cat(parent1=parent2.ID)
+        self.assertTrue(kit1.is_cousin(kit2))
+        self.assertTrue(grand_parent.is_grandparent(kit2))
+        self.assertIn(kit2.ID, parent1.get_relatives())
+
+    def test_new_adoptive_parent(self):
+        parent = Cat()
+        kit = Cat()
+        self.assertFalse(parent.is_parent(kit))
+        kit.set_adoptive_parent(parent)
+        parent.create_inheritance_new_cat()
+        self.assertTrue(parent.is_parent(kit))
@@ -0,0 +1,121 @@
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.events_module.generate_events import (
+    GenerateEvents,
+    get_resource_directory,
+)
+from scripts.events_module.ongoing.ongoing_event import OngoingEvent
+from scripts.game_structure.game_essentials import game
+
+
+class TestShortEventBuckets(unittest.TestCase):
+    def setUp(self):
+        self.clan = SimpleNamespace(
+            biome="Forest",
+            camp_bg="camp1",
+            current_season="Leaf-bare",
+            BIOME_TYPES=["Forest"],
+        )
+        GenerateEvents.clear_loaded_events()
+
+    def test_bucket_only_has_fitting_events(self):
+        with patch.object(game, "clan", self.clan):
+            bucket = GenerateEvents.possible_short_events("misc", [])
+            all_events = GenerateEvents.possible_short_events("misc")
+
+        self.assertTrue(bucket)
+        self.assertLess(len(bucket), len(all_events))
+        for event in bucket:
+            self.assertEqual(event.sub_type, [])
+            self.assertTrue(
+                "any" in event.season or "leaf-bare" in event.season, event.event_id
+            )
+
+    def test_bucket_is_reused(self):
+        with patch.object(game, "clan", self.clan):
+            bucket = GenerateEvents.possible_short_events("misc", [])
+            self.assertIs(GenerateEvents.possible_short_events("misc", []), bucket)
+
+            self.clan.current_season = "Newleaf"
+            self.assertIsNot(GenerateEvents.possible_short_events("misc", []), bucket)
+
+
+class TestLoadedEvents(unittest.TestCase):
+    def setUp(self):
+        self.clan = SimpleNamespace(
+            biome="Forest",
+            camp_bg="camp1",
+            current_season="Leaf-bare",
+            BIOME_TYPES=["Forest", "Beach"],
+        )
+        GenerateEvents.clear_loaded_events()
+
+    def test_events_are_kept_until_biome_changes(self):
+        with patch.object(game, "clan", self.clan):
+            events = GenerateEvents.generate_short_events("misc", "forest")
+            GenerateEvents.possible_short_events("misc")
+            self.assertIs(GenerateEvents.generate_short_events("misc", "forest"), events)
+
+            self.clan.biome = "Beach"
+            GenerateEvents.possible_short_events("misc")
+            self.assertIsNot(
+                GenerateEvents.generate_short_events("misc", "forest"), events
+            )
+
+    def test_budget_drops_least_recently_used(self):
+        with patch.dict(
+            game.config["event_generation"], {"loaded_events_budget": 3}
+        ):
+            GenerateEvents.store_loaded_events("a.json", [1, 2])
+            GenerateEvents.store_loaded_events("b.json", [3])
+            GenerateEvents.get_loaded_events("a.json")
+            GenerateEvents.store_loaded_events("c.json", [4])
+
+        self.assertIsNone(GenerateEvents.get_loaded_events("b.json"))
+        self.assertEqual(GenerateEvents.get_loaded_events("a.json"), [1, 2])
+        self.assertEqual(GenerateEvents.get_loaded_events_info()["events"], 3)
+
+    def test_budget_drops_buckets(self):
+        with patch.object(game, "clan", self.clan):
+            GenerateEvents.possible_short_events("misc", [])
+            GenerateEvents.possible_short_events("new_cat", [])
+            self.assertEqual(GenerateEvents.get_loaded_events_info()["buckets"], 2)
+
+            # keeps only the new_cat files
+            new_cat_files = {
+                path: GenerateEvents.get_loaded_events(path)
+                for path in ("new_cat/forest.json", "new_cat/general.json")
+            }
+            with patch.dict(
+                game.config["event_generation"],
+                {"loaded_events_budget": sum(map(len, new_cat_files.values()))},
+            ):
+                for path, events in new_cat_files.items():
+                    GenerateEvents.store_loaded_events(path, events)
+
+        self.assertEqual(
+            [key[1] for key in GenerateEvents.short_event_buckets], ["new_cat"]
+        )
+
+    def test_ongoing_events_are_copies(self):
+        file_path = f"{get_resource_directory()}/disasters/forest.json"
+        GenerateEvents.store_loaded_events(
+            file_path, [OngoingEvent(event="flood", current_duration=0)]
+        )
+
+        events = GenerateEvents.generate_ongoing_events("disasters", "forest")
+        events[0].current_duration += 1
+        again = GenerateEvents.generate_ongoing_events("disasters", "forest")
+
+        self.assertIsNot(again[0], events[0])
+        self.assertEqual(again[0].current_duration, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,9 @@ from scripts.game_structure.localization import (
     get_new_pronouns,
     determine_plural_pronouns,
     set_lang_config_directory,
+    load_lang_resource,
+    clear_lang_resource_cache,
+    get_lang_resource_cache_info,
 )
 from scripts.utility import event_text_adjust
 
@@ -98,3 +101,29 @@ class TestLocalisation(unittest.TestCase):
                     ),
                     value[1]["subject"],
                 )
+
+
+class TestLangResourceCache(unittest.TestCase):
+    def setUp(self):
+        clear_lang_resource_cache()
+
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+
+    def test_resource_is_loaded_once(self):
+        before = get_lang_resource_cache_info()
+        first = load_lang_resource("pronouns.{lang}.json")
+        second = load_lang_resource("./pronouns.{lang}.json")
+        after = get_lang_resource_cache_info()
+
+        self.assertIs(first, second)
+        self.assertEqual(after["misses"] - before["misses"], 1)
+        self.assertEqual(after["hits"] - before["hits"], 1)
+
+    def test_locale_change_clears_cache(self):
+        first = load_lang_resource("pronouns.{lang}.json")
+        i18n.config.set("locale", "xx")
+        load_lang_resource("pronouns.{lang}.json")
+        i18n.config.set("locale", "en")
+
+        self.assertIsNot(first, load_lang_resource("pronouns.{lang}.json"))
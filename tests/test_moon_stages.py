@@ -0,0 +1,55 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.events_module.moon_stages import MoonStage, CatMoonStage, MoonTimings
+
+
+class TestMoonStages(unittest.TestCase):
+    def test_stage_counts_calls(self):
+        calls = []
+        stage = MoonStage("test", lambda: calls.append(1))
+
+        self.assertFalse(stage.run())
+        self.assertFalse(stage.run())
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(stage.moon_calls, 2)
+        self.assertEqual(stage.total_calls, 2)
+
+    def test_stage_ends_moon_early(self):
+        stage = MoonStage("test", lambda: True)
+        self.assertTrue(stage.run())
+
+    def test_cat_stage_counts_cats(self):
+        handled = []
+        stage = CatMoonStage("cats", handled.append, lambda: ["a", "b", "c"])
+
+        stage.run()
+
+        self.assertEqual(handled, ["a", "b", "c"])
+        self.assertEqual(stage.moon_calls, 3)
+        self.assertEqual(stage.total_calls, 3)
+
+    def test_timings_reset_per_moon(self):
+        stage = CatMoonStage("cats", lambda cat: None, lambda: ["a", "b"])
+        timings = MoonTimings([stage])
+
+        for _ in range(2):
+            timings.start_moon()
+            stage.run()
+            timings.finish_moon()
+
+        self.assertEqual(timings.moons, 2)
+        self.assertEqual(stage.moon_calls, 2)
+        self.assertEqual(stage.total_calls, 4)
+
+        timings.reset()
+        self.assertEqual(timings.moons, 0)
+        self.assertEqual(stage.total_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.events_module.patrol.patrol import Patrol
+from scripts.events_module.patrol.patrol_catalog import PatrolCatalog
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
+
+
+class TestPatrolCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = PatrolCatalog()
+
+    def test_patrols_are_built_once(self):
+        patrols = self.catalog.get_file("forest/hunting/any.json")
+        self.assertTrue(patrols)
+        self.assertIs(self.catalog.get_file("forest/hunting/any.json"), patrols)
+        self.assertEqual(self.catalog.stats, {"hits": 1, "misses": 1})
+
+    def test_patrols_fit_location_and_size(self):
+        patrols = self.catalog.get_patrols(
+            "general/border.json", "forest", "camp1", "newleaf", 2
+        )
+        self.assertTrue(patrols)
+        for patrol in patrols:
+            self.assertTrue("forest" in patrol.biome or "any" in patrol.biome)
+            self.assertTrue("newleaf" in patrol.season or "any" in patrol.season)
+            self.assertTrue(patrol.min_cats <= 2 <= patrol.max_cats)
+
+        self.assertIs(
+            self.catalog.get_patrols(
+                "general/border.json", "forest", "camp1", "newleaf", 2
+            ),
+            patrols,
+        )
+
+
+class TestPatrolEventCopy(unittest.TestCase):
+    def test_copy_has_own_outcomes(self):
+        outcome = PatrolOutcome(
+            text="test", relationship_effects=[{"cats_to": ["p_l"], "log": "test"}]
+        )
+        outcome.stat_cat = "stat cat"
+        patrol = PatrolEvent("test", success_outcomes=[outcome])
+
+        copied = patrol.copy()
+        copied.success_outcomes[0].relationship_effects[0]["log"] = "changed"
+
+        self.assertIsNot(copied.success_outcomes[0], outcome)
+        self.assertIsNone(copied.success_outcomes[0].stat_cat)
+        self.assertEqual(outcome.relationship_effects[0]["log"], "test")
+
+
+class TestPatrolFilter(unittest.TestCase):
+    def setUp(self):
+        Patrol.used_patrols.clear()
+        self.patrol = Patrol()
+        self.patrol.add_patrol_cats(
+            [Cat(status="warrior"), Cat(status="warrior")], Clan(name="test")
+        )
+
+    def tearDown(self):
+        Patrol.used_patrols.clear()
+
+    def test_status_limits_are_checked_on_creation(self):
+        patrol = PatrolEvent(
+            "test", min_max_status={"warrior": [1, 6], "apprentice": [1]}
+        )
+        self.assertEqual(patrol.min_max_status, {"warrior": [1, 6]})
+
+    def test_used_and_status_limited_patrols_are_skipped(self):
+        used = PatrolEvent("used", types=["border"])
+        no_warriors = PatrolEvent(
+            "no_warriors", types=["border"], min_max_status={"warrior": [-1, 0]}
+        )
+        fitting = PatrolEvent(
+            "fitting", types=["border"], min_max_status={"warrior": [1, 6]}
+        )
+        Patrol.used_patrols["used"] = None
+
+        filtered, romantic = self.patrol._filter_patrols(
+            [used, no_warriors, fitting], "forest", "camp1", "newleaf", "border"
+        )
+        self.assertEqual(filtered, [fitting])
+        self.assertEqual(romantic, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
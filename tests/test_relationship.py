@@ -0,0 +1,88 @@
+import os
+import unittest
+from copy import deepcopy
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations.relationship_store import relationship_store
+
+
+class TestRelationshipStore(unittest.TestCase):
+    def setUp(self):
+        self.cat1 = Cat()
+        self.cat2 = Cat()
+
+    def test_values_are_clamped(self):
+        rel = Relationship(self.cat1, self.cat2, romantic_love=150, dislike=-20)
+        self.assertEqual(rel.romantic_love, 100)
+        self.assertEqual(rel.dislike, 0)
+
+        rel.trust += 30
+        rel.trust -= 10
+        self.assertEqual(rel.trust, 20)
+
+    def test_flags(self):
+        rel = Relationship(self.cat1, self.cat2, mates=True)
+        self.assertTrue(rel.mates)
+        self.assertFalse(rel.family)
+
+        rel.family = True
+        rel.mates = False
+        self.assertFalse(rel.mates)
+        self.assertTrue(rel.family)
+
+    def test_log_is_lazy(self):
+        rel = Relationship(self.cat1, self.cat2)
+        self.assertFalse(rel.has_log)
+        rel.log.append("test")
+        self.assertTrue(rel.has_log)
+        self.assertEqual(rel.log, ["test"])
+
+    def test_copy_has_own_values(self):
+        rel = Relationship(self.cat1, self.cat2, platonic_like=40, family=True)
+        copied = deepcopy(rel)
+        rel.platonic_like = 10
+
+        self.assertEqual(copied.platonic_like, 40)
+        self.assertTrue(copied.family)
+
+    def test_rows_are_reused(self):
+        rel = Relationship(self.cat1, self.cat2)
+        rows = len(relationship_store.flags)
+        del rel
+        rel = Relationship(self.cat1, self.cat2)
+        self.assertEqual(len(relationship_store.flags), rows)
+        self.assertEqual(rel.romantic_love, 0)
+
+    def test_dirty_tracking(self):
+        rel = Relationship(self.cat1, self.cat2, trust=10)
+        self.assertTrue(rel.dirty)
+
+        rel.mark_saved()
+        rel.trust = 10
+        rel.mates = False
+        self.assertFalse(rel.dirty)
+
+        rel.trust += 5
+        self.assertTrue(rel.dirty)
+
+        rel.mark_saved()
+        rel.log.append("test")
+        self.assertTrue(rel.dirty)
+
+    def test_cat_relationships_changed(self):
+        self.cat1.relationships[self.cat2.ID] = Relationship(self.cat1, self.cat2)
+        self.assertTrue(self.cat1.relationships_changed())
+
+        self.cat1.mark_relationships_saved()
+        self.assertFalse(self.cat1.relationships_changed())
+
+        self.cat1.relationships.pop(self.cat2.ID)
+        self.assertTrue(self.cat1.relationships_changed())
+
+
+if __name__ == "__main__":
+    unittest.main()
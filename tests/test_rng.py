@@ -0,0 +1,45 @@
+import os
+import random
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.game_structure import rng
+
+
+class TestMoonSeeds(unittest.TestCase):
+    def draw(self):
+        return [random.randint(0, 1000) for _ in range(10)]
+
+    def test_same_moon_same_numbers(self):
+        rng.seed_moon(1234, 20)
+        first = self.draw()
+        random.random()
+        rng.seed_moon(1234, 20)
+        self.assertEqual(self.draw(), first)
+
+    def test_moons_and_clans_differ(self):
+        rng.seed_moon(1234, 20)
+        first = self.draw()
+        rng.seed_moon(1234, 21)
+        self.assertNotEqual(self.draw(), first)
+        rng.seed_moon(4321, 20)
+        self.assertNotEqual(self.draw(), first)
+
+    def test_no_seed_leaves_generator_alone(self):
+        random.seed(5)
+        state = random.getstate()
+        rng.seed_moon(None, 20)
+        self.assertEqual(random.getstate(), state)
+
+    def test_new_seed_leaves_generator_alone(self):
+        random.seed(5)
+        state = random.getstate()
+        seed = rng.new_seed()
+        self.assertEqual(random.getstate(), state)
+        self.assertTrue(0 <= seed <= rng.MAX_SEED)
+
+
+if __name__ == "__main__":
+    unittest.main()
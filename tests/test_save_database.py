@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.game_structure.game_essentials import Game
+from scripts.game_structure.save_database import SaveDatabase
+from scripts.game_structure.save_queue import SaveBatch, collect_save
+
+
+class TestSaveDatabase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "clan_save.db")
+        self.database = SaveDatabase(self.path)
+
+    def tearDown(self):
+        self.database.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        self.database.save(
+            {"cats": {"2": {"ID": "2"}, "1": {"ID": "1"}}},
+            {"events": [{"text": "test"}]},
+        )
+        self.database.close()
+
+        self.database = SaveDatabase(self.path)
+        # Rows come back in the order they were saved in
+        self.assertEqual(self.database.read_all("cats"), [{"ID": "2"}, {"ID": "1"}])
+        self.assertEqual(self.database.read("cats", "1"), {"ID": "1"})
+        self.assertIsNone(self.database.read("cats", "3"))
+        self.assertEqual(self.database.read_document("events"), [{"text": "test"}])
+
+    def test_only_changed_rows_are_written(self):
+        self.database.save({"conditions": {"1": {"injuries": {}}, "2": {}}})
+        self.assertEqual(self.database.rows_written, 2)
+
+        self.database.save({"conditions": {"1": {"injuries": {}}, "2": {"a": 1}}})
+        self.assertEqual(self.database.rows_written, 3)
+
+    def test_row_added_ahead(self):
+        self.database.save({"cats": {"a": 1, "b": 2, "c": 3}})
+        self.database.save({"cats": {"z": 0, "a": 1, "b": 2, "c": 3}})
+        self.assertEqual(self.database.read_all("cats"), [0, 1, 2, 3])
+
+        self.database.save({"cats": {"a": 1, "c": 3}})
+        self.database.close()
+        self.database = SaveDatabase(self.path)
+        self.assertEqual(self.database.read_all("cats"), [1, 3])
+        self.database.save({"cats": {"b": 2, "a": 1, "c": 3}})
+        self.assertEqual(self.database.read_all("cats"), [2, 1, 3])
+
+    def test_missing_rows_are_removed(self):
+        self.database.save({"conditions": {"1": {}, "2": {}}})
+        self.database.save({"conditions": {"1": {}}})
+
+        self.assertEqual(list(self.database.keys("conditions")), ["1"])
+
+    def test_partial_tables_keep_missing_rows(self):
+        self.database.save({"history": {"1": {}, "2": {}}})
+        self.database.save({"history": {"1": {"a": 1}}}, partial_tables=("history",))
+
+        self.assertEqual(sorted(self.database.keys("history")), ["1", "2"])
+        self.assertEqual(self.database.read("history", "1"), {"a": 1})
+
+    def test_collected_save(self):
+        """A save being collected only writes to the database when the batch runs, as it was when collected."""
+        cat = {"ID": "1", "moons": 1}
+        batch = SaveBatch()
+        with collect_save(batch):
+            Game._save_to_database(self.database, {"cats": {"1": cat}})
+        cat["moons"] = 2
+        self.assertIsNone(self.database.read("cats", "1"))
+
+        batch.run(Game.safe_save)
+        self.assertEqual(self.database.read("cats", "1"), {"ID": "1", "moons": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
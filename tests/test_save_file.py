@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import ujson
+
+from scripts.game_structure import save_file
+from scripts.game_structure.game_essentials import Game
+from scripts.game_structure.save_file import (
+    MANIFEST_NAME,
+    CorruptSaveFileError,
+    deferred_directory_sync,
+    load_save_file,
+    read_save_text,
+    remove_temp_files,
+    write_save_file,
+)
+
+
+class TestSaveFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.directory.name, "cats")
+        self.path = os.path.join(self.folder, "clan_cats.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_raw(self):
+        with open(self.path, "r", encoding="utf-8") as read_file:
+            return read_file.read()
+
+    def write_raw(self, text, keep_modified=False):
+        stat = os.stat(self.path)
+        with open(self.path, "w", encoding="utf-8") as write_file:
+            write_file.write(text)
+        if keep_modified:
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def test_round_trip(self):
+        data = [{"ID": "1", "name_prefix": "Fire"}, {"ID": "2", "dead": True}]
+        Game.safe_save(self.path, data)
+        self.assertEqual(load_save_file(self.path), data)
+
+    def test_plain_json(self):
+        """The checksums are kept in the manifest, so the files stay plain JSON."""
+        Game.safe_save(self.path, {"a": [1, 2]})
+        self.assertEqual(ujson.loads(self.read_raw()), {"a": [1, 2]})
+        self.assertEqual(self.read_raw(), '{"a":[1,2]}')
+        self.assertIn("clan_cats.json", load_save_file(os.path.join(self.folder, MANIFEST_NAME)))
+
+        Game.safe_save(self.path, {"a": [1, 2]}, pretty=True)
+        self.assertIn("\n    ", self.read_raw())
+        self.assertEqual(load_save_file(self.path), {"a": [1, 2]})
+
+    def test_damaged_file(self):
+        Game.safe_save(self.path, {"lives": 9})
+        # same size and modification time, different contents
+        self.write_raw(self.read_raw().replace("9", "1"), keep_modified=True)
+        with self.assertRaises(CorruptSaveFileError):
+            load_save_file(self.path)
+
+    def test_edited_file(self):
+        """Files changed by something else, like a save editor, load without a check."""
+        Game.safe_save(self.path, {"lives": 9})
+        self.write_raw('{"lives": 1}')
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(load_save_file(self.path), {"lives": 1})
+
+    def test_without_manifest(self):
+        os.makedirs(self.folder)
+        with open(self.path, "w", encoding="utf-8") as write_file:
+            write_file.write('{\n    "a": 1\n}')
+        self.assertEqual(load_save_file(self.path), {"a": 1})
+
+    def test_text_files(self):
+        path = os.path.join(self.directory.name, "currentclan.txt")
+        Game.safe_save(path, "Thunder")
+        with open(path, "r", encoding="utf-8") as read_file:
+            self.assertEqual(read_file.read(), "Thunder")
+        self.assertEqual(read_save_text(path), "Thunder")
+
+    def test_failed_write_keeps_old_file(self):
+        Game.safe_save(self.path, {"moons": 1})
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                Game.safe_save(self.path, {"moons": 2})
+        self.assertEqual(load_save_file(self.path), {"moons": 1})
+        self.assertEqual(
+            sorted(os.listdir(self.folder)), [MANIFEST_NAME, "clan_cats.json"]
+        )
+
+    @unittest.skipIf(os.name == "nt", "only the read-only flag can be set on Windows")
+    def test_permissions(self):
+        umask = os.umask(0)
+        os.umask(umask)
+        Game.safe_save(self.path, {"moons": 1})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o666 & ~umask)
+
+        os.chmod(self.path, 0o640)
+        Game.safe_save(self.path, {"moons": 2})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    def test_remove_temp_files(self):
+        Game.safe_save(self.path, {"moons": 1})
+        for folder in (self.directory.name, self.folder):
+            with open(os.path.join(folder, ".clan_cats.json.x1.tmp"), "w") as write_file:
+                write_file.write("{")
+
+        remove_temp_files(self.directory.name, recursive=False)
+        self.assertIn(".clan_cats.json.x1.tmp", os.listdir(self.folder))
+        remove_temp_files(self.directory.name)
+        self.assertEqual(
+            sorted(os.listdir(self.folder)), [MANIFEST_NAME, "clan_cats.json"]
+        )
+        self.assertEqual(os.listdir(self.directory.name), ["cats"])
+
+    def test_directory_finished_once(self):
+        with mock.patch.object(save_file, "sync_directory") as sync_directory:
+            with deferred_directory_sync():
+                for number in range(5):
+                    write_save_file(self.path, str(number))
+                sync_directory.assert_not_called()
+                self.assertNotIn(MANIFEST_NAME, os.listdir(self.folder))
+                # checked against the checksums not written to the manifest yet
+                self.assertEqual(load_save_file(self.path), 4)
+        sync_directory.assert_called_once_with(os.path.normpath(self.folder))
+        self.assertEqual(load_save_file(self.path), 4)
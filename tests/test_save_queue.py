@@ -0,0 +1,118 @@
+import os
+import tempfile
+import threading
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.game_structure.game_essentials import Game
+from scripts.game_structure.save_file import MANIFEST_NAME, load_save_file
+from scripts.game_structure.save_queue import SaveBatch, SaveQueue, collect_save
+
+
+class TestCollectSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "file.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_safe_save_is_collected(self):
+        batch = SaveBatch()
+        with collect_save(batch):
+            Game.safe_save(self.path, {"a": 1})
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(batch.get_written_paths(), [self.path])
+
+        batch.run(Game.safe_save)
+        self.assertEqual(load_save_file(self.path), {"a": 1})
+
+    def test_snapshot(self):
+        """Changes made after the save is collected aren't written."""
+        data = {"cats": [1, 2]}
+        batch = SaveBatch()
+        with collect_save(batch):
+            Game.safe_save(self.path, data)
+        data["cats"].append(3)
+
+        batch.run(Game.safe_save)
+        self.assertEqual(load_save_file(self.path), {"cats": [1, 2]})
+
+    def test_only_this_thread(self):
+        batch = SaveBatch()
+        with collect_save(batch):
+            thread = threading.Thread(target=Game.safe_save, args=(self.path, "text"))
+            thread.start()
+            thread.join()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(len(batch), 0)
+
+    def test_nested_none_writes(self):
+        batch = SaveBatch()
+        with collect_save(batch):
+            with collect_save(None):
+                Game.safe_save(self.path, "text")
+            Game.remove_save_file(self.path)
+        self.assertTrue(os.path.exists(self.path))
+
+        batch.run(Game.safe_save)
+        self.assertFalse(os.path.exists(self.path))
+
+
+class TestSaveQueue(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = SaveQueue()
+
+    def tearDown(self):
+        self.queue.wait()
+        self.directory.cleanup()
+
+    def get_path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_in_order(self):
+        release = threading.Event()
+        written = []
+
+        def slow_write(path, data):
+            release.wait(5)
+            written.append(data)
+
+        for number in range(3):
+            batch = SaveBatch()
+            batch.write(self.get_path("file"), str(number))
+            self.queue.submit(batch, slow_write)
+        self.assertTrue(self.queue.is_saving())
+
+        release.set()
+        self.queue.wait()
+        self.assertEqual(written, ["0", "1", "2"])
+        self.assertFalse(self.queue.is_saving())
+        self.assertEqual(self.queue.get_progress(), 1)
+
+    def test_prune(self):
+        for name in ("keep", "remove"):
+            Game.safe_save(self.get_path(name), "text")
+        batch = SaveBatch()
+        batch.prune(self.directory.name, {"keep"})
+        self.queue.submit(batch, Game.safe_save).result()
+        # the manifest of the checksums isn't a save file, so it is kept
+        self.assertEqual(sorted(os.listdir(self.directory.name)), [MANIFEST_NAME, "keep"])
+
+    def test_error(self):
+        def failing_write(path, data):
+            raise OSError("disk full")
+
+        batch = SaveBatch()
+        batch.write(self.get_path("file"), "text")
+        future = self.queue.submit(batch, failing_write)
+        self.queue.wait()
+
+        self.assertIsInstance(future.exception(), OSError)
+        errors = self.queue.pop_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertIn("disk full", errors[0])
+        self.assertEqual(self.queue.pop_errors(), [])
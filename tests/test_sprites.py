@@ -0,0 +1,129 @@
+import itertools
+import os
+import unittest
+from unittest import mock
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprites import Sprites, sprites
+from scripts.game_structure.game_essentials import game
+from scripts.utility import (
+    clear_sprite_cache,
+    get_appearance_key,
+    get_sprite_cache_info,
+    prefetch_adjacent_pages,
+    render_sprites,
+    _pending_sprites,
+    _sprite_cache,
+)
+
+
+class TestLazySpeciesLoading(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.sprites = Sprites()
+        self.sprites.load_all()
+        self.species = list(game.species["species"])
+
+    def test_folders_load_on_demand(self):
+        self.assertEqual(self.sprites.loaded_folders, set())
+        self.assertNotIn("lines1_0", self.sprites.sprites)
+
+        self.sprites.load_species([self.species[0]])
+        self.assertEqual(self.sprites.loaded_folders, {"1"})
+        self.assertIn("lines1_0", self.sprites.sprites)
+        self.assertNotIn("lines2_0", self.sprites.sprites)
+
+    def test_preload_in_background(self):
+        self.sprites.preload_species([self.species[1], "not a species"]).join()
+        # only decoded in the background, converting is left to whoever draws the cat
+        self.assertEqual(self.sprites.loaded_folders, set())
+        self.assertIn("sprites/2/lineart.png", self.sprites._decoded_sheets)
+
+        self.sprites.load_species([self.species[1]])
+        self.assertEqual(self.sprites.loaded_folders, {"2"})
+        self.assertEqual(self.sprites._decoded_sheets, {})
+        self.assertEqual(self.sprites.get_species_folder(self.species[1]), "2")
+
+    def test_load_waits_for_preload(self):
+        self.sprites.preload_species([self.species[0]])
+        self.sprites.load_species([self.species[0]])
+        self.assertEqual(self.sprites.loaded_folders, {"1"})
+        self.assertEqual(self.sprites._decoded_sheets, {})
+
+
+class TestRenderSprites(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        sprites.load_all()
+
+    def setUp(self):
+        clear_sprite_cache()
+
+    def test_same_appearance_is_drawn_once(self):
+        cat = Cat(moons=20)
+        twin = Cat(moons=20)
+        twin.pelt = cat.pelt
+        twin.species = cat.species
+        other = Cat(moons=2)
+
+        rendered = render_sprites([cat, twin, other], (100, 100))
+
+        self.assertEqual(len(rendered), 3)
+        self.assertIs(rendered[0], rendered[1])
+        self.assertEqual(rendered[2].get_size(), (100, 100))
+        self.assertEqual(get_appearance_key(cat), get_appearance_key(twin))
+        self.assertNotEqual(get_appearance_key(cat), get_appearance_key(other))
+        self.assertEqual(get_sprite_cache_info()["size"], 2)
+        self.assertEqual(get_sprite_cache_info()["misses"], 2)
+        self.assertEqual(get_sprite_cache_info()["hits"], 1)
+
+        render_sprites([cat, other], (100, 100))
+        self.assertEqual(get_sprite_cache_info()["misses"], 2)
+        self.assertEqual(get_sprite_cache_info()["hits"], 3)
+
+    def test_changed_while_drawn(self):
+        """A sprite thrown away by the worker is drawn again, but only counts as one miss."""
+        cat = Cat(moons=20)
+        # the key is different every time, as if the cat changed while it was being drawn
+        keys = itertools.count()
+        with mock.patch(
+            "scripts.utility.get_appearance_key",
+            side_effect=lambda c, **flags: (c.ID, next(keys)),
+        ):
+            rendered = render_sprites([cat], (50, 50))
+
+        self.assertEqual(rendered[0].get_size(), (50, 50))
+        self.assertEqual(get_sprite_cache_info()["size"], 1)
+        self.assertEqual(get_sprite_cache_info()["misses"], 1)
+        self.assertEqual(get_sprite_cache_info()["hits"], 0)
+
+    def test_matches_the_cat_sprite(self):
+        cat = Cat(moons=20)
+        expected = pygame.transform.scale(cat.sprite.premul_alpha(), (50, 50))
+        rendered = render_sprites([cat], (50, 50))[0]
+        self.assertEqual(
+            pygame.image.tobytes(rendered, "RGBA"),
+            pygame.image.tobytes(expected, "RGBA"),
+        )
+
+    def test_prefetch_adjacent_pages(self):
+        pages = [[Cat(moons=20)], [Cat(moons=30)], [Cat(moons=40)], [Cat(moons=50)]]
+        prefetch_adjacent_pages(pages, 1)
+        for future in list(_pending_sprites.values()):
+            future.result()
+
+        self.assertIn(get_appearance_key(pages[0][0]), _sprite_cache)
+        self.assertIn(get_appearance_key(pages[2][0]), _sprite_cache)
+        self.assertNotIn(get_appearance_key(pages[3][0]), _sprite_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.cat.spritesheet_cache import SpritesheetCache
+
+
+class TestSpritesheetCache(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.png = os.path.join(self.temp_dir.name, "sheet.png")
+        sheet = pygame.Surface((4, 2), pygame.SRCALPHA)
+        sheet.fill((10, 20, 30, 40))
+        pygame.image.save(sheet, self.png)
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_sheets_are_reused(self):
+        SpritesheetCache(self.cache_dir).load_spritesheets([self.png])
+
+        cache = SpritesheetCache(self.cache_dir)
+        sheet = cache.load_spritesheets([self.png])[self.png]
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 0})
+        self.assertEqual(sheet.get_size(), (4, 2))
+        self.assertEqual(tuple(sheet.get_at((3, 1))), (10, 20, 30, 40))
+
+    def test_drawing_on_a_cached_sheet(self):
+        SpritesheetCache(self.cache_dir).load_spritesheets([self.png])
+        cache = SpritesheetCache(self.cache_dir)
+        sheet = cache.load_spritesheets([self.png])[self.png]
+
+        sheet.subsurface((0, 0, 2, 2)).fill((255, 0, 0, 255))
+        self.assertEqual(tuple(sheet.get_at((1, 1))), (255, 0, 0, 255))
+
+        # the file itself is untouched
+        sheet = SpritesheetCache(self.cache_dir).load_spritesheets([self.png])[self.png]
+        self.assertEqual(tuple(sheet.get_at((1, 1))), (10, 20, 30, 40))
+
+    def test_uncached(self):
+        cache = SpritesheetCache(self.cache_dir)
+        self.assertEqual(cache.get_uncached([self.png]), [self.png])
+        cache.load_spritesheets([self.png])
+        self.assertEqual(cache.get_uncached([self.png]), [])
+
+        os.utime(self.png, ns=(0, 0))
+        self.assertEqual(cache.get_uncached([self.png]), [self.png])
+
+    def test_changed_png_is_decoded_again(self):
+        SpritesheetCache(self.cache_dir).load_spritesheets([self.png])
+        sheet = pygame.Surface((2, 2), pygame.SRCALPHA)
+        sheet.fill((1, 2, 3, 4))
+        pygame.image.save(sheet, self.png)
+        os.utime(self.png, ns=(0, 0))
+
+        cache = SpritesheetCache(self.cache_dir)
+        sheet = cache.load_spritesheets([self.png])[self.png]
+        self.assertEqual(cache.stats, {"hits": 0, "misses": 1})
+        self.assertEqual(tuple(sheet.get_at((1, 1))), (1, 2, 3, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
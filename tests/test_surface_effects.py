@@ -0,0 +1,53 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.ui.surface_effects import (
+    apply_fade_mask,
+    apply_opacity,
+    feather_surface,
+    make_fade_mask,
+)
+
+
+class TestSurfaceEffects(unittest.TestCase):
+    def test_feather_surface(self):
+        surface = pygame.Surface((40, 30), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 255))
+        feather_surface(surface, 8)
+
+        width, height = surface.get_size()
+        for x in range(width):
+            for y in range(height):
+                distance = min(x, y, width - x - 1, height - y - 1)
+                if distance < 8:
+                    expected = (0, 0, 0, int(255 * (distance / 8)))
+                else:
+                    expected = (10, 20, 30, 255)
+                self.assertEqual(tuple(surface.get_at((x, y))), expected, (x, y))
+
+    def test_feather_wider_than_surface(self):
+        surface = pygame.Surface((5, 4), pygame.SRCALPHA)
+        feather_surface(surface, 10)
+        self.assertEqual(surface.get_at((2, 2)).a, int(255 * 1 / 10))
+
+    def test_apply_opacity(self):
+        surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 200))
+        apply_opacity(surface, 50)
+        self.assertEqual(tuple(surface.get_at((1, 1))), (10, 20, 30, 100))
+
+    def test_fade_mask(self):
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 255))
+        apply_fade_mask(surface, make_fade_mask((10, 10), 2))
+        self.assertEqual(surface.get_at((0, 0)).a, 0)
+        self.assertEqual(tuple(surface.get_at((5, 5))), (10, 20, 30, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -139,3 +139,33 @@ class TestFamilyThoughts(unittest.TestCase):
         # when
 
         # then
+
+
+class TestThoughtPools(unittest.TestCase):
+    def test_pool_is_reused(self):
+        location = "thoughts/alive/warrior.json"
+        pool = Thoughts.get_thought_pool(location, "warrior", "forest", "Newleaf", "camp2")
+        self.assertIs(
+            pool,
+            Thoughts.get_thought_pool(location, "warrior", "forest", "Newleaf", "camp2"),
+        )
+
+    def test_pool_is_rebuilt_after_clear(self):
+        location = "thoughts/alive/warrior.json"
+        pool = Thoughts.get_thought_pool(location, "warrior", "forest", "Newleaf", "camp2")
+        Thoughts.clear_thought_pools()
+        rebuilt = Thoughts.get_thought_pool(
+            location, "warrior", "forest", "Newleaf", "camp2"
+        )
+        self.assertIsNot(pool, rebuilt)
+        self.assertEqual(pool, rebuilt)
+
+    def test_pool_respects_clan_constraints(self):
+        pool = Thoughts.get_thought_pool(
+            "thoughts/alive/general.json", "warrior", "forest", "Newleaf", "camp2"
+        )
+        for thought in pool:
+            self.assertIn("forest", thought.get("biome", ["forest"]))
+            self.assertIn("Newleaf", thought.get("season", ["Newleaf"]))
+            statuses = thought.get("main_status_constraint", ["warrior"])
+            self.assertTrue("warrior" in statuses or "any" in statuses)
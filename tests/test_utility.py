@@ -1,5 +1,6 @@
 import os
 import unittest
+from copy import deepcopy
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
@@ -10,7 +11,8 @@ from scripts.utility import (
     get_highest_romantic_relation,
     get_personality_compatibility,
     get_amount_of_cats_with_relation_value_towards,
-    get_alive_clan_queens
+    get_alive_clan_queens,
+    get_appearance_key,
 )
 
 class TestPersonalityCompatibility(unittest.TestCase):
@@ -336,3 +338,31 @@ class TestGetQueens(unittest.TestCase):
         # then
         living_cats = [self.test_cat1, self.test_cat2, self.test_cat3, self.test_cat4, self.test_cat5, self.test_cat6]
         self.assertEqual([self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys()))
+
+
+class TestAppearanceKey(unittest.TestCase):
+    def setUp(self):
+        self.test_cat = Cat(moons=40)
+        self.twin = Cat(moons=40, species=self.test_cat.species)
+        self.twin.pelt = deepcopy(self.test_cat.pelt)
+
+    def test_same_appearance_same_key(self):
+        self.assertEqual(get_appearance_key(self.test_cat), get_appearance_key(self.twin))
+
+    def test_pelt_change_changes_key(self):
+        old_key = get_appearance_key(self.test_cat)
+        self.test_cat.pelt.scars = self.test_cat.pelt.scars + ["ONE"]
+        self.assertNotEqual(old_key, get_appearance_key(self.test_cat))
+
+    def test_death_changes_key(self):
+        old_key = get_appearance_key(self.test_cat)
+        self.test_cat.dead = True
+        self.assertNotEqual(old_key, get_appearance_key(self.test_cat))
+        self.assertEqual(old_key, get_appearance_key(self.test_cat, always_living=True))
+
+    def test_hidden_scars_ignore_scars(self):
+        self.test_cat.pelt.scars = ["ONE"]
+        self.assertEqual(
+            get_appearance_key(self.test_cat, scars_hidden=True),
+            get_appearance_key(self.twin, scars_hidden=True),
+        )
@@ -0,0 +1,49 @@
+import os
+import random
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.weighted_sampler import WeightedSampler
+
+
+class TestWeightedSampler(unittest.TestCase):
+    def test_empty_sampler_raises(self):
+        with self.assertRaises(IndexError):
+            WeightedSampler().choice()
+
+    def test_zero_weight_is_never_picked(self):
+        sampler = WeightedSampler(["a", "b"], [0, 5])
+        self.assertEqual(len(sampler), 1)
+        for _ in range(50):
+            self.assertEqual(sampler.choice(), "b")
+
+    def test_picks_follow_weights(self):
+        sampler = WeightedSampler(["a", "b"], [1, 3], rng=random.Random(1))
+        picks = [sampler.choice() for _ in range(4000)]
+        self.assertAlmostEqual(picks.count("b") / len(picks), 0.75, delta=0.03)
+
+    def test_seeded_picks_repeat(self):
+        sampler1 = WeightedSampler(range(10), range(1, 11), rng=random.Random(7))
+        sampler2 = WeightedSampler(range(10), range(1, 11), rng=random.Random(7))
+        self.assertEqual(
+            [sampler1.choice() for _ in range(20)],
+            [sampler2.choice() for _ in range(20)],
+        )
+
+        # without an rng, seeding the random module is enough
+        sampler = WeightedSampler(range(10), range(1, 11))
+        random.seed(3)
+        picks = [sampler.choice() for _ in range(20)]
+        random.seed(3)
+        self.assertEqual([sampler.choice() for _ in range(20)], picks)
+
+    def test_weight_of(self):
+        sampler = WeightedSampler(["a", "b", "c"], [2, 0, 3])
+        self.assertEqual(list(sampler), ["a", "c"])
+        self.assertEqual(sampler.weight_of(1), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Compares the surface effects in scripts/ui/surface_effects.py with the per-pixel versions they replaced.
+
+Run from the repository root:
+    python utils/benchmark_surface_effects.py [screen scale]
+
+The default screen scale of 3 is what a 4K display gets, and is the largest the game normally uses.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from scripts.ui.surface_effects import apply_opacity, feather_surface
+
+
+def apply_opacity_per_pixel(surface, opacity):
+    for x in range(surface.get_width()):
+        for y in range(surface.get_height()):
+            pixel = list(surface.get_at((x, y)))
+            pixel[3] = int(pixel[3] * opacity / 100)
+            surface.set_at((x, y), tuple(pixel))
+    return surface
+
+
+def feather_surface_per_pixel(surface, feather_width):
+    width, height = surface.get_size()
+    for x in range(width):
+        for y in range(height):
+            distance = min(x, y, width - x - 1, height - y - 1)
+            if distance < feather_width:
+                alpha = int(255 * (distance / feather_width))
+                surface.set_at((x, y), (0, 0, 0, alpha))
+
+
+def time_call(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(scale: float = 3):
+    pygame.init()
+    # the dropshadow box in screens_core, which is the game screen plus a 15px border on each side
+    size = (int((800 + 30) * scale), int((700 + 30) * scale))
+    print(f"Surface size at screen scale {scale}: {size[0]}x{size[1]}")
+
+    for name, old, new, args in (
+        ("feather_surface", feather_surface_per_pixel, feather_surface, (int(15 * scale),)),
+        ("apply_opacity", apply_opacity_per_pixel, apply_opacity, (50,)),
+    ):
+        old_surface = pygame.Surface(size, pygame.SRCALPHA)
+        new_surface = pygame.Surface(size, pygame.SRCALPHA)
+        old_surface.fill((100, 150, 200, 200))
+        new_surface.fill((100, 150, 200, 200))
+
+        old_time = time_call(old, old_surface, *args)
+        new_time = time_call(new, new_surface, *args)
+        print(
+            f"{name}: per pixel {old_time * 1000:.1f} ms, "
+            f"whole surface {new_time * 1000:.2f} ms ({old_time / new_time:.0f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3)